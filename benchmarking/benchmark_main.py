@@ -1,6 +1,12 @@
 import itertools
+import json
 import logging
+import multiprocessing
+import os
+import time
+import traceback
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 import numpy as np
 from tqdm import tqdm
@@ -13,11 +19,131 @@ from benchmarking.benchmarks import (
     benchmark_definitions,
 )
 from syne_tune.backend.simulator_backend.simulator_callback import SimulatorCallback
+from syne_tune.blackbox_repository.blackbox import Blackbox
 from syne_tune.blackbox_repository.simulated_tabular_backend import (
     BlackboxRepositoryBackend,
+    UserBlackboxBackend,
 )
 from syne_tune.stopping_criterion import StoppingCriterion
 from syne_tune.tuner import Tuner
+from syne_tune.util import experiment_path, name_from_base
+
+# Written to the folder of an experiment once it has finished successfully.
+# Note that results are also written if an experiment fails or is interrupted
+COMPLETED_MARKER_FILENAME = "completed"
+
+# Blackboxes of the benchmarks to be run. They are loaded before worker
+# processes are forked, so that all workers share them (read-only)
+_blackboxes = dict()
+
+
+def tuner_name(method: str, seed: int, benchmark_name: str) -> str:
+    # we set a convenient name for tuner to retrieve results easily
+    return f"results/{method}-{seed}-{benchmark_name}".replace("_", "-")
+
+
+def load_blackbox(benchmark_name: str) -> Blackbox:
+    benchmark = benchmark_definitions[benchmark_name]
+    return BlackboxRepositoryBackend(
+        elapsed_time_attr=benchmark.elapsed_time_attr,
+        blackbox_name=benchmark.blackbox_name,
+        dataset=benchmark.dataset_name,
+        surrogate=benchmark.surrogate,
+        surrogate_kwargs=benchmark.surrogate_kwargs,
+        # Objectives are shared with other processes via the page cache
+        mmap_mode="r",
+    ).blackbox
+
+
+def run_experiment(
+    method: str,
+    seed: int,
+    benchmark_name: str,
+    max_num_evaluations=None,
+    n_workers: int = 4,
+) -> str:
+    np.random.seed(seed)
+    benchmark = benchmark_definitions[benchmark_name]
+
+    print(f"Starting experiment ({method}/{benchmark_name}/{seed})")
+
+    blackbox = _blackboxes.get(benchmark_name)
+    if blackbox is None:
+        blackbox = load_blackbox(benchmark_name)
+    backend = UserBlackboxBackend(
+        blackbox=blackbox,
+        elapsed_time_attr=benchmark.elapsed_time_attr,
+    )
+
+    # todo move into benchmark definition
+    max_t = max(backend.blackbox.fidelity_values)
+    time_attr = next(iter(backend.blackbox.fidelity_space.keys()))
+
+    # 5 candidates initially to be evaluated
+    num_random_candidates = 5
+    random_state = np.random.RandomState(seed)
+    points_to_evaluate = [
+        {
+            k: v.sample(random_state=random_state) if hasattr(v, "sample") else v
+            for k, v in backend.blackbox.configuration_space.items()
+        }
+        for _ in range(num_random_candidates)
+    ]
+    scheduler = methods[method](
+        MethodArguments(
+            config_space=backend.blackbox.configuration_space,
+            metric=benchmark.metric,
+            mode=benchmark.mode,
+            random_seed=seed,
+            max_t=max_t,
+            time_attr=time_attr,
+            num_brackets=1,
+            use_surrogates="lcbench" in benchmark_name,
+            points_to_evaluate=points_to_evaluate,
+        )
+    )
+
+    stop_criterion = StoppingCriterion(
+        max_wallclock_time=benchmark.max_wallclock_time,
+        max_num_evaluations=max_num_evaluations
+        if max_num_evaluations
+        else benchmark.max_num_evaluations,
+    )
+    tuner = Tuner(
+        trial_backend=backend,
+        scheduler=scheduler,
+        stop_criterion=stop_criterion,
+        n_workers=n_workers,
+        sleep_time=0,
+        callbacks=[SimulatorCallback()],
+        results_update_interval=600,
+        print_update_interval=30,
+        tuner_name=tuner_name(method, seed, benchmark_name),
+        save_tuner=False,
+        suffix_tuner_name=False,
+        metadata={
+            "seed": seed,
+            "algorithm": method,
+            "benchmark": benchmark_name,
+        },
+    )
+    tuner.run()
+    (tuner.tuner_path / COMPLETED_MARKER_FILENAME).touch()
+    return tuner.name
+
+
+def _timed_experiment(*args) -> float:
+    start_time = time.perf_counter()
+    run_experiment(*args)
+    return time.perf_counter() - start_time
+
+
+def default_num_processes() -> int:
+    # CPUs available to this process, which can be fewer than on the machine
+    # (e.g., in a Slurm job)
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count()
 
 
 def run(
@@ -26,87 +152,104 @@ def run(
     seeds,
     max_num_evaluations=None,
     n_workers: int = 4,
+    num_processes: int = 1,
+    skip_existing: bool = False,
 ):
+    """
+    Runs experiments for all combinations of methods, seeds and benchmarks.
+    If ``num_processes > 1``, they are run in a pool of this many worker
+    processes. Blackboxes are loaded once and shared with the workers, which
+    are forked. If ``skip_existing`` is set, combinations which have completed
+    successfully before are skipped, so that an interrupted sweep can be
+    resumed. A manifest with status and runtime of every combination is
+    written to the ``results`` folder.
+
+    :param num_processes: Number of worker processes. Pass ``None`` to use
+        all CPUs available. Defaults to 1, in which case experiments are run
+        one after the other in this process
+    :param skip_existing: Skip combinations which have completed before?
+        Defaults to ``False``
+    :return: Names of tuners whose results are available
+    """
     logging.getLogger("syne_tune.optimizer.schedulers").setLevel(logging.WARNING)
     logging.getLogger("syne_tune.backend").setLevel(logging.WARNING)
     logging.getLogger("syne_tune.backend.simulator_backend.simulator_backend").setLevel(
         logging.WARNING
     )
+    if num_processes is None:
+        num_processes = default_num_processes()
 
     combinations = list(itertools.product(method_names, seeds, benchmark_names))
+    manifest_path = experiment_path("results") / f"{name_from_base('manifest')}.json"
+    manifest = []
 
-    print(f"Going to evaluate: {combinations}")
-    exp_names = []
-    for method, seed, benchmark_name in tqdm(combinations):
-        np.random.seed(seed)
-        benchmark = benchmark_definitions[benchmark_name]
-
-        print(f"Starting experiment ({method}/{benchmark_name}/{seed})")
-
-        backend = BlackboxRepositoryBackend(
-            elapsed_time_attr=benchmark.elapsed_time_attr,
-            blackbox_name=benchmark.blackbox_name,
-            dataset=benchmark.dataset_name,
-            surrogate=benchmark.surrogate,
-            surrogate_kwargs=benchmark.surrogate_kwargs,
-        )
-
-        # todo move into benchmark definition
-        max_t = max(backend.blackbox.fidelity_values)
-        time_attr = next(iter(backend.blackbox.fidelity_space.keys()))
-
-        # 5 candidates initially to be evaluated
-        num_random_candidates = 5
-        random_state = np.random.RandomState(seed)
-        points_to_evaluate = [
+    def record(method, seed, benchmark_name, status, runtime=None, error=None):
+        manifest.append(
             {
-                k: v.sample(random_state=random_state) if hasattr(v, "sample") else v
-                for k, v in backend.blackbox.configuration_space.items()
-            }
-            for _ in range(num_random_candidates)
-        ]
-        scheduler = methods[method](
-            MethodArguments(
-                config_space=backend.blackbox.configuration_space,
-                metric=benchmark.metric,
-                mode=benchmark.mode,
-                random_seed=seed,
-                max_t=max_t,
-                time_attr=time_attr,
-                num_brackets=1,
-                use_surrogates="lcbench" in benchmark_name,
-                points_to_evaluate=points_to_evaluate,
-            )
-        )
-
-        stop_criterion = StoppingCriterion(
-            max_wallclock_time=benchmark.max_wallclock_time,
-            max_num_evaluations=max_num_evaluations
-            if max_num_evaluations
-            else benchmark.max_num_evaluations,
-        )
-        tuner = Tuner(
-            trial_backend=backend,
-            scheduler=scheduler,
-            stop_criterion=stop_criterion,
-            n_workers=n_workers,
-            sleep_time=0,
-            callbacks=[SimulatorCallback()],
-            results_update_interval=600,
-            print_update_interval=30,
-            # we set a convenient name for tuner to retrieve results easily
-            tuner_name=f"results/{method}-{seed}-{benchmark_name}".replace("_", "-"),
-            save_tuner=False,
-            suffix_tuner_name=False,
-            metadata={
+                "method": method,
                 "seed": seed,
-                "algorithm": method,
                 "benchmark": benchmark_name,
-            },
+                "tuner_name": tuner_name(method, seed, benchmark_name),
+                "status": status,
+                "runtime": runtime,
+                "error": error,
+            }
         )
-        tuner.run()
-        exp_names.append(tuner.name)
-    return exp_names
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+
+    todo = []
+    for method, seed, benchmark_name in combinations:
+        name = tuner_name(method, seed, benchmark_name)
+        if (
+            skip_existing
+            and (experiment_path(name) / COMPLETED_MARKER_FILENAME).exists()
+        ):
+            record(method, seed, benchmark_name, status="skipped")
+        else:
+            todo.append((method, seed, benchmark_name))
+    print(
+        f"Going to evaluate: {todo}\n"
+        f"Skipping {len(combinations) - len(todo)} combinations completed before"
+    )
+    for benchmark_name in sorted({combination[2] for combination in todo}):
+        _blackboxes[benchmark_name] = load_blackbox(benchmark_name)
+
+    def on_done(combination, runtime=None, error=None):
+        if error is None:
+            record(*combination, status="completed", runtime=runtime)
+        else:
+            print(f"Experiment {combination} failed:\n{error}")
+            record(*combination, status="failed", error=error)
+
+    if num_processes == 1:
+        for combination in tqdm(todo):
+            try:
+                runtime = _timed_experiment(
+                    *combination, max_num_evaluations, n_workers
+                )
+                on_done(combination, runtime=runtime)
+            except Exception:
+                on_done(combination, error=traceback.format_exc())
+    else:
+        # Forked workers share the blackboxes loaded above
+        with ProcessPoolExecutor(
+            max_workers=num_processes, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _timed_experiment, *combination, max_num_evaluations, n_workers
+                ): combination
+                for combination in todo
+            }
+            for future in tqdm(as_completed(futures), total=len(futures)):
+                try:
+                    on_done(futures[future], runtime=future.result())
+                except Exception:
+                    on_done(futures[future], error=traceback.format_exc())
+    print(f"Manifest written to {manifest_path}")
+    return [entry["tuner_name"] for entry in manifest if entry["status"] != "failed"]
 
 
 if __name__ == "__main__":
@@ -144,6 +287,19 @@ if __name__ == "__main__":
         type=int,
         default=4,
     )
+    parser.add_argument(
+        "--num_processes",
+        help="number of experiments to run in parallel, 0 to use all CPUs.",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "--skip_existing",
+        type=int,
+        required=False,
+        default=0,
+        help="If 1 skips experiments which have completed before, if 0 reruns them.",
+    )
 
     args, _ = parser.parse_known_args()
     if args.run_all_seeds:
@@ -161,4 +317,6 @@ if __name__ == "__main__":
         benchmark_names=benchmark_names,
         seeds=seeds,
         n_workers=args.n_workers,
+        num_processes=args.num_processes if args.num_processes > 0 else None,
+        skip_existing=bool(args.skip_existing),
     )
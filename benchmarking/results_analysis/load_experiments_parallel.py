@@ -10,13 +10,14 @@ from pyparfor import parfor
 from tqdm import tqdm
 
 from syne_tune.constants import ST_TUNER_TIME
+from syne_tune.experiments import load_results_dataframe
 from syne_tune.util import catchtime
 
 
 def load_result(name, metadata, path):
     usecols = [metadata["metric_names"][0], "st_tuner_time", "trial_id", "st_decision"]
     try:
-        return pd.read_csv(path / name / "results.csv.zip", usecols=usecols)
+        return load_results_dataframe(path / name, usecols=usecols)
     except Exception:
         return None
 
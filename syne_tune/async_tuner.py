@@ -0,0 +1,257 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+from syne_tune.backend.async_trial_backend import (
+    AsyncTrialBackend,
+    ThreadedTrialBackend,
+)
+from syne_tune.backend.trial_backend import (
+    TrialBackend,
+    TrialAndStatusInformation,
+    TrialIdAndResultList,
+)
+from syne_tune.backend.trial_status import TrialResult
+from syne_tune.optimizer.scheduler import TrialSuggestion
+from syne_tune.tuner import ConfigSpaceExhausted, Tuner
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTuner(Tuner):
+    """
+    Version of :class:`~syne_tune.Tuner` whose tuning loop runs on an
+    :mod:`asyncio` event loop, and which talks to the backend through the
+    :class:`~syne_tune.backend.async_trial_backend.AsyncTrialBackend`
+    interface. Scheduler and callbacks run on the event loop, while backend
+    operations may overlap with them:
+
+    * When several workers are free, the scheduler computes the next
+      suggestion while the backend is still starting the previous trial.
+    * Stop and pause decisions are sent to the backend without waiting for
+      them to be executed, so that status updates and callbacks proceed in
+      the meantime. All pending backend operations are awaited at the end of
+      each loop iteration, and before the tuner is saved.
+
+    If ``trial_backend`` is a synchronous
+    :class:`~syne_tune.backend.trial_backend.TrialBackend`, it is wrapped into
+    :class:`~syne_tune.backend.async_trial_backend.ThreadedTrialBackend`. All
+    other arguments are the same as for :class:`~syne_tune.Tuner`.
+
+    Use :meth:`run` as for :class:`~syne_tune.Tuner`, or await
+    :meth:`run_async` from within a running event loop.
+    """
+
+    def __init__(
+        self, trial_backend: TrialBackend | AsyncTrialBackend, *args, **kwargs
+    ):
+        super().__init__(trial_backend, *args, **kwargs)
+        if not isinstance(self.trial_backend, AsyncTrialBackend):
+            self.trial_backend = ThreadedTrialBackend(self.trial_backend)
+        self._pending_backend_ops = []
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        # Tasks cannot be serialized. ``save`` is only called once they are done
+        state["_pending_backend_ops"] = []
+        return state
+
+    def run(self):
+        """Launches the tuning."""
+        asyncio.run(self.run_async())
+
+    async def run_async(self):
+        """Launches the tuning, to be awaited in a running event loop."""
+        done_trials_statuses = OrderedDict()
+        try:
+            self._initialize_tuning()
+
+            running_trials_ids = set()
+            config_space_exhausted = False
+            stop_condition_reached = self._stop_condition()
+
+            while (
+                not stop_condition_reached
+                or self.wait_trial_completion_when_stopping
+                and len(running_trials_ids) > 0
+            ):
+                self._begin_iteration()
+                self._call_callbacks("on_loop_start")
+
+                new_done_trial_statuses, new_results = await self._process_new_results(
+                    running_trials_ids=running_trials_ids,
+                )
+
+                if new_results and self.save_tuner:
+                    await self._flush_backend_ops()
+                    self.tuner_saver(tuner=self)
+
+                # See comments in :meth:`Tuner.run` on why ``running_trials_ids``
+                # has to be updated here
+                done_trials_statuses.update(new_done_trial_statuses)
+                running_trials_ids.difference_update(new_done_trial_statuses.keys())
+                self._record_idle_workers(len(running_trials_ids))
+
+                if (
+                    config_space_exhausted
+                    or self.wait_trial_completion_when_stopping
+                    and stop_condition_reached
+                ):
+                    if len(running_trials_ids) > 0:
+                        self._log_waiting_for_running_trials(
+                            running_trials_ids, config_space_exhausted
+                        )
+                        await self._sleep()
+                    else:
+                        self._end_iteration()
+                        break
+                else:
+                    try:
+                        await self._schedule_new_tasks(
+                            running_trials_ids=running_trials_ids
+                        )
+                    except ConfigSpaceExhausted:
+                        self.output_logger.print_config_space_exhausted()
+                        config_space_exhausted = True
+                self._record_idle_workers(len(running_trials_ids))
+
+                self.status_printer(self.tuning_status)
+
+                self._call_callbacks("on_loop_end")
+
+                self._flush_journal()
+                await self._flush_backend_ops()
+                stop_condition_reached = self._stop_condition()
+                self._end_iteration()
+        except Exception as e:
+            self.output_logger.print_error(
+                "An error happened during the tuning, cleaning up resources before throwing the exception."
+            )
+            raise e
+        finally:
+            await self._flush_backend_ops()
+            self._finalize_tuning()
+            self.output_logger.print_stopping_trials()
+            await self.trial_backend.stop_all()
+            self.trial_backend.close()
+            self._finalize_after_stopping_trials(done_trials_statuses)
+
+    async def _sleep(self):
+        start_time = time.perf_counter()
+        with self._profiled("sleep"):
+            await self.trial_backend.wait_for_events(timeout=self.sleep_time)
+        sleep_time = time.perf_counter() - start_time
+        self._call_callbacks("on_tuning_sleep", sleep_time)
+
+    async def _flush_backend_ops(self):
+        """
+        Waits until all backend operations sent without waiting are done.
+        """
+        if self._pending_backend_ops:
+            pending_ops = self._pending_backend_ops
+            self._pending_backend_ops = []
+            await asyncio.gather(*pending_ops)
+
+    # Stop and pause are called from synchronous code. If the backend returns
+    # a coroutine (instead of a future of an operation already submitted), it
+    # starts running at the next ``await`` of the tuning loop
+    def _stop_trial(self, trial_id: int, result: dict[str, Any]):
+        self._pending_backend_ops.append(
+            asyncio.ensure_future(
+                self.trial_backend.stop_trial(trial_id=trial_id, result=result)
+            )
+        )
+
+    def _pause_trial(self, trial_id: int, result: dict[str, Any]):
+        self._pending_backend_ops.append(
+            asyncio.ensure_future(
+                self.trial_backend.pause_trial(trial_id=trial_id, result=result)
+            )
+        )
+
+    async def _process_new_results(
+        self, running_trials_ids: set[int]
+    ) -> (TrialAndStatusInformation, TrialIdAndResultList):
+        with self._profiled("fetch_status_results"):
+            (
+                trial_status_dict,
+                new_results,
+            ) = await self.trial_backend.fetch_status_results(
+                trial_ids=list(running_trials_ids)
+            )
+        return self._process_fetched_results(
+            running_trials_ids, trial_status_dict, new_results
+        )
+
+    async def _schedule_new_tasks(self, running_trials_ids: set[int]):
+        if self.start_jobs_without_delay:
+            busy_trial_ids = None
+        else:
+            # Pause and stop operations must be done before asking the backend
+            await self._flush_backend_ops()
+            busy_trial_ids = await self.trial_backend.busy_trial_ids()
+        num_free_workers, running_trials_ids = self._num_free_workers(
+            running_trials_ids, busy_trial_ids
+        )
+        if num_free_workers is None:
+            await self._sleep()
+        else:
+            # Suggestions for all free workers are obtained at once, and the
+            # backend starts trials in the order they are sent
+            launched = []
+            try:
+                while num_free_workers > 0:
+                    suggestions = self._next_suggestions(num_free_workers)
+                    for suggestion in suggestions:
+                        launched.append(self._launch_new_task(suggestion))
+                        # Lets the backend start on the trial before the
+                        # next suggestions are computed
+                        await asyncio.sleep(0)
+                    num_free_workers -= len(suggestions)
+            finally:
+                # Trials already sent to the backend are registered even if the
+                # configuration space got exhausted
+                for callback, task in launched:
+                    trial = await task
+                    callback(trial)
+                    self._register_scheduled_trial(trial, running_trials_ids)
+
+    def _launch_new_task(
+        self, suggestion: TrialSuggestion | None = None
+    ) -> tuple[Any, asyncio.Future]:
+        """
+        Sends a suggestion to the backend, without waiting for the trial to be
+        started or resumed.
+
+        :param suggestion: Suggestion to be launched. If not given, the next
+            suggestion is obtained from the scheduler
+        :return: ``(callback, task)``, where ``task`` returns the trial, and
+            ``callback`` is to be called with the trial once it is started
+        """
+        if suggestion is None:
+            suggestion = self._next_suggestion()
+        if suggestion.spawn_new_trial_id:
+            task = asyncio.ensure_future(
+                self.trial_backend.start_trial(
+                    config=suggestion.config.copy(),
+                    checkpoint_trial_id=suggestion.checkpoint_trial_id,
+                )
+            )
+
+            def callback(trial: TrialResult):
+                self._on_trial_started(trial, suggestion)
+
+        else:
+            self.output_logger.print_trial_resumed(
+                suggestion.checkpoint_trial_id, suggestion.config
+            )
+            task = asyncio.ensure_future(
+                self.trial_backend.resume_trial(
+                    trial_id=suggestion.checkpoint_trial_id,
+                    new_config=suggestion.config,
+                )
+            )
+            callback = self._on_trial_resumed
+        return callback, task
@@ -2,5 +2,6 @@ from syne_tune.backend.local_backend import LocalBackend  # noqa: F401
 from syne_tune.backend.python_backend.python_backend import (
     PythonBackend,
 )  # noqa: F401
+from syne_tune.backend.worker_pool_backend import WorkerPoolBackend  # noqa: F401
 
-__all__ = ["LocalBackend", "PythonBackend"]
+__all__ = ["LocalBackend", "PythonBackend", "WorkerPoolBackend"]
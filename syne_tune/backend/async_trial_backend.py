@@ -0,0 +1,275 @@
+import asyncio
+import functools
+import logging
+from collections.abc import Awaitable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from syne_tune.backend.trial_backend import (
+    TrialBackend,
+    TrialAndStatusInformation,
+    TrialIdAndResultList,
+)
+from syne_tune.backend.trial_status import TrialResult
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTrialBackend:
+    """
+    Asynchronous variant of the
+    :class:`~syne_tune.backend.trial_backend.TrialBackend` interface, used by
+    :class:`~syne_tune.async_tuner.AsyncTuner`. Operations which may block on
+    I/O (starting, stopping, pausing trials, fetching results, waiting) are
+    coroutines (or return awaitables), all other methods are the same as in
+    :class:`~syne_tune.backend.trial_backend.TrialBackend`. Implementations
+    should start an operation as soon as possible once it is called, since
+    :class:`~syne_tune.async_tuner.AsyncTuner` may await its result only later.
+
+    Synchronous backends are supported by wrapping them into
+    :class:`ThreadedTrialBackend`.
+    """
+
+    @property
+    def delete_checkpoints(self) -> bool:
+        raise NotImplementedError
+
+    async def start_trial(
+        self, config: dict[str, Any], checkpoint_trial_id: int | None = None
+    ) -> TrialResult:
+        """See :meth:`~syne_tune.backend.trial_backend.TrialBackend.start_trial`"""
+        raise NotImplementedError
+
+    async def resume_trial(
+        self, trial_id: int, new_config: dict | None = None
+    ) -> TrialResult:
+        """See :meth:`~syne_tune.backend.trial_backend.TrialBackend.resume_trial`"""
+        raise NotImplementedError
+
+    async def pause_trial(self, trial_id: int, result: dict | None = None):
+        """See :meth:`~syne_tune.backend.trial_backend.TrialBackend.pause_trial`"""
+        raise NotImplementedError
+
+    async def stop_trial(self, trial_id: int, result: dict | None = None):
+        """See :meth:`~syne_tune.backend.trial_backend.TrialBackend.stop_trial`"""
+        raise NotImplementedError
+
+    async def fetch_status_results(
+        self, trial_ids: list[int]
+    ) -> (TrialAndStatusInformation, TrialIdAndResultList):
+        """See
+        :meth:`~syne_tune.backend.trial_backend.TrialBackend.fetch_status_results`
+        """
+        raise NotImplementedError
+
+    async def busy_trial_ids(self) -> list[tuple[int, str]]:
+        """See :meth:`~syne_tune.backend.trial_backend.TrialBackend.busy_trial_ids`"""
+        raise NotImplementedError
+
+    def max_concurrent_trials(self) -> int | None:
+        """See
+        :meth:`~syne_tune.backend.trial_backend.TrialBackend.max_concurrent_trials`
+        """
+        return None
+
+    async def wait_for_events(self, timeout: float) -> bool:
+        """See
+        :meth:`~syne_tune.backend.trial_backend.TrialBackend.wait_for_events`
+        """
+        await asyncio.sleep(timeout)
+        return False
+
+    async def stop_all(self):
+        """See :meth:`~syne_tune.backend.trial_backend.TrialBackend.stop_all`"""
+        raise NotImplementedError
+
+    def new_trial_id(self) -> int:
+        raise NotImplementedError
+
+    def stdout(self, trial_id: int) -> list[str]:
+        raise NotImplementedError
+
+    def stderr(self, trial_id: int) -> list[str]:
+        raise NotImplementedError
+
+    def set_path(self, results_root: str | None = None, tuner_name: str | None = None):
+        pass
+
+    def set_metrics_spill(self, path: str | Path, max_metrics_in_memory: int):
+        raise NotImplementedError
+
+    def entrypoint_path(self) -> Path:
+        raise NotImplementedError
+
+    def set_entrypoint(self, entry_point: str):
+        raise NotImplementedError
+
+    def on_tuner_save(self):
+        pass
+
+    def close(self):
+        """
+        Releases resources held by the backend. Called by
+        :class:`~syne_tune.async_tuner.AsyncTuner` at the end of tuning.
+        """
+        pass
+
+
+class ThreadedTrialBackend(AsyncTrialBackend):
+    """
+    Adapter which turns a synchronous
+    :class:`~syne_tune.backend.trial_backend.TrialBackend` into an
+    :class:`AsyncTrialBackend`. Blocking methods are run in a worker thread,
+    so that the event loop (running scheduler and callbacks) is not blocked
+    while the backend does I/O. Since backends are not thread-safe, a single
+    worker thread is used, so calls are executed one at a time and in the order
+    they were made.
+
+    Asynchronous methods are submitted to the worker thread when they are
+    called, not when the result is awaited, so that the caller can continue
+    (e.g., compute the next suggestion) while the backend is busy. Synchronous
+    methods and attributes not defined here (which are looked up in the
+    wrapped backend) are run in the worker thread as well, blocking until
+    previously submitted calls are done.
+
+    :param trial_backend: Synchronous backend to be wrapped
+    """
+
+    def __init__(self, trial_backend: TrialBackend):
+        self.trial_backend = trial_backend
+        self._executor = None
+
+    def __getattr__(self, name: str):
+        # Guard against recursion if ``trial_backend`` is not set yet (e.g.,
+        # during unpickling)
+        if name in ("trial_backend", "_executor"):
+            raise AttributeError(name)
+        value = self._call(getattr, self.trial_backend, name)
+        if callable(value):
+
+            @functools.wraps(value)
+            def wrapper(*args, **kwargs):
+                return self._call(value, *args, **kwargs)
+
+            return wrapper
+        return value
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def _run(self, func, *args, **kwargs) -> asyncio.Future:
+        """
+        Submits ``func(*args, **kwargs)`` to the worker thread right away.
+
+        :return: Future to be awaited for the result
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="syne-tune-backend"
+            )
+        return asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def _call(self, func, *args, **kwargs):
+        """
+        Runs ``func(*args, **kwargs)`` in the worker thread and waits for the
+        result. If no worker thread is running, no backend operation can be in
+        flight, and ``func`` is called directly.
+        """
+        if self._executor is None:
+            return func(*args, **kwargs)
+        return self._executor.submit(func, *args, **kwargs).result()
+
+    @property
+    def delete_checkpoints(self) -> bool:
+        return self._call(getattr, self.trial_backend, "delete_checkpoints")
+
+    def start_trial(
+        self, config: dict[str, Any], checkpoint_trial_id: int | None = None
+    ) -> Awaitable[TrialResult]:
+        return self._run(
+            self.trial_backend.start_trial,
+            config=config,
+            checkpoint_trial_id=checkpoint_trial_id,
+        )
+
+    def resume_trial(
+        self, trial_id: int, new_config: dict | None = None
+    ) -> Awaitable[TrialResult]:
+        return self._run(
+            self.trial_backend.resume_trial, trial_id=trial_id, new_config=new_config
+        )
+
+    def pause_trial(self, trial_id: int, result: dict | None = None) -> Awaitable:
+        return self._run(
+            self.trial_backend.pause_trial, trial_id=trial_id, result=result
+        )
+
+    def stop_trial(self, trial_id: int, result: dict | None = None) -> Awaitable:
+        return self._run(
+            self.trial_backend.stop_trial, trial_id=trial_id, result=result
+        )
+
+    def fetch_status_results(
+        self, trial_ids: list[int]
+    ) -> Awaitable[tuple[TrialAndStatusInformation, TrialIdAndResultList]]:
+        return self._run(self.trial_backend.fetch_status_results, trial_ids)
+
+    def busy_trial_ids(self) -> Awaitable[list[tuple[int, str]]]:
+        return self._run(self.trial_backend.busy_trial_ids)
+
+    def max_concurrent_trials(self) -> int | None:
+        return self._call(self.trial_backend.max_concurrent_trials)
+
+    def wait_for_events(self, timeout: float) -> Awaitable[bool]:
+        return self._run(self.trial_backend.wait_for_events, timeout)
+
+    def stop_all(self) -> Awaitable:
+        return self._run(self.trial_backend.stop_all)
+
+    def new_trial_id(self) -> int:
+        return self._call(self.trial_backend.new_trial_id)
+
+    def stdout(self, trial_id: int) -> list[str]:
+        return self._call(self.trial_backend.stdout, trial_id)
+
+    def stderr(self, trial_id: int) -> list[str]:
+        return self._call(self.trial_backend.stderr, trial_id)
+
+    def set_path(self, results_root: str | None = None, tuner_name: str | None = None):
+        self._call(
+            self.trial_backend.set_path,
+            results_root=results_root,
+            tuner_name=tuner_name,
+        )
+
+    def set_metrics_spill(self, path: str | Path, max_metrics_in_memory: int):
+        self._call(
+            self.trial_backend.set_metrics_spill,
+            path=path,
+            max_metrics_in_memory=max_metrics_in_memory,
+        )
+
+    def entrypoint_path(self) -> Path:
+        return self._call(self.trial_backend.entrypoint_path)
+
+    def set_entrypoint(self, entry_point: str):
+        self._call(self.trial_backend.set_entrypoint, entry_point)
+
+    def on_tuner_save(self):
+        self._call(self.trial_backend.on_tuner_save)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __str__(self):
+        return str(self.trial_backend)
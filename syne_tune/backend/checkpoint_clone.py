@@ -0,0 +1,120 @@
+import errno
+import logging
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+CLONE_MODES = ("copy", "reflink", "hardlink")
+
+DEFAULT_NUM_COPY_THREADS = 8
+
+# ioctl request for cloning a file (``FICLONE`` in ``linux/fs.h``)
+FICLONE = 0x40049409
+
+# Errors signaling that the filesystem (or pair of filesystems) does not
+# support reflinks or hard links
+_NOT_SUPPORTED_ERRNOS = {
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.EPERM,
+    errno.EMLINK,
+}
+
+
+def _reflink(src_file: Path, tgt_file: Path):
+    """
+    Creates ``tgt_file`` as copy-on-write clone of ``src_file``, sharing its
+    data blocks. Raises :class:`OSError` if not supported.
+    """
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, "reflinks not supported on this platform")
+    with open(src_file, "rb") as src, open(tgt_file, "wb") as tgt:
+        try:
+            fcntl.ioctl(tgt.fileno(), FICLONE, src.fileno())
+        except OSError:
+            tgt.close()
+            os.unlink(tgt_file)
+            raise
+    shutil.copystat(src_file, tgt_file)
+
+
+def clone_directory(
+    src_path: str | Path,
+    tgt_path: str | Path,
+    mode: str = "copy",
+    num_threads: int = DEFAULT_NUM_COPY_THREADS,
+):
+    """
+    Recursively clones directory ``src_path`` to ``tgt_path``, which must not
+    exist. Depending on ``mode``, files are cloned as follows:
+
+    * "copy": Files are copied, using ``num_threads`` threads in parallel
+    * "reflink": Files are cloned as copy-on-write reflinks, which share
+      data blocks until either of them is modified. This is supported by
+      filesystems such as Btrfs, XFS, or ZFS (recent versions). If not
+      supported, files are copied
+    * "hardlink": Files are hard links to the source files. If not supported
+      (e.g., across filesystems), files are copied. This is only safe if the
+      training script replaces checkpoint files (e.g., writes a new file and
+      renames it), instead of modifying them in place, since hard links share
+      the same data
+
+    In all modes, files are shared only via the filesystem (reflinks or the
+    link count of hard links), so that source and target can be deleted
+    independently of each other.
+
+    :param src_path: Directory to be cloned
+    :param tgt_path: Target directory, must not exist
+    :param mode: See above, must be in :const:`CLONE_MODES`. Defaults to "copy"
+    :param num_threads: Number of threads used to copy files. Defaults to
+        :const:`DEFAULT_NUM_COPY_THREADS`
+    """
+    assert mode in CLONE_MODES, f"mode = {mode} not supported, must be in {CLONE_MODES}"
+    src_path = Path(src_path)
+    tgt_path = Path(tgt_path)
+    if not src_path.is_dir():
+        raise FileNotFoundError(f"Directory {src_path} does not exist")
+    tgt_path.mkdir(parents=True, exist_ok=False)
+    files_to_copy = []
+    link_supported = mode != "copy"
+    for dirpath, dirnames, filenames in os.walk(src_path, followlinks=True):
+        rel_path = Path(dirpath).relative_to(src_path)
+        for dirname in dirnames:
+            (tgt_path / rel_path / dirname).mkdir()
+        for filename in filenames:
+            src_file = Path(dirpath) / filename
+            tgt_file = tgt_path / rel_path / filename
+            if link_supported:
+                try:
+                    if mode == "reflink":
+                        _reflink(src_file, tgt_file)
+                    else:
+                        os.link(src_file, tgt_file)
+                    continue
+                except OSError as ex:
+                    if ex.errno not in _NOT_SUPPORTED_ERRNOS:
+                        raise
+                    logger.info(
+                        f"Cloning files from {src_path} with mode = {mode} is "
+                        f"not supported ({ex}). Copying files instead"
+                    )
+                    link_supported = False
+            files_to_copy.append((src_file, tgt_file))
+    if len(files_to_copy) > 1 and num_threads > 1:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            # Consume iterator in order to raise exceptions
+            list(executor.map(lambda args: shutil.copy2(*args), files_to_copy))
+    else:
+        for src_file, tgt_file in files_to_copy:
+            shutil.copy2(src_file, tgt_file)
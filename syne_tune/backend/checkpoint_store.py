@@ -0,0 +1,215 @@
+import hashlib
+import logging
+import os
+import shutil
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+COMPRESSION_TYPES = ("zlib", "zstd", "lz4")
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def _compress(data: bytes, compression: str | None) -> bytes:
+    if compression is None:
+        return data
+    elif compression == "zlib":
+        return zlib.compress(data, 1)
+    elif compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor().compress(data)
+    else:
+        import lz4.frame
+
+        return lz4.frame.compress(data)
+
+
+def _decompress(data: bytes, compression: str | None) -> bytes:
+    if compression is None:
+        return data
+    elif compression == "zlib":
+        return zlib.decompress(data)
+    elif compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data)
+    else:
+        import lz4.frame
+
+        return lz4.frame.decompress(data)
+
+
+def _check_compression_available(compression: str | None):
+    module_names = {"zstd": "zstandard", "lz4": "lz4"}
+    module_name = module_names.get(compression)
+    if module_name is not None:
+        try:
+            __import__(module_name)
+        except ImportError as ex:
+            raise ImportError(
+                f"compression = '{compression}' requires the {module_name} "
+                f"package: pip install {module_name}"
+            ) from ex
+
+
+class CheckpointStore:
+    """
+    Content-addressed store for checkpoints of trials. Files of a checkpoint
+    directory are split into chunks of size ``chunk_size``, which are stored
+    (optionally compressed) under the hash of their content. A checkpoint is
+    represented by a manifest, which lists the chunks of each file. Chunks
+    shared between checkpoints (e.g., since one was cloned from the other, or
+    since files did not change) are stored only once, and reference counts
+    determine when they can be removed.
+
+    Training scripts read and write plain files, so checkpoints are
+    materialized as directories while trials are running, see
+    :meth:`materialize`. The store is used by
+    :class:`~syne_tune.backend.LocalBackend` if ``use_checkpoint_store`` is
+    set.
+
+    :param root: Directory where chunks are stored
+    :param compression: If given, chunks are compressed with this method,
+        one of :const:`COMPRESSION_TYPES`. "zstd" and "lz4" need the
+        ``zstandard`` and ``lz4`` packages respectively. Defaults to no
+        compression
+    :param chunk_size: Size of chunks (in bytes). Defaults to
+        :const:`DEFAULT_CHUNK_SIZE`
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        compression: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        assert (
+            compression is None or compression in COMPRESSION_TYPES
+        ), f"compression = {compression} not supported, must be in {COMPRESSION_TYPES}"
+        _check_compression_available(compression)
+        self.root = Path(root)
+        self.compression = compression
+        self.chunk_size = chunk_size
+        # Maps key to manifest. A manifest maps relative file path to
+        # ``{"mode": ..., "chunks": [...]}``
+        self._manifests = dict()
+        # Maps chunk hash to number of references from manifests
+        self._refcounts = Counter()
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._manifests
+
+    def _chunk_path(self, chunk_hash: str) -> Path:
+        return self.root / chunk_hash[:2] / chunk_hash
+
+    def _put_chunk(self, data: bytes) -> str:
+        chunk_hash = hashlib.sha256(data).hexdigest()
+        if self._refcounts[chunk_hash] == 0:
+            chunk_path = self._chunk_path(chunk_hash)
+            chunk_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = chunk_path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(_compress(data, self.compression))
+            os.replace(tmp_path, chunk_path)
+        self._refcounts[chunk_hash] += 1
+        return chunk_hash
+
+    def _release_chunks(self, manifest: dict[str, Any]):
+        for entry in manifest.values():
+            for chunk_hash in entry["chunks"]:
+                self._refcounts[chunk_hash] -= 1
+                if self._refcounts[chunk_hash] <= 0:
+                    del self._refcounts[chunk_hash]
+                    self._chunk_path(chunk_hash).unlink(missing_ok=True)
+
+    def put(self, key: Any, path: str | Path):
+        """
+        Stores the content of directory ``path`` under ``key``. If ``key`` is
+        already present, its previous content is replaced.
+
+        :param key: Key for checkpoint (e.g., trial ID)
+        :param path: Checkpoint directory
+        """
+        path = Path(path)
+        manifest = dict()
+        for file in sorted(path.rglob("*")):
+            if file.is_file():
+                chunks = []
+                with open(file, "rb") as f:
+                    while True:
+                        data = f.read(self.chunk_size)
+                        if not data:
+                            break
+                        chunks.append(self._put_chunk(data))
+                manifest[file.relative_to(path).as_posix()] = {
+                    "mode": file.stat().st_mode & 0o777,
+                    "chunks": chunks,
+                }
+        self.delete(key)
+        self._manifests[key] = manifest
+
+    def clone(self, src_key: Any, tgt_key: Any):
+        """
+        Stores checkpoint of ``src_key`` under ``tgt_key`` as well, without
+        copying any data.
+
+        :param src_key: Key of checkpoint to be cloned, must be present
+        :param tgt_key: Key for clone
+        """
+        manifest = self._manifests[src_key]
+        for entry in manifest.values():
+            self._refcounts.update(entry["chunks"])
+        self.delete(tgt_key)
+        self._manifests[tgt_key] = manifest
+
+    def materialize(self, key: Any, path: str | Path):
+        """
+        Writes checkpoint of ``key`` as plain files into directory ``path``.
+        Files already present in ``path`` are overwritten.
+
+        :param key: Key of checkpoint, must be present
+        :param path: Target directory
+        """
+        path = Path(path)
+        for rel_path, entry in self._manifests[key].items():
+            file = path / rel_path
+            file.parent.mkdir(parents=True, exist_ok=True)
+            with open(file, "wb") as f:
+                for chunk_hash in entry["chunks"]:
+                    with open(self._chunk_path(chunk_hash), "rb") as chunk_file:
+                        f.write(_decompress(chunk_file.read(), self.compression))
+            os.chmod(file, entry["mode"])
+
+    def delete(self, key: Any):
+        """
+        Removes checkpoint of ``key``. Chunks not referenced anymore are
+        deleted. It is OK if ``key`` is not present.
+
+        :param key: Key of checkpoint
+        """
+        manifest = self._manifests.pop(key, None)
+        if manifest is not None:
+            self._release_chunks(manifest)
+
+    def disk_usage(self) -> int:
+        """
+        :return: Number of bytes used by stored chunks
+        """
+        return sum(
+            self._chunk_path(chunk_hash).stat().st_size
+            for chunk_hash in self._refcounts
+        )
+
+    def clear(self):
+        """
+        Removes all checkpoints and the root directory.
+        """
+        self._manifests = dict()
+        self._refcounts = Counter()
+        shutil.rmtree(self.root, ignore_errors=True)
@@ -1,18 +1,31 @@
+import functools
 import logging
 import os
+import select
 import shutil
+import signal
 import sys
+import time
+from collections import Counter, OrderedDict
 from operator import itemgetter
 import subprocess
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from syne_tune.backend.checkpoint_clone import CLONE_MODES, clone_directory
+from syne_tune.backend.checkpoint_store import CheckpointStore
 from syne_tune.backend.trial_backend import TrialBackend, BUSY_STATUS
+from syne_tune.num_cpu import get_available_cpus, get_numa_nodes
 from syne_tune.num_gpu import get_num_gpus
-from syne_tune.report import retrieve
+from syne_tune.report import MetricsLogTailer, MetricsFileTailer
 from syne_tune.backend.trial_status import TrialResult, Status
-from syne_tune.constants import ST_CHECKPOINT_DIR, ST_CONFIG_JSON_FNAME_ARG
+from syne_tune.constants import (
+    ST_CHECKPOINT_DIR,
+    ST_CONFIG_JSON_FNAME_ARG,
+    ST_METRICS_FILE_ENV_VAR,
+    ST_METRICS_FILENAME,
+)
 from syne_tune.util import experiment_path, random_string, dump_json_with_numpy
 
 logger = logging.getLogger(__name__)
@@ -27,6 +40,17 @@ if "OMP_NUM_THREADS" not in os.environ:
     os.environ["OMP_NUM_THREADS"] = "1"
 
 
+DEFAULT_EVENT_POLL_INTERVAL = 0.05
+
+PAUSE_MODES = ("kill", "suspend")
+
+# Time (in secs) to wait for a killed job to exit before its checkpoint is
+# moved into the checkpoint store
+STORE_CHECKPOINT_TIMEOUT = 5
+
+THREAD_POOL_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+
 class LocalBackend(TrialBackend):
     """
     A backend running locally by spawning sub-process concurrently. Note that
@@ -51,6 +75,66 @@ class LocalBackend(TrialBackend):
     :param gpus_to_use: If this is given, the backend only uses GPUs in this
         lists (non-negative ints). Entries must be in
         ``range(get_num_gpus())``. Defaults to using all GPUs.
+    :param event_poll_interval: In :meth:`wait_for_events`, new metrics are
+        checked for at this interval (in seconds). The end of a trial's job is
+        detected immediately on Linux, and at this interval otherwise. Defaults
+        to :const:`DEFAULT_EVENT_POLL_INTERVAL`
+    :param use_metrics_file: If ``True``, :class:`~syne_tune.Reporter` in the
+        training script writes metrics as JSON lines to a dedicated file per
+        trial (passed via the environment variable
+        :const:`~syne_tune.constants.ST_METRICS_FILE_ENV_VAR`), instead of
+        printing them to ``std.out``. The backend then reads this file directly,
+        so there is no need to scan the logging output of the script. This is
+        recommended for scripts which log a lot or report at high frequency.
+        Defaults to ``False``.
+    :param pause_mode: If "kill" (default), the job of a paused trial is
+        killed, and resuming the trial starts a new job (which continues from
+        the checkpoint, if the script supports checkpointing). If "suspend",
+        the job is frozen by sending ``SIGSTOP`` to its process tree, and
+        resumed with ``SIGCONT``. This keeps warm state (loaded data,
+        compiled models), so that resuming is almost instantaneous, at the
+        expense of memory held by suspended jobs. If a trial is resumed with
+        a different configuration, its suspended job is killed and a new one
+        is started. GPUs assigned to a suspended trial remain assigned
+    :param max_suspended_trials: Only for ``pause_mode == "suspend"``. If
+        given, at most this many jobs are suspended at any time. If a new
+        job is suspended beyond this limit, the job suspended earliest is
+        killed (as for ``pause_mode == "kill"``). Defaults to no limit
+    :param max_suspended_memory: Only for ``pause_mode == "suspend"``. If
+        given, the resident memory (in MB) of suspended jobs (see
+        :meth:`suspended_memory`) is limited to this value, by killing jobs
+        suspended earliest. Defaults to no limit
+    :param cpus_per_trial: If given, each trial is assigned this many CPU
+        cores, and its job is pinned to them (on Linux). Cores of the same NUMA
+        node are preferred, if the topology is exposed. Variables
+        ``OMP_NUM_THREADS``, ``MKL_NUM_THREADS``, ``OPENBLAS_NUM_THREADS`` are
+        set to ``cpus_per_trial``, to avoid oversubscription by thread pools.
+        No more trials are run at the same time than there are free cores
+        for (see :meth:`max_concurrent_trials`). Defaults to no assignment
+    :param memory_per_trial: If given, each trial is assumed to need this
+        much memory (in MB), and no more trials are run at the same time than
+        fit into the total memory of the instance (minus memory held by
+        suspended jobs). Memory is not limited for the job. Defaults to no
+        accounting
+    :param checkpoint_clone_mode: Determines how :meth:`copy_checkpoint`
+        clones the checkpoint of one trial for another (e.g., in population
+        based training). Use "reflink" for copy-on-write clones on filesystems
+        supporting them, or "hardlink" if the training script never modifies
+        checkpoint files in place. Files are copied if cloning is not
+        supported. See
+        :func:`~syne_tune.backend.checkpoint_clone.clone_directory`. Defaults
+        to "copy"
+    :param use_checkpoint_store: If ``True``, checkpoints of paused trials
+        are moved into a content-addressed
+        :class:`~syne_tune.backend.checkpoint_store.CheckpointStore`, which
+        stores identical parts of checkpoints only once. Checkpoints cloned by
+        :meth:`copy_checkpoint` share all their data. Checkpoints are written
+        back as plain files when trials are started or resumed. Defaults to
+        ``False``
+    :param checkpoint_store_compression: If ``use_checkpoint_store`` is set,
+        data in the store is compressed with this method (see
+        :class:`~syne_tune.backend.checkpoint_store.CheckpointStore`).
+        Defaults to no compression
     """
 
     def __init__(
@@ -62,7 +146,24 @@ class LocalBackend(TrialBackend):
         rotate_gpus: bool = True,
         num_gpus_per_trial: int = 1,
         gpus_to_use: list[int] | None = None,
+        use_metrics_file: bool = False,
+        event_poll_interval: float = DEFAULT_EVENT_POLL_INTERVAL,
+        pause_mode: str = "kill",
+        max_suspended_trials: int | None = None,
+        max_suspended_memory: float | None = None,
+        cpus_per_trial: int | None = None,
+        memory_per_trial: float | None = None,
+        checkpoint_clone_mode: str = "copy",
+        use_checkpoint_store: bool = False,
+        checkpoint_store_compression: str | None = None,
     ):
+        assert (
+            pause_mode in PAUSE_MODES
+        ), f"pause_mode = {pause_mode} not supported, must be in {PAUSE_MODES}"
+        assert checkpoint_clone_mode in CLONE_MODES, (
+            f"checkpoint_clone_mode = {checkpoint_clone_mode} not supported, "
+            f"must be in {CLONE_MODES}"
+        )
         super(LocalBackend, self).__init__(
             delete_checkpoints=delete_checkpoints, pass_args_as_json=pass_args_as_json
         )
@@ -72,6 +173,16 @@ class LocalBackend(TrialBackend):
         ).exists(), f"the script provided to tune does not exist ({entry_point})"
         self.entry_point = entry_point
         self.binary = sys.executable if binary is None else binary
+        self.use_metrics_file = use_metrics_file
+        self.event_poll_interval = event_poll_interval
+        self.pause_mode = pause_mode
+        self.max_suspended_trials = max_suspended_trials
+        self.max_suspended_memory = max_suspended_memory
+        self.checkpoint_clone_mode = checkpoint_clone_mode
+        self.use_checkpoint_store = use_checkpoint_store
+        self.checkpoint_store_compression = checkpoint_store_compression
+        # Created when first used, since ``local_path`` may still change
+        self._checkpoint_store = None
         self.local_path = None
         self.trial_subprocess = dict()
 
@@ -86,11 +197,29 @@ class LocalBackend(TrialBackend):
         self.trial_gpu = None
         self.gpu_times_assigned = None
         self.num_gpus_per_trial = num_gpus_per_trial
+        # CPU and memory slots. Initialization is delayed, as for GPUs
+        self.cpus_per_trial = cpus_per_trial
+        self.memory_per_trial = memory_per_trial
+        # CPU cores to be used, grouped by NUMA node
+        self.cpu_numa_nodes = None
+        # Maps ``trial_id`` to list of CPU cores currently assigned to this trial
+        self.trial_cpus = dict()
+        self._total_memory = None
         # sets the path where to write files, can be overridden later by Tuner.
         self.set_path(str(Path(experiment_path(tuner_name=random_string(length=10)))))
         # Trials which may currently be busy (status in ``BUSY_STATUS``). The
         # corresponding jobs are polled for status in ``busy_trial_ids``.
         self._busy_trial_id_candidates = set()
+        # Maps ``trial_id`` to reader which parses metrics from ``std.out``
+        # incrementally
+        self._metrics_tailers = dict()
+        # Trials whose jobs have been started, and for which we have not yet
+        # observed that they are done. Used in ``wait_for_events``
+        self._running_trial_ids = set()
+        # Maps ``trial_id`` of paused trials whose jobs are suspended to the
+        # configuration the job was started with. Ordered by time of
+        # suspension
+        self._suspended_trials = OrderedDict()
 
     def trial_path(self, trial_id: int) -> Path:
         """
@@ -107,22 +236,83 @@ class LocalBackend(TrialBackend):
         """
         return self.trial_path(trial_id) / "checkpoints"
 
+    def checkpoint_store(self) -> CheckpointStore | None:
+        """
+        :return: Store for checkpoints if ``use_checkpoint_store`` is set,
+            otherwise ``None``
+        """
+        if self.use_checkpoint_store and self._checkpoint_store is None:
+            self._checkpoint_store = CheckpointStore(
+                root=self.local_path / "checkpoint_store",
+                compression=self.checkpoint_store_compression,
+            )
+        return self._checkpoint_store
+
     def copy_checkpoint(self, src_trial_id: int, tgt_trial_id: int):
         src_checkpoint_path = self.checkpoint_trial_path(src_trial_id)
         tgt_checkpoint_path = self.checkpoint_trial_path(tgt_trial_id)
-        shutil.copytree(src_checkpoint_path, tgt_checkpoint_path)
+        store = self.checkpoint_store()
+        if store is None:
+            clone_directory(
+                src_checkpoint_path,
+                tgt_checkpoint_path,
+                mode=self.checkpoint_clone_mode,
+            )
+        elif src_trial_id in store:
+            store.clone(src_trial_id, tgt_trial_id)
+        else:
+            # Checkpoint of a trial which is running or has finished
+            store.put(tgt_trial_id, src_checkpoint_path)
 
     def delete_checkpoint(self, trial_id: int):
         checkpoint_path = self.checkpoint_trial_path(trial_id)
         shutil.rmtree(checkpoint_path, ignore_errors=True)
+        store = self.checkpoint_store()
+        if store is not None:
+            store.delete(trial_id)
+
+    def _store_checkpoint(self, trial_id: int):
+        """
+        Moves the checkpoint of a trial whose job has ended into the store,
+        if ``use_checkpoint_store`` is set.
+        """
+        store = self.checkpoint_store()
+        checkpoint_path = self.checkpoint_trial_path(trial_id)
+        if store is not None and checkpoint_path.exists():
+            # Job must not write to the checkpoint anymore. It has been
+            # killed, so this should not take long
+            if not self._wait_for_process(trial_id, timeout=STORE_CHECKPOINT_TIMEOUT):
+                # Checkpoint remains in the trial directory, from where it is
+                # used if the trial is resumed
+                logger.warning(
+                    f"Job of trial_id {trial_id} has not exited "
+                    f"{STORE_CHECKPOINT_TIMEOUT} secs after being killed. Its "
+                    "checkpoint is not moved into the checkpoint store"
+                )
+                return
+            store.put(trial_id, checkpoint_path)
+            shutil.rmtree(checkpoint_path, ignore_errors=True)
+
+    def _materialize_checkpoint(self, trial_id: int):
+        """
+        Writes the checkpoint of a trial from the store to its checkpoint
+        directory before its job is started.
+        """
+        store = self.checkpoint_store()
+        if store is not None and trial_id in store:
+            store.materialize(trial_id, self.checkpoint_trial_path(trial_id))
+            # Directory is used while the trial is running
+            store.delete(trial_id)
 
     def _prepare_for_schedule(self, num_gpus=None):
         """
         Called at the start of each :meth:`_schedule`.
         In particular, we initialize variables related to GPU scheduling, if
-        ``rotate_gpus`` is set. This is done before the first call of
-        :meth:`_schedule`, so we can be sure it runs on the target instance.
+        ``rotate_gpus`` is set, and to CPU and memory slots. This is done before
+        the first call of :meth:`_schedule`, so we can be sure it runs on the
+        target instance.
         """
+        self._prepare_cpu_memory_slots()
         if self.rotate_gpus and self.num_gpus is None:
             if num_gpus is None:
                 self.num_gpus = get_num_gpus()
@@ -157,6 +347,124 @@ class LocalBackend(TrialBackend):
                 # Nothing to rotate over
                 self.rotate_gpus = False
 
+    def _prepare_cpu_memory_slots(self):
+        if self.cpus_per_trial is not None and self.cpu_numa_nodes is None:
+            cpus = get_available_cpus()
+            if self.cpus_per_trial > len(cpus):
+                logger.warning(
+                    f"cpus_per_trial = {self.cpus_per_trial} is too large, "
+                    f"reducing to {len(cpus)}"
+                )
+                self.cpus_per_trial = len(cpus)
+            self.cpu_numa_nodes = get_numa_nodes(cpus)
+            logger.info(
+                f"Will use {len(cpus)} CPU cores on {len(self.cpu_numa_nodes)} "
+                f"NUMA nodes, {self.cpus_per_trial} per trial"
+            )
+        if self.memory_per_trial is not None and self._total_memory is None:
+            import psutil
+
+            self._total_memory = psutil.virtual_memory().total / (1024 * 1024)
+
+    def max_concurrent_trials(self) -> int | None:
+        """
+        If ``cpus_per_trial`` or ``memory_per_trial`` is given, trials are only
+        started if enough CPU cores and memory is available for them.
+
+        :return: Maximum number of trials which can run at the same time, or
+            ``None`` if there is no limit
+        """
+        self._prepare_cpu_memory_slots()
+        limits = []
+        if self.cpus_per_trial is not None:
+            num_cpus = sum(len(node) for node in self.cpu_numa_nodes)
+            limits.append(num_cpus // self.cpus_per_trial)
+        if self.memory_per_trial is not None:
+            available_memory = self._total_memory
+            if self._suspended_trials:
+                available_memory -= self.suspended_memory()
+            limits.append(int(available_memory // self.memory_per_trial))
+        if not limits:
+            return None
+        return max(min(limits), 1)
+
+    def _cpus_for_new_trial(self) -> list[int]:
+        """
+        Selects ``cpus_per_trial`` CPU cores for trial to be scheduled on.
+        Free cores of a single NUMA node have precedence, where the node with
+        the least number of free cores is chosen. Otherwise, free cores across
+        nodes are used. If there are not enough free cores, the ones with
+        the least number of current assignments are added, and a warning is
+        logged. This does not happen if no more than
+        :meth:`max_concurrent_trials` trials are running.
+        """
+        assignments = Counter(cpu for cpus in self.trial_cpus.values() for cpu in cpus)
+        free_per_node = [
+            [cpu for cpu in node if cpu not in assignments]
+            for node in self.cpu_numa_nodes
+        ]
+        num_cpus = self.cpus_per_trial
+        fitting_nodes = [cpus for cpus in free_per_node if len(cpus) >= num_cpus]
+        if fitting_nodes:
+            return min(fitting_nodes, key=len)[:num_cpus]
+        res_cpus = [cpu for cpus in free_per_node for cpu in cpus]
+        num_extra = num_cpus - len(res_cpus)
+        if num_extra > 0:
+            logger.warning(
+                f"Not enough free CPU cores for a new trial, {num_extra} of its "
+                f"{num_cpus} cores are shared with running trials. Use at most "
+                f"{self.max_concurrent_trials()} workers to avoid this"
+            )
+            assigned_cpus = sorted(assignments.keys(), key=lambda cpu: assignments[cpu])
+            res_cpus = res_cpus + assigned_cpus[:num_extra]
+        return res_cpus[:num_cpus]
+
+    def _allocate_cpus(self, trial_id: int, env: dict[str, Any]):
+        if self.cpus_per_trial is not None:
+            cpus = self._cpus_for_new_trial()
+            self.trial_cpus[trial_id] = cpus
+            num_threads = str(len(cpus))
+            for name in THREAD_POOL_ENV_VARS:
+                env[name] = num_threads
+            logger.info(f"Assigned CPU cores {cpus} to trial_id {trial_id}")
+
+    def _pin_cpus_at_start(self, trial_id: int) -> list[int] | None:
+        """
+        :param trial_id: ID of trial whose job is to be started
+        :return: CPU cores assigned to the trial, to which its job is to be
+            restricted when it starts (before it creates threads or child
+            processes). ``None`` if there is no restriction, or pinning is not
+            supported (only on Linux)
+        """
+        if hasattr(os, "sched_setaffinity"):
+            return self.trial_cpus.get(trial_id)
+        return None
+
+    def _pin_cpus(self, trial_id: int):
+        """
+        Restricts all threads of the running job of a trial to the CPU cores
+        assigned to it. Only supported on Linux. New jobs are restricted when
+        they start, see :meth:`_pin_cpus_at_start`.
+        """
+        cpus = self.trial_cpus.get(trial_id)
+        if cpus is not None and hasattr(os, "sched_setaffinity"):
+            import psutil
+
+            for process in self._process_tree(trial_id):
+                try:
+                    thread_ids = [thread.id for thread in process.threads()]
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+                for thread_id in thread_ids:
+                    try:
+                        os.sched_setaffinity(thread_id, cpus)
+                    except OSError:
+                        # Thread has exited in the meantime
+                        pass
+
+    def _deallocate_cpus(self, trial_id: int):
+        self.trial_cpus.pop(trial_id, None)
+
     def _gpus_for_new_trial(self) -> list[int]:
         """
         Selects ``num_gpus_per_trial`` GPUs for trial to be scheduled on. GPUs
@@ -190,36 +498,86 @@ class LocalBackend(TrialBackend):
         return res_gpu
 
     def _schedule(self, trial_id: int, config: dict[str, Any]):
+        if trial_id in self._suspended_trials:
+            if self._suspended_trials[trial_id] == config:
+                self._continue_suspended_trial(trial_id)
+                return
+            # Job cannot pick up the new configuration
+            self._kill_suspended_trial(trial_id)
         self._prepare_for_schedule()
         trial_path = self.trial_path(trial_id)
         os.makedirs(trial_path, exist_ok=True)
+        self._materialize_checkpoint(trial_id)
+        logger.debug(
+            f"scheduling {trial_id}, {self.entry_point}, {config}, logging into {trial_path}"
+        )
+        config_json_fname = str(trial_path / "config.json")
+        if self.pass_args_as_json:
+            config_for_args = {ST_CONFIG_JSON_FNAME_ARG: config_json_fname}
+        else:
+            config_for_args = config.copy()
+        config_for_args[ST_CHECKPOINT_DIR] = str(self.checkpoint_trial_path(trial_id))
+
+        dump_json_with_numpy(config, config_json_fname)
+        env = dict(os.environ)
+        self._set_metrics_file_env(trial_id, env)
+        self._allocate_gpu(trial_id, env)
+        self._allocate_cpus(trial_id, env)
+        self.trial_subprocess[trial_id] = self._start_process(
+            trial_id, config_for_args, env
+        )
+        self._busy_trial_id_candidates.add(trial_id)  # Mark trial as busy
+        self._running_trial_ids.add(trial_id)
+
+    @staticmethod
+    def _command_line_args(config_for_args: dict[str, Any]) -> str:
+        return " ".join([f"--{key} {value}" for key, value in config_for_args.items()])
+
+    def _start_process(
+        self, trial_id: int, config_for_args: dict[str, Any], env: dict[str, Any]
+    ):
+        """
+        Starts the job for a trial, writing its output to ``std.out`` and
+        ``std.err`` in the trial directory.
+
+        :param trial_id: ID of trial
+        :param config_for_args: Arguments passed to the entry point
+        :param env: Environment variables for the job
+        :return: Handle of the job, supporting ``poll``, ``kill`` and ``pid``
+            as :class:`subprocess.Popen`
+        """
+        trial_path = self.trial_path(trial_id)
+        cpus = self._pin_cpus_at_start(trial_id)
+        if cpus is not None:
+            preexec_fn = functools.partial(os.sched_setaffinity, 0, cpus)
+        else:
+            preexec_fn = None
         with open(trial_path / "std.out", "a") as stdout:
             with open(trial_path / "std.err", "a") as stderr:
-                logger.debug(
-                    f"scheduling {trial_id}, {self.entry_point}, {config}, logging into {trial_path}"
-                )
-                config_json_fname = str(trial_path / "config.json")
-                if self.pass_args_as_json:
-                    config_for_args = {ST_CONFIG_JSON_FNAME_ARG: config_json_fname}
-                else:
-                    config_for_args = config.copy()
-                config_for_args[ST_CHECKPOINT_DIR] = str(
-                    self.checkpoint_trial_path(trial_id)
-                )
-                config_str = " ".join(
-                    [f"--{key} {value}" for key, value in config_for_args.items()]
-                )
-
-                dump_json_with_numpy(config, config_json_fname)
+                config_str = self._command_line_args(config_for_args)
                 cmd = f"{self.binary} {self.entry_point} {config_str}"
-                env = dict(os.environ)
-                self._allocate_gpu(trial_id, env)
                 logger.info(f"running subprocess with command: {cmd}")
-
-                self.trial_subprocess[trial_id] = subprocess.Popen(
-                    cmd.split(" "), stdout=stdout, stderr=stderr, env=env
+                return subprocess.Popen(
+                    cmd.split(" "),
+                    stdout=stdout,
+                    stderr=stderr,
+                    env=env,
+                    preexec_fn=preexec_fn,
                 )
-        self._busy_trial_id_candidates.add(trial_id)  # Mark trial as busy
+
+    def metrics_file_path(self, trial_id: int) -> Path:
+        """
+        :param trial_id: ID of trial
+        :return: File metrics are written to if ``use_metrics_file`` is set
+        """
+        return self.trial_path(trial_id) / ST_METRICS_FILENAME
+
+    def _set_metrics_file_env(self, trial_id: int, env: dict[str, Any]):
+        if self.use_metrics_file:
+            env[ST_METRICS_FILE_ENV_VAR] = str(self.metrics_file_path(trial_id))
+        else:
+            # Make sure metrics are not written to a file set for the tuner
+            env.pop(ST_METRICS_FILE_ENV_VAR, None)
 
     def _allocate_gpu(self, trial_id: int, env: dict[str, Any]):
         if self.rotate_gpus:
@@ -245,8 +603,12 @@ class LocalBackend(TrialBackend):
             status = self._read_status(trial_id)
 
             if status != Status.in_progress:
-                # Trial completed or failed: Deallocate GPU
-                self._deallocate_gpu(trial_id)
+                # Trial completed, failed or was paused: Deallocate GPU and CPU
+                # cores. A suspended job keeps its GPUs
+                if trial_id not in self._suspended_trials:
+                    self._deallocate_gpu(trial_id)
+                self._deallocate_cpus(trial_id)
+                self._running_trial_ids.discard(trial_id)
 
             # If the job has finished, we read its end-time in a time-stamp.
             # If the time-stamp does not exist and the job finished, we create it. As a consequence the end-time is
@@ -263,7 +625,9 @@ class LocalBackend(TrialBackend):
                 if self._is_process_done(trial_id=trial_id):
                     self._write_time_stamp(trial_id=trial_id, name="end")
 
-            metrics = retrieve(log_lines=self.stdout(trial_id=trial_id))
+            metrics = self._retrieve_metrics(
+                trial_id, close=status != Status.in_progress
+            )
             trial_results = self._trial_dict[trial_id].add_results(
                 metrics=metrics,
                 status=status,
@@ -272,15 +636,149 @@ class LocalBackend(TrialBackend):
             res.append(trial_results)
         return res
 
+    def _retrieve_metrics(self, trial_id: int, close: bool = False) -> list[dict]:
+        """
+        Only the part of ``std.out`` (or the metrics file, if
+        ``use_metrics_file`` is set) appended since the previous call is parsed.
+        The list returned contains all metrics reported by the trial so far,
+        it is extended in place by subsequent calls.
+
+        :param trial_id: ID of trial
+        :param close: If ``True``, the file handle is released after reading.
+            This is done once the trial is not running anymore (it is reopened
+            if the trial is resumed)
+        :return: All metrics reported by trial ``trial_id``
+        """
+        tailer = self._metrics_tailers.get(trial_id)
+        if tailer is None:
+            # ``SimulatorBackend`` keeps the metrics of the trial in another
+            # list, appended to as results are processed
+            metrics = self._new_metrics_list(trial_id, kind="reported")
+            if self.use_metrics_file:
+                tailer = MetricsFileTailer(
+                    self.metrics_file_path(trial_id), metrics=metrics
+                )
+            else:
+                tailer = MetricsLogTailer(
+                    self.trial_path(trial_id) / "std.out", metrics=metrics
+                )
+            self._metrics_tailers[trial_id] = tailer
+        # Once the job has exited, its last line is parsed even if it does not
+        # end with a newline. Jobs not registered in ``trial_subprocess`` have
+        # been run to completion by a subclass (e.g., ``SimulatorBackend``)
+        job_done = trial_id not in self.trial_subprocess or self._is_process_done(
+            trial_id
+        )
+        tailer.read(final=close and job_done)
+        if close:
+            tailer.close()
+        return tailer.metrics
+
     def _release_from_worker(self, trial_id: int):
         if trial_id in self._busy_trial_id_candidates:
             self._busy_trial_id_candidates.remove(trial_id)
+        self._running_trial_ids.discard(trial_id)
+        # Also done for suspended jobs, which do not use their cores
+        self._deallocate_cpus(trial_id)
 
     def _pause_trial(self, trial_id: int, result: dict | None):
         self._file_path(trial_id=trial_id, filename="pause").touch()
+        if self.pause_mode == "suspend" and not self._is_process_done(trial_id):
+            self._suspend_trial(trial_id)
+        else:
+            self._kill_process(trial_id)
+            self._deallocate_gpu(trial_id)
+            self._store_checkpoint(trial_id)
+        self._release_from_worker(trial_id)
+
+    def _process_tree(self, trial_id: int) -> list:
+        """
+        :param trial_id: ID of trial
+        :return: List of ``psutil.Process`` for the job of the trial and all its
+            children, starting with the job. Empty if the job does not exist
+            anymore
+        """
+        import psutil
+
+        try:
+            parent = psutil.Process(self.trial_subprocess[trial_id].pid)
+            return [parent] + parent.children(recursive=True)
+        except psutil.NoSuchProcess:
+            return []
+
+    def _send_signal(self, trial_id: int, sig: int):
+        import psutil
+
+        processes = self._process_tree(trial_id)
+        if sig == signal.SIGCONT:
+            # Continue children first, so they are running when the job
+            # continues
+            processes = reversed(processes)
+        for process in processes:
+            try:
+                process.send_signal(sig)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+    def _suspend_trial(self, trial_id: int):
+        self._send_signal(trial_id, signal.SIGSTOP)
+        self._suspended_trials[trial_id] = self._trial_dict[trial_id].config
+        logger.info(
+            f"Suspended job of trial_id {trial_id}. Memory of suspended jobs: "
+            f"{self.suspended_memory():.1f} MB"
+        )
+        self._evict_suspended_trials()
+
+    def _continue_suspended_trial(self, trial_id: int):
+        del self._suspended_trials[trial_id]
+        # Job is assigned CPU cores anew, while it keeps its GPUs
+        self._allocate_cpus(trial_id, env=dict())
+        self._pin_cpus(trial_id)
+        self._send_signal(trial_id, signal.SIGCONT)
+        logger.info(f"Continued suspended job of trial_id {trial_id}")
+        self._busy_trial_id_candidates.add(trial_id)
+        self._running_trial_ids.add(trial_id)
+
+    def _kill_suspended_trial(self, trial_id: int):
+        del self._suspended_trials[trial_id]
         self._kill_process(trial_id)
         self._deallocate_gpu(trial_id)
-        self._release_from_worker(trial_id)
+
+    def _evict_suspended_trials(self):
+        """
+        Kills jobs suspended earliest, until ``max_suspended_trials`` and
+        ``max_suspended_memory`` are respected.
+        """
+        while self._suspended_trials and (
+            (
+                self.max_suspended_trials is not None
+                and len(self._suspended_trials) > self.max_suspended_trials
+            )
+            or (
+                self.max_suspended_memory is not None
+                and self.suspended_memory() > self.max_suspended_memory
+            )
+        ):
+            trial_id = next(iter(self._suspended_trials))
+            logger.info(f"Killing suspended job of trial_id {trial_id}")
+            self._kill_suspended_trial(trial_id)
+            self._store_checkpoint(trial_id)
+
+    def suspended_memory(self) -> float:
+        """
+        :return: Resident memory (in MB) of all suspended jobs, including their
+            child processes
+        """
+        import psutil
+
+        memory = 0
+        for trial_id in self._suspended_trials:
+            for process in self._process_tree(trial_id):
+                try:
+                    memory += process.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+        return memory / (1024 * 1024)
 
     def _resume_trial(self, trial_id: int):
         pause_path = self._file_path(trial_id=trial_id, filename="pause")
@@ -291,6 +789,7 @@ class LocalBackend(TrialBackend):
 
     def _stop_trial(self, trial_id: int, result: dict | None):
         self._file_path(trial_id=trial_id, filename="stop").touch()
+        self._suspended_trials.pop(trial_id, None)
         self._kill_process(trial_id)
         self._deallocate_gpu(trial_id)
         self._release_from_worker(trial_id)
@@ -340,6 +839,18 @@ class LocalBackend(TrialBackend):
     def _is_process_done(self, trial_id: int) -> bool:
         return self.trial_subprocess[trial_id].poll() is not None
 
+    def _wait_for_process(self, trial_id: int, timeout: float) -> bool:
+        """
+        :param trial_id: ID of trial
+        :param timeout: Maximum time to wait (in secs)
+        :return: Has the job of the trial exited within ``timeout``?
+        """
+        try:
+            self.trial_subprocess[trial_id].wait(timeout=timeout)
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+
     def _read_status(self, trial_id: int):
         if self._file_path(trial_id=trial_id, filename="stop").exists():
             return Status.stopped
@@ -376,6 +887,65 @@ class LocalBackend(TrialBackend):
         else:
             return []
 
+    def _has_pending_events(self) -> bool:
+        """
+        :return: Has any running trial reported metrics not fetched yet, or
+            has its job finished?
+        """
+        for trial_id in self._running_trial_ids:
+            if self._is_process_done(trial_id):
+                return True
+            num_metrics = len(self._retrieve_metrics(trial_id))
+            if num_metrics > self._last_metric_seen_index[trial_id]:
+                return True
+        return False
+
+    def _open_pidfds(self) -> list[int]:
+        """
+        :return: File descriptors which become readable once the job of a
+            running trial exits. Empty if not supported by the platform
+        """
+        pidfds = []
+        if hasattr(os, "pidfd_open"):
+            for trial_id in self._running_trial_ids:
+                try:
+                    pidfds.append(os.pidfd_open(self.trial_subprocess[trial_id].pid))
+                except OSError:
+                    # Process already gone, or pidfd not supported by kernel
+                    pass
+        return pidfds
+
+    def wait_for_events(self, timeout: float) -> bool:
+        """
+        Waits until a running trial reports new metrics or its job exits. Exits
+        of jobs are detected immediately via pidfd (Linux), new metrics are
+        checked for every ``event_poll_interval`` seconds.
+        """
+        deadline = time.perf_counter() + timeout
+        pidfds = self._open_pidfds()
+        try:
+            while not self._has_pending_events():
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return False
+                wait_time = min(remaining, self.event_poll_interval)
+                if pidfds:
+                    ready, _, _ = select.select(pidfds, [], [], wait_time)
+                    if ready:
+                        return True
+                else:
+                    time.sleep(wait_time)
+            return True
+        finally:
+            for fd in pidfds:
+                os.close(fd)
+
+    def stop_all(self):
+        super(LocalBackend, self).stop_all()
+        # Suspended jobs would otherwise never terminate
+        for trial_id in list(self._suspended_trials.keys()):
+            self._kill_suspended_trial(trial_id)
+
     def stdout(self, trial_id: int) -> list[str]:
         with open(self.trial_path(trial_id=trial_id) / "std.out", "r") as f:
             return f.readlines()
@@ -0,0 +1,90 @@
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from syne_tune.util import dump_json_with_numpy
+
+
+class MetricsHistory:
+    """
+    List of metrics reported by a trial, of which only the most recent
+    entries are kept in memory. Once more than ``max_in_memory`` entries are
+    held, the older ones are spilled to an append-only file at ``path`` (one
+    JSON line per entry), so that memory does not grow with the number of
+    results reported.
+
+    Supports the list operations used by trial backends: :meth:`append`,
+    :meth:`extend`, ``len``, iteration, and indexing or slicing w.r.t. all
+    entries reported so far. Accessing recent entries (e.g., ``history[-1]``
+    or ``history[num_seen:]``) is served from memory, spilled entries are read
+    back from ``path``.
+
+    :param path: File to which older entries are spilled. Created when
+        entries are spilled for the first time
+    :param max_in_memory: Maximum number of entries kept in memory, must be
+        positive
+    """
+
+    def __init__(self, path: str | Path, max_in_memory: int):
+        assert max_in_memory >= 1, "max_in_memory must be positive"
+        self.path = Path(path)
+        self.max_in_memory = max_in_memory
+        self._num_spilled = 0
+        self._in_memory = []
+
+    def __len__(self) -> int:
+        return self._num_spilled + len(self._in_memory)
+
+    def append(self, metric: dict[str, Any]):
+        self._in_memory.append(metric)
+        self._spill_if_needed()
+
+    def extend(self, metrics: list[dict[str, Any]]):
+        self._in_memory.extend(metrics)
+        self._spill_if_needed()
+
+    def _spill_if_needed(self):
+        if len(self._in_memory) > self.max_in_memory:
+            # We spill down to half of the maximum, so that the cost of writing
+            # is amortized over many appends
+            num_to_spill = len(self._in_memory) - (self.max_in_memory + 1) // 2
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a") as f:
+                for metric in self._in_memory[:num_to_spill]:
+                    f.write(dump_json_with_numpy(metric) + "\n")
+            self._in_memory = self._in_memory[num_to_spill:]
+            self._num_spilled += num_to_spill
+
+    def _iter_spilled(self) -> Iterator[dict[str, Any]]:
+        if self._num_spilled > 0:
+            with open(self.path, "r") as f:
+                for _, line in zip(range(self._num_spilled), f):
+                    yield json.loads(line)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        yield from self._iter_spilled()
+        yield from self._in_memory
+
+    def __getitem__(self, index: int | slice) -> Any:
+        num_spilled = self._num_spilled
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1 and start >= num_spilled:
+                return self._in_memory[start - num_spilled : stop - num_spilled]
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("MetricsHistory index out of range")
+        if index >= num_spilled:
+            return self._in_memory[index - num_spilled]
+        for pos, metric in enumerate(self._iter_spilled()):
+            if pos == index:
+                return metric
+
+    def __repr__(self) -> str:
+        return (
+            f"MetricsHistory(path={self.path}, num_spilled={self._num_spilled}, "
+            f"in_memory={self._in_memory})"
+        )
@@ -1,5 +1,6 @@
 import hashlib
 import logging
+import os
 import types
 from pathlib import Path
 from typing import Any
@@ -7,10 +8,20 @@ from collections.abc import Callable
 
 import dill
 
-from syne_tune.backend import LocalBackend
+from syne_tune.backend.local_backend import LocalBackend
+from syne_tune.backend.worker_pool_backend import (
+    DEFAULT_PRELOAD_MODULES,
+    redirect_output,
+    start_in_fork_server,
+)
 from syne_tune.config_space import config_space_to_json_dict
 from syne_tune.util import dump_json_with_numpy
 
+logger = logging.getLogger(__name__)
+
+
+EXECUTION_MODES = ("subprocess", "forkserver")
+
 
 def file_md5(filename: str) -> str:
     hash_md5 = hashlib.md5()
@@ -20,6 +31,24 @@ def file_md5(filename: str) -> str:
     return hash_md5.hexdigest()
 
 
+def _call_tune_function(
+    tune_function_dill: bytes,
+    hps: dict[str, Any],
+    env: dict[str, Any],
+    trial_path: str,
+):
+    """
+    Calls the serialized function with configuration ``hps`` in a process
+    forked from the fork server.
+    """
+    os.environ.clear()
+    os.environ.update(env)
+    redirect_output(trial_path)
+    logging.getLogger().setLevel(logging.INFO)
+    tune_function = dill.loads(tune_function_dill)
+    tune_function(**hps)
+
+
 class PythonBackend(LocalBackend):
     """
     A backend that supports the tuning of Python functions (if you rather want to
@@ -63,6 +92,20 @@ class PythonBackend(LocalBackend):
         be performed inside the function body.
     :param config_space: Configuration space corresponding to arguments of
         ``tune_function``
+    :param execution_mode: If "subprocess" (default), each trial runs
+        ``python_entrypoint.py`` in a new interpreter, which loads the
+        serialized function and parses the configuration from the command
+        line. If "forkserver", each trial runs in a child forked from a fork
+        server (see
+        :func:`~syne_tune.backend.worker_pool_backend.start_in_fork_server`),
+        which calls ``tune_function`` directly with the configuration. Metrics
+        are then passed back via a metrics file (see ``use_metrics_file`` in
+        :class:`~syne_tune.backend.LocalBackend`). This avoids the startup cost
+        of a new interpreter, which dominates the runtime of cheap functions
+    :param preload_modules: Only for ``execution_mode == "forkserver"``.
+        Modules imported by the fork server, add the heavy modules imported by
+        ``tune_function``. Defaults to
+        :const:`~syne_tune.backend.worker_pool_backend.DEFAULT_PRELOAD_MODULES`
     """
 
     def __init__(
@@ -71,14 +114,25 @@ class PythonBackend(LocalBackend):
         config_space: dict[str, object],
         rotate_gpus: bool = True,
         delete_checkpoints: bool = False,
+        execution_mode: str = "subprocess",
+        preload_modules: list[str] | None = None,
     ):
+        assert execution_mode in EXECUTION_MODES, (
+            f"execution_mode = {execution_mode} not supported, must be in "
+            f"{EXECUTION_MODES}"
+        )
         super(PythonBackend, self).__init__(
             entry_point=str(Path(__file__).parent / "python_entrypoint.py"),
             rotate_gpus=rotate_gpus,
             delete_checkpoints=delete_checkpoints,
             pass_args_as_json=False,
+            use_metrics_file=execution_mode == "forkserver",
         )
         self.config_space = config_space
+        self.execution_mode = execution_mode
+        if preload_modules is None:
+            preload_modules = DEFAULT_PRELOAD_MODULES
+        self.preload_modules = preload_modules
         # save function without reference to global variables or modules
         self.tune_function = types.FunctionType(tune_function.__code__, {})
 
@@ -96,6 +150,10 @@ class PythonBackend(LocalBackend):
             )
 
     def _schedule(self, trial_id: int, config: dict[str, Any]):
+        if self.execution_mode == "forkserver":
+            # Function is passed to the forked process directly
+            super(PythonBackend, self)._schedule(trial_id=trial_id, config=config)
+            return
         if not (self.tune_function_path / "tune_function.dill").exists():
             self.save_tune_function(self.tune_function)
         config = config.copy()
@@ -107,6 +165,27 @@ class PythonBackend(LocalBackend):
         )
         super(PythonBackend, self)._schedule(trial_id=trial_id, config=config)
 
+    def _start_process(
+        self, trial_id: int, config_for_args: dict[str, Any], env: dict[str, Any]
+    ):
+        if self.execution_mode != "forkserver":
+            return super(PythonBackend, self)._start_process(
+                trial_id, config_for_args, env
+            )
+        hps = {k: v for k, v in config_for_args.items() if k in self.config_space}
+        logger.info(f"calling tune_function in forked process with: {hps}")
+        return start_in_fork_server(
+            target=_call_tune_function,
+            args=(
+                dill.dumps(self.tune_function),
+                hps,
+                env,
+                str(self.trial_path(trial_id)),
+            ),
+            name=f"syne-tune-trial-{trial_id}",
+            preload_modules=self.preload_modules,
+        )
+
     def save_tune_function(self, tune_function):
         self.tune_function_path.mkdir(parents=True, exist_ok=True)
         with open(self.tune_function_path / "tune_function.dill", "wb") as file:
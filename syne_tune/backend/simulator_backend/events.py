@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from collections import Counter
 from typing import Any
 import heapq
 
@@ -66,6 +67,13 @@ class SimulatorState:
     break ties. When an event is added, the ``cnt`` value is taken from
     ``events_added``. This means that ties are broken first_in_first_out.
 
+    Events are removed lazily by :meth:`remove_events`, which only records the
+    value of ``events_added`` for the trial. Events of this trial with smaller
+    ``cnt`` are skipped when they reach the top of the heap. Once more than
+    half of the entries in ``event_heap`` are removed events, the heap is
+    compacted. This keeps :meth:`push`, :meth:`remove_events` and
+    :meth:`next_until` at amortized ``O(log n)``.
+
     """
 
     def __init__(self, event_heap: EventHeapType | None = None, events_added: int = 0):
@@ -73,6 +81,11 @@ class SimulatorState:
             event_heap = []
         self.event_heap = event_heap
         self.events_added = events_added
+        # Events of trial ``trial_id`` with ``cnt`` smaller than
+        # ``_removed_before[trial_id]`` have been removed
+        self._removed_before = dict()
+        self._num_events_for_trial = Counter(elem[2].trial_id for elem in event_heap)
+        self._num_removed_in_heap = 0
 
     def push(self, event: Event, event_time: float):
         """
@@ -83,6 +96,11 @@ class SimulatorState:
         """
         heapq.heappush(self.event_heap, (event_time, self.events_added, event))
         self.events_added += 1
+        self._num_events_for_trial[event.trial_id] += 1
+
+    def _is_removed(self, elem: tuple[float, int, Event]) -> bool:
+        _, cnt, event = elem
+        return cnt < self._removed_before.get(event.trial_id, 0)
 
     def remove_events(self, trial_id: int):
         """
@@ -90,10 +108,18 @@ class SimulatorState:
 
         :param trial_id:
         """
+        self._removed_before[trial_id] = self.events_added
+        self._num_removed_in_heap += self._num_events_for_trial.pop(trial_id, 0)
+        if self._num_removed_in_heap > len(self.event_heap) // 2:
+            self._compact()
+
+    def _compact(self):
         self.event_heap = [
-            elem for elem in self.event_heap if elem[2].trial_id != trial_id
+            elem for elem in self.event_heap if not self._is_removed(elem)
         ]
         heapq.heapify(self.event_heap)
+        self._removed_before = dict()
+        self._num_removed_in_heap = 0
 
     def next_until(self, time_until: float) -> tuple[float, Event] | None:
         """
@@ -103,10 +129,14 @@ class SimulatorState:
         :param time_until:
         :return:
         """
+        while self.event_heap and self._is_removed(self.event_heap[0]):
+            heapq.heappop(self.event_heap)
+            self._num_removed_in_heap -= 1
         result = None
         if self.event_heap:
             top_time, _, top_event = self.event_heap[0]
             if top_time <= time_until:
                 heapq.heappop(self.event_heap)
+                self._num_events_for_trial[top_event.trial_id] -= 1
                 result = (top_time, top_event)
         return result
@@ -4,8 +4,12 @@ from datetime import timedelta
 import copy
 from dataclasses import dataclass
 import subprocess
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
 
-from syne_tune.report import retrieve
 from syne_tune.backend.trial_backend import (
     TrialAndStatusInformation,
     TrialIdAndResultList,
@@ -23,6 +27,7 @@ from syne_tune.backend.simulator_backend.events import (
 )
 from syne_tune.constants import (
     ST_CHECKPOINT_DIR,
+    ST_METRICS_FILENAME,
     ST_WORKER_TIMESTAMP,
     ST_TUNER_TIME,
     TUNER_DEFAULT_SLEEP_TIME,
@@ -102,7 +107,9 @@ class SimulatorBackend(LocalBackend):
        convenient simulations, use
        ::class:`~syne_tune.blackbox_repository.BlackboxRepositoryBackend` after
        bringing your tabulated data or surrogate benchmark into the blackbox
-       repository.
+       repository. It is an :class:`InMemorySimulatorBackend`, which does not
+       touch the filesystem for every trial. If results are computed by a
+       Python function, use :class:`CallableSimulatorBackend`.
 
     :param entry_point: Python main file to be tuned (this should
         return all results directly, and report elapsed time in the
@@ -113,6 +120,8 @@ class SimulatorBackend(LocalBackend):
         :meth:`~syne_tune.Tuner.run`. This information is needed in
         :class:`~syne_tune.backend.simulator_backend.SimulatorCallback`.
         Defaults to :const:`~syne_tune.tuner.DEFAULT_SLEEP_TIME`
+    :param use_metrics_file: See
+        :class:`~syne_tune.backend.LocalBackend`. Defaults to ``False``
     """
 
     def __init__(
@@ -122,8 +131,13 @@ class SimulatorBackend(LocalBackend):
         simulator_config: SimulatorConfig | None = None,
         tuner_sleep_time: float = TUNER_DEFAULT_SLEEP_TIME,
         debug_time_attr: str | None = None,
+        use_metrics_file: bool = False,
     ):
-        super().__init__(entry_point=entry_point, rotate_gpus=False)
+        super().__init__(
+            entry_point=entry_point,
+            rotate_gpus=False,
+            use_metrics_file=use_metrics_file,
+        )
         self.elapsed_time_attr = elapsed_time_attr
         if simulator_config is None:
             self.simulator_config = SimulatorConfig()
@@ -260,7 +274,9 @@ class SimulatorBackend(LocalBackend):
             # No results reported for the trial. This can happen if
             # the trial failed
             self._trial_dict[trial_id] = trial_result.add_results(
-                metrics=[], status=status, training_end_time=training_end_time
+                metrics=self._new_metrics_list(trial_id),
+                status=status,
+                training_end_time=training_end_time,
             )
         if trial_id in self._busy_trial_ids:
             self._busy_trial_ids.remove(trial_id)
@@ -303,8 +319,10 @@ class SimulatorBackend(LocalBackend):
         if isinstance(trial_result, TrialResult):
             trial_result.metrics.append(result)
         else:
+            metrics = self._new_metrics_list(trial_id)
+            metrics.append(result)
             self._trial_dict[trial_id] = trial_result.add_results(
-                metrics=[result],
+                metrics=metrics,
                 status=Status.in_progress,
                 training_end_time=None,
             )
@@ -482,6 +500,7 @@ class SimulatorBackend(LocalBackend):
         dump_json_with_numpy(config, trial_path / "config.json")
         cmd = f"python {self.entry_point} {config_str}"
         env = dict(os.environ)
+        self._set_metrics_file_env(trial_id, env)
         logger.info(f"running script with command: {cmd}")
         with open(trial_path / "std.out", "a") as stdout:
             with open(trial_path / "std.err", "a") as stderr:
@@ -494,9 +513,9 @@ class SimulatorBackend(LocalBackend):
             status = Status.failed
         # Read all reported results
         # Results are also read if the process failed
-        # Note that ``retrieve`` returns all results, even those already
-        # received before (in case the trial is resumed at least once).
-        all_results = retrieve(log_lines=self.stdout(trial_id=trial_id))
+        # Note that ``_retrieve_metrics`` returns all results, even those
+        # already received before (in case the trial is resumed at least once).
+        all_results = self._retrieve_metrics(trial_id, close=True)
         num_already_before = self._last_metric_seen_index[trial_id]
         assert num_already_before <= len(all_results), (
             f"Found {len(all_results)} total results, but have already "
@@ -508,3 +527,162 @@ class SimulatorBackend(LocalBackend):
     def busy_trial_ids(self) -> list[tuple[int, str]]:
         self._process_events_until_now()
         return [(trial_id, Status.in_progress) for trial_id in self._busy_trial_ids]
+
+
+class InMemorySimulatorBackend(SimulatorBackend):
+    """
+    Simulator backend for which :meth:`_run_job_and_collect_results` obtains
+    results without running a script, for example by looking them up in a
+    table or querying a surrogate model. Such simulations are dominated by
+    the tuning loop itself, so no per-trial work is done on the filesystem:
+    checkpoints are not copied or deleted, and there are no logs. Subclasses
+    which simulate checkpointing need to override :meth:`copy_checkpoint` and
+    :meth:`delete_checkpoint`.
+
+    If ``record_to_disk == True``, configuration and reported results of all
+    trials are written to ``config.json`` and
+    :const:`~syne_tune.constants.ST_METRICS_FILENAME` in their trial
+    directories at the end of the experiment (in :meth:`stop_all`), as
+    :class:`~syne_tune.backend.LocalBackend` would do. This can be useful for
+    inspecting individual trials, but is not needed for the results of the
+    experiment, which are recorded by :class:`~syne_tune.Tuner`.
+
+    :param elapsed_time_attr: See :class:`SimulatorBackend`
+    :param record_to_disk: See above. Defaults to ``False``
+    :param simulatorbackend_kwargs: Further arguments passed to
+        :class:`SimulatorBackend`
+    """
+
+    def __init__(
+        self,
+        elapsed_time_attr: str,
+        record_to_disk: bool = False,
+        **simulatorbackend_kwargs,
+    ):
+        super().__init__(
+            entry_point=str(Path(__file__)),  # Dummy value
+            elapsed_time_attr=elapsed_time_attr,
+            **simulatorbackend_kwargs,
+        )
+        self.record_to_disk = record_to_disk
+
+    def _run_job_and_collect_results(
+        self, trial_id: int, config: dict | None = None
+    ) -> (str, list[dict]):
+        raise NotImplementedError
+
+    def copy_checkpoint(self, src_trial_id: int, tgt_trial_id: int):
+        pass
+
+    def delete_checkpoint(self, trial_id: int):
+        pass
+
+    def stdout(self, trial_id: int) -> list[str]:
+        return []
+
+    def stderr(self, trial_id: int) -> list[str]:
+        return []
+
+    def stop_all(self):
+        super().stop_all()
+        if self.record_to_disk:
+            self._record_trials()
+
+    def _record_trials(self):
+        for trial_id in self.trial_ids:
+            trial = self._trial_dict[trial_id]
+            trial_path = self.trial_path(trial_id)
+            os.makedirs(trial_path, exist_ok=True)
+            dump_json_with_numpy(trial.config, trial_path / "config.json")
+            metrics = trial.metrics if isinstance(trial, TrialResult) else []
+            with open(trial_path / ST_METRICS_FILENAME, "w") as f:
+                for metric in metrics:
+                    f.write(dump_json_with_numpy(metric) + "\n")
+
+
+class CallableSimulatorBackend(InMemorySimulatorBackend):
+    """
+    Simulator backend which obtains the results of a trial by calling
+    ``train_fn(config)``, instead of running a script in a new Python
+    interpreter. ``train_fn`` returns the list of all results the trial
+    reports, each of which has to contain the time since the start of the
+    trial in ``elapsed_time_attr``. These are placed on the simulated
+    timeline in the same way as by :class:`SimulatorBackend`. For functions
+    which look up or compute learning curves, this is much faster than
+    starting a process for every trial.
+
+    By default, ``train_fn`` is called in the tuning process. If
+    ``use_process_pool == True``, it is called in a worker process, which is
+    started with the first trial and reused for all others. This protects
+    the tuning process from crashes or memory leaks of ``train_fn``, which
+    must be picklable then (e.g., a function defined at the top level of a
+    module). In both cases, a trial fails if ``train_fn`` raises an
+    exception.
+
+    If a trial is resumed, ``train_fn`` is called again, and the elapsed time
+    in its results is relative to the resume (see :class:`SimulatorBackend`).
+
+    :param train_fn: Function mapping a configuration to the list of results
+        reported for it
+    :param elapsed_time_attr: See :class:`SimulatorBackend`
+    :param use_process_pool: See above. Defaults to ``False``
+    :param simulatorbackend_kwargs: Further arguments passed to
+        :class:`InMemorySimulatorBackend`
+    """
+
+    def __init__(
+        self,
+        train_fn: Callable[[dict[str, Any]], list[dict[str, Any]]],
+        elapsed_time_attr: str,
+        use_process_pool: bool = False,
+        **simulatorbackend_kwargs,
+    ):
+        super().__init__(
+            elapsed_time_attr=elapsed_time_attr,
+            **simulatorbackend_kwargs,
+        )
+        self.train_fn = train_fn
+        self.use_process_pool = use_process_pool
+        self._process_pool = None
+
+    def __getstate__(self):
+        # Worker process is not serialized
+        state = self.__dict__.copy()
+        state["_process_pool"] = None
+        return state
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=1)
+        return self._process_pool
+
+    def _run_job_and_collect_results(
+        self, trial_id: int, config: dict | None = None
+    ) -> (str, list[dict]):
+        assert (
+            trial_id in self._trial_dict
+        ), f"Trial with trial_id = {trial_id} not registered with backend"
+        if config is None:
+            config = self._trial_dict[trial_id].config
+        try:
+            if self.use_process_pool:
+                results = self._executor().submit(self.train_fn, dict(config)).result()
+            else:
+                results = self.train_fn(dict(config))
+            status = Status.completed
+        except Exception as ex:
+            logger.error(f"train_fn failed for trial_id = {trial_id}: {ex}")
+            if isinstance(ex, BrokenProcessPool):
+                # Worker process died, a new one is started for the next trial.
+                # Resources of the broken pool are released without waiting
+                self._process_pool.shutdown(wait=False)
+                self._process_pool = None
+            results = []
+            status = Status.failed
+        return status, [dict(result) for result in results]
+
+    def stop_all(self):
+        super().stop_all()
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
@@ -1,6 +1,7 @@
 import logging
 
 from syne_tune.results_callback import StoreResultsCallback, ExtraResultsComposer
+from syne_tune.backend.async_trial_backend import ThreadedTrialBackend
 from syne_tune.backend.simulator_backend.simulator_backend import SimulatorBackend
 from syne_tune import Tuner
 from syne_tune.constants import ST_TUNER_TIME
@@ -89,6 +90,9 @@ class SimulatorCallback(StoreResultsCallback):
             )
             tuner.sleep_time = 0
         backend = tuner.trial_backend
+        if isinstance(backend, ThreadedTrialBackend):
+            # Used with :class:`~syne_tune.async_tuner.AsyncTuner`
+            backend = backend.trial_backend
         assert isinstance(
             backend, SimulatorBackend
         ), "Use SimulatorCallback only together with SimulatorBackend"
@@ -4,7 +4,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 import logging
+import time
 
+from syne_tune.backend.metrics_history import MetricsHistory
 from syne_tune.backend.trial_status import TrialResult, Trial, Status
 from syne_tune.constants import ST_WORKER_TIMESTAMP
 
@@ -55,6 +57,9 @@ class TrialBackend:
 
         # index of the last metric that was seen for each trial-id
         self._last_metric_seen_index = defaultdict(lambda: 0)
+        # Set by :meth:`set_metrics_spill`
+        self._metrics_spill_path = None
+        self._max_metrics_in_memory = None
 
     def start_trial(
         self, config: dict[str, Any], checkpoint_trial_id: int | None = None
@@ -79,12 +84,94 @@ class TrialBackend:
             config=config,
             creation_time=now,
             status=Status.in_progress,
-            metrics=[],
+            metrics=self._new_metrics_list(trial_id),
         )
         self._trial_dict[trial_id] = trial
 
         return trial
 
+    def restore_trial(
+        self,
+        trial_id: int,
+        status: str,
+        config: dict[str, Any] | None = None,
+        creation_time: datetime | None = None,
+    ) -> TrialResult:
+        """
+        Registers trial ``trial_id`` with status ``status``, without
+        scheduling, stopping or pausing any job. Used by
+        :meth:`~syne_tune.Tuner.load` when replaying the journal of a tuner,
+        so that the backend knows about trials which were started, or whose
+        status changed, after the last snapshot.
+
+        :param trial_id: ID of trial. If the trial is not known, it must be
+            the next trial ID
+        :param status: New status of trial
+        :param config: Configuration of trial. Must be given if the trial is
+            not known
+        :param creation_time: Creation time of trial, if it is not known.
+            Defaults to now
+        :return: Information for trial
+        """
+        trial = self._trial_dict.get(trial_id)
+        if trial is None:
+            assert trial_id == len(self.trial_ids), (
+                f"Cannot restore trial_id {trial_id}, next trial_id is "
+                f"{len(self.trial_ids)}"
+            )
+            self.trial_ids.append(trial_id)
+            trial = Trial(
+                trial_id=trial_id,
+                config=config,
+                creation_time=datetime.now()
+                if creation_time is None
+                else creation_time,
+            )
+        if not isinstance(trial, TrialResult):
+            trial = trial.add_results(
+                metrics=self._new_metrics_list(trial_id),
+                status=status,
+                training_end_time=None,
+            )
+        if config is not None:
+            trial.config = config
+        trial.status = status
+        self._trial_dict[trial_id] = trial
+        return trial
+
+    def set_metrics_spill(self, path: str | Path, max_metrics_in_memory: int):
+        """
+        Limits the memory used for metrics reported by trials. For each trial,
+        at most ``max_metrics_in_memory`` of the most recent metrics are kept
+        in memory, older ones are spilled to ``{path}/{trial_id}.ndjson``. Only
+        applies to trials started after this call.
+
+        :param path: Directory to which metrics are spilled
+        :param max_metrics_in_memory: Maximum number of metrics per trial kept
+            in memory
+        """
+        self._metrics_spill_path = Path(path)
+        self._max_metrics_in_memory = max_metrics_in_memory
+
+    def _new_metrics_list(
+        self, trial_id: int, kind: str | None = None
+    ) -> list[dict] | MetricsHistory:
+        """
+        :param trial_id: ID of trial
+        :param kind: Must be given if a backend keeps more than one list for
+            a trial, so that each spills to its own file
+            ``{path}/{trial_id}.{kind}.ndjson``. Defaults to ``None``
+        :return: Empty list to store metrics reported by trial ``trial_id``,
+            spilling to disk if :meth:`set_metrics_spill` was called
+        """
+        if self._max_metrics_in_memory is None:
+            return []
+        filename = f"{trial_id}.ndjson" if kind is None else f"{trial_id}.{kind}.ndjson"
+        return MetricsHistory(
+            path=self._metrics_spill_path / filename,
+            max_in_memory=self._max_metrics_in_memory,
+        )
+
     def copy_checkpoint(self, src_trial_id: int, tgt_trial_id: int):
         """
         Copy the checkpoint folder from one trial to the other.
@@ -281,6 +368,32 @@ class TrialBackend:
         """
         raise NotImplementedError
 
+    def max_concurrent_trials(self) -> int | None:
+        """
+        Backends which account for resources required by trials may restrict
+        the number of trials running at the same time, independent of the
+        number of workers used by :class:`~syne_tune.Tuner`.
+
+        :return: Maximum number of trials which can run at the same time, or
+            ``None`` if there is no limit (default)
+        """
+        return None
+
+    def wait_for_events(self, timeout: float) -> bool:
+        """Blocks until something happened which the tuner has to react to
+        (e.g., a trial reported a new result or its job finished), or until
+        ``timeout`` seconds have passed.
+
+        This is called by :class:`~syne_tune.Tuner` when all workers are busy.
+        The default implementation does not detect events and just sleeps for
+        ``timeout`` seconds.
+
+        :param timeout: Maximum time to wait (in seconds)
+        :return: ``True`` if an event was detected before ``timeout``
+        """
+        time.sleep(timeout)
+        return False
+
     def stdout(self, trial_id: int) -> list[str]:
         """Fetch ``stdout`` log for trial
 
@@ -0,0 +1,209 @@
+import logging
+import multiprocessing
+import os
+import runpy
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+from collections.abc import Callable
+
+from syne_tune.backend.local_backend import (
+    LocalBackend,
+    DEFAULT_EVENT_POLL_INTERVAL,
+)
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_PRELOAD_MODULES = ["syne_tune.report"]
+
+
+def redirect_output(trial_path: str):
+    """
+    Redirects ``stdout`` and ``stderr`` of the current process (including
+    output of non-Python code) to ``std.out`` and ``std.err`` in
+    ``trial_path``, as done by :class:`~syne_tune.backend.LocalBackend` for its
+    subprocesses.
+
+    :param trial_path: Directory of trial
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    with open(Path(trial_path) / "std.out", "a") as stdout:
+        os.dup2(stdout.fileno(), sys.stdout.fileno())
+    with open(Path(trial_path) / "std.err", "a") as stderr:
+        os.dup2(stderr.fileno(), sys.stderr.fileno())
+
+
+def _run_entry_point(
+    entry_point: str,
+    args: list[str],
+    env: dict[str, Any],
+    trial_path: str,
+    cpus: list[int] | None = None,
+):
+    """
+    Runs ``entry_point`` as ``__main__`` in a process forked from the fork
+    server, with the same command line arguments, environment, output
+    files and CPU cores as :class:`~syne_tune.backend.LocalBackend` would use
+    for a new interpreter.
+    """
+    if cpus is not None:
+        os.sched_setaffinity(0, cpus)
+    os.environ.clear()
+    os.environ.update(env)
+    redirect_output(trial_path)
+    sys.argv = [entry_point] + args
+    sys.path.insert(0, str(Path(entry_point).parent))
+    runpy.run_path(entry_point, run_name="__main__")
+
+
+class ForkedProcess:
+    """
+    Handle of a job started by :class:`WorkerPoolBackend`, providing the part
+    of the :class:`subprocess.Popen` interface used by
+    :class:`~syne_tune.backend.LocalBackend`.
+
+    :param process: Process forked from the fork server
+    """
+
+    def __init__(self, process: multiprocessing.Process):
+        self._process = process
+        self.pid = process.pid
+        self.name = process.name
+        self.returncode = None
+
+    def poll(self) -> int | None:
+        if self.returncode is None and self._process is not None:
+            self.returncode = self._process.exitcode
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int:
+        if self._process is not None:
+            self._process.join(timeout)
+        returncode = self.poll()
+        if returncode is None:
+            # Process handle is not available after unpickling
+            raise subprocess.TimeoutExpired(cmd=self.name, timeout=timeout)
+        return returncode
+
+    def kill(self):
+        if self._process is not None:
+            self._process.kill()
+
+    def __getstate__(self):
+        # Process handles cannot be serialized
+        self.poll()
+        state = self.__dict__.copy()
+        state["_process"] = None
+        return state
+
+
+def start_in_fork_server(
+    target: Callable,
+    args: tuple,
+    name: str,
+    preload_modules: list[str],
+) -> ForkedProcess:
+    """
+    Runs ``target(*args)`` in a process forked from the fork server. The fork
+    server is started by the first call, importing ``preload_modules``. It is
+    shared by all backends in the same process, later values of
+    ``preload_modules`` have no effect.
+
+    :param target: Function to run, must be importable from its module
+    :param args: Arguments for ``target``, must be picklable
+    :param name: Name of the process
+    :param preload_modules: Modules imported by the fork server
+    :return: Handle of the process
+    """
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(preload_modules)
+    process = context.Process(target=target, args=args, name=name)
+    process.start()
+    return ForkedProcess(process)
+
+
+class WorkerPoolBackend(LocalBackend):
+    """
+    Version of :class:`~syne_tune.backend.LocalBackend` which avoids the
+    startup cost of a new Python interpreter for every trial (and every
+    resume of a trial). A fork server is started with the first trial, which
+    imports ``preload_modules``. The job of each trial then runs in a child
+    forked from this server, which inherits these imports. This pays off for
+    short trials, whose runtime would otherwise be dominated by starting the
+    interpreter and importing heavy modules (e.g., ``torch``).
+
+    The entry point is run as ``__main__``, with the same command line
+    arguments and environment variables as for
+    :class:`~syne_tune.backend.LocalBackend`. Pausing, stopping, and
+    detecting the end of a job work the same way. The job runs in a forked
+    process, so ``binary`` is not supported, and modules in
+    ``preload_modules`` must not initialize resources which cannot be shared
+    with forked children (e.g., CUDA). Note that
+    ``CUDA_VISIBLE_DEVICES`` is only set when the job starts, so GPU rotation
+    works as long as CUDA is initialized in the entry point. If
+    ``cpus_per_trial`` is given, the forked process is pinned to the cores of
+    its trial before the entry point is run.
+
+    The fork server is shared by all instances in the same process. Its
+    ``preload_modules`` are the ones of the instance starting the first trial.
+
+    Additional arguments on top of parent class
+    :class:`~syne_tune.backend.LocalBackend`:
+
+    :param preload_modules: Modules imported by the fork server. Defaults to
+        :const:`DEFAULT_PRELOAD_MODULES`. Add the heavy modules imported by
+        ``entry_point``
+    """
+
+    def __init__(
+        self,
+        entry_point: str,
+        delete_checkpoints: bool = False,
+        pass_args_as_json: bool = False,
+        rotate_gpus: bool = True,
+        num_gpus_per_trial: int = 1,
+        gpus_to_use: list[int] | None = None,
+        use_metrics_file: bool = False,
+        event_poll_interval: float = DEFAULT_EVENT_POLL_INTERVAL,
+        preload_modules: list[str] | None = None,
+        cpus_per_trial: int | None = None,
+    ):
+        super(WorkerPoolBackend, self).__init__(
+            entry_point=entry_point,
+            delete_checkpoints=delete_checkpoints,
+            pass_args_as_json=pass_args_as_json,
+            rotate_gpus=rotate_gpus,
+            num_gpus_per_trial=num_gpus_per_trial,
+            gpus_to_use=gpus_to_use,
+            use_metrics_file=use_metrics_file,
+            event_poll_interval=event_poll_interval,
+            cpus_per_trial=cpus_per_trial,
+        )
+        if preload_modules is None:
+            preload_modules = DEFAULT_PRELOAD_MODULES
+        self.preload_modules = preload_modules
+
+    def _start_process(
+        self, trial_id: int, config_for_args: dict[str, Any], env: dict[str, Any]
+    ) -> ForkedProcess:
+        entry_point = str(Path(self.entry_point).resolve())
+        config_str = self._command_line_args(config_for_args)
+        logger.info(f"running {entry_point} in forked process with: {config_str}")
+        return start_in_fork_server(
+            target=_run_entry_point,
+            args=(
+                entry_point,
+                config_str.split(" "),
+                env,
+                str(self.trial_path(trial_id)),
+                self._pin_cpus_at_start(trial_id),
+            ),
+            name=f"syne-tune-trial-{trial_id}",
+            preload_modules=self.preload_modules,
+        )
+
+    def __str__(self):
+        return f"worker pool entry_point {Path(self.entry_point).name}"
@@ -0,0 +1,176 @@
+import logging
+import os
+import sys
+import traceback
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import dill
+
+logger = logging.getLogger(__name__)
+
+
+def write_atomically(data: bytes, path: Path):
+    """
+    Writes ``data`` to a temporary file first, which then replaces ``path``,
+    so that a previous file at ``path`` remains valid if interrupted.
+
+    :param data: Content to be written
+    :param path: Path of file
+    """
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _dump_in_child_process(obj: Any, path: Path) -> int:
+    """
+    Forks a child process, which serializes its (copy-on-write) snapshot of
+    ``obj`` and writes it to ``path``.
+
+    :param obj: Object to be serialized with ``dill``
+    :param path: Path of file, see :func:`write_atomically`
+    :return: Process ID of the child, to be waited for
+    """
+    pid = os.fork()
+    if pid == 0:
+        exit_code = 1
+        try:
+            write_atomically(dill.dumps(obj), path)
+            exit_code = 0
+        except BaseException:
+            traceback.print_exc()
+            sys.stderr.flush()
+        finally:
+            # Skips cleanup of the parent process state (e.g., ``atexit``)
+            os._exit(exit_code)
+    return pid
+
+
+def _wait_for_child_process(pid: int):
+    _, status = os.waitpid(pid, 0)
+    exit_code = os.waitstatus_to_exitcode(status)
+    if exit_code != 0:
+        raise RuntimeError(
+            f"Process {pid} saving in background exited with code {exit_code}"
+        )
+
+
+class BackgroundSaver:
+    """
+    Writes serialized objects to files in the background. With :meth:`save`,
+    the caller serializes the object, so that it can continue to modify the
+    object while the (potentially large) result is written in a background
+    thread. With :meth:`dump`, the object is also serialized in the
+    background, by a forked child process. At most one save is in flight at
+    any time.
+    """
+
+    def __init__(self):
+        self._executor = None
+        self._future = None
+        self._on_success = None
+
+    def __getstate__(self):
+        # Threads cannot be serialized
+        return dict()
+
+    def __setstate__(self, state):
+        self.__init__()
+
+    def _reap(self, blocking: bool):
+        if not blocking and not self._future.done():
+            return  # Still running
+        future = self._future
+        on_success = self._on_success
+        self._future = None
+        self._on_success = None
+        try:
+            future.result()
+        except Exception as ex:
+            logger.warning(f"Saving in background failed: {ex}")
+            return
+        if on_success is not None:
+            on_success()
+
+    def busy(self) -> bool:
+        """
+        :return: Is a save still in flight?
+        """
+        if self._future is not None:
+            self._reap(blocking=False)
+        return self._future is not None
+
+    def save(
+        self,
+        data: bytes,
+        path: Path,
+        on_success: Callable[[], Any] | None = None,
+    ) -> bool:
+        """
+        Writes ``data`` to ``path`` in a background thread, unless a previous
+        save is still in flight.
+
+        :param data: Serialized object
+        :param path: Path of file to write to, see :func:`write_atomically`
+        :param on_success: Called in the calling thread once ``data`` has
+            been written successfully, from :meth:`busy` or :meth:`wait`
+        :return: Has the save been started?
+        """
+        if self.busy():
+            return False
+        self._submit(on_success, write_atomically, data, path)
+        return True
+
+    def dump(
+        self,
+        obj: Any,
+        path: Path,
+        on_success: Callable[[], Any] | None = None,
+    ) -> bool:
+        """
+        Serializes ``obj`` with ``dill`` and writes it to ``path``, unless a
+        previous save is still in flight. If ``os.fork`` is available, both
+        are done in a child process working on a copy-on-write snapshot of
+        ``obj``, so that the caller only pays for the fork. Otherwise, ``obj``
+        is serialized by the caller and written as in :meth:`save`.
+
+        :param obj: Object to be serialized
+        :param path: Path of file to write to, see :func:`write_atomically`
+        :param on_success: See :meth:`save`
+        :return: Has the save been started?
+        """
+        if not hasattr(os, "fork"):
+            return self.save(dill.dumps(obj), path, on_success=on_success)
+        if self.busy():
+            return False
+        pid = _dump_in_child_process(obj, path)
+        self._submit(on_success, _wait_for_child_process, pid)
+        return True
+
+    def _submit(self, on_success: Callable[[], Any] | None, func, *args):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="syne-tune-saver"
+            )
+        self._future = self._executor.submit(func, *args)
+        self._on_success = on_success
+
+    def wait(self):
+        """
+        Waits until the save in flight (if any) is done.
+        """
+        if self._future is not None:
+            self._reap(blocking=True)
+
+    def shutdown(self):
+        """
+        Waits for the save in flight (if any), and stops the background thread.
+        """
+        self.wait()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -360,7 +360,7 @@ def serialize(
     )
 
 
-def deserialize(path: str) -> dict[str, BlackboxTabular]:
+def deserialize(path: str, mmap_mode: str | None = None) -> dict[str, BlackboxTabular]:
     """
     Deserialize blackboxes contained in a path that were saved with :func:`serialize`
     above.
@@ -372,6 +372,10 @@ def deserialize(path: str) -> dict[str, BlackboxTabular]:
 
     :param path: a path that contains blackboxes that were saved with
         :func:`serialize`
+    :param mmap_mode: If given, objectives are memory-mapped with this mode
+        (see :func:`numpy.load`) instead of being read into memory, and the
+        blackboxes of all tasks are views into this map. With ``"r"``, several
+        processes loading the same blackbox share its memory
     :return: a dictionary from task name to blackbox
     """
     path = Path(path)
@@ -388,9 +392,9 @@ def deserialize(path: str) -> dict[str, BlackboxTabular]:
     with open(path / "fidelities_values.npy", "rb") as f:
         fidelity_values = np.load(f)
 
-    # possibly we could use memmap to avoid memory use or speed-up loading times
-    with open(path / "objectives_evaluations.npy", "rb") as f:
-        objectives_evaluations = np.load(f)
+    objectives_evaluations = np.load(
+        path / "objectives_evaluations.npy", mmap_mode=mmap_mode
+    )
 
     return {
         task: BlackboxTabular(
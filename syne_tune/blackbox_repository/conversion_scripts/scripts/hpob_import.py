@@ -356,12 +356,14 @@ def serialize(
     )
 
 
-def deserialize(path: str) -> dict[str, BlackboxTabular]:
+def deserialize(path: str, mmap_mode: str | None = None) -> dict[str, BlackboxTabular]:
     """
     Deserialize blackboxes contained in a path that were saved with ``serialize`` above.
     TODO: the API is currently dissonant with ``serialize``, ``deserialize`` for BlackboxOffline as ``serialize`` is there a member.
     A possible way to unify is to have serialize also be a free function for BlackboxOffline.
     :param path: a path that contains blackboxes that were saved with ``serialize``
+    :param mmap_mode: If given, objectives are memory-mapped with this mode
+        (see :func:`numpy.load`) instead of being read into memory
     :return: a dictionary from task name to blackbox
     """
     path = Path(path)
@@ -381,8 +383,9 @@ def deserialize(path: str) -> dict[str, BlackboxTabular]:
         with open(path / f"{task}-fidelity_values.npy", "rb") as f:
             fidelity_values = np.load(f)
 
-        with open(path / f"{task}-objectives_evaluations.npy", "rb") as f:
-            objectives_evaluations = np.load(f)
+        objectives_evaluations = np.load(
+            path / f"{task}-objectives_evaluations.npy", mmap_mode=mmap_mode
+        )
 
         bb_dict[task] = BlackboxTabular(
             hyperparameters=hyperparameters,
@@ -41,6 +41,7 @@ def load_blackbox(
     yahpo_kwargs: dict | None = None,
     local_files_only: bool = False,
     force_download: bool = False,
+    mmap_mode: str | None = None,
     **snapshot_download_kwargs,
 ) -> dict[str, Blackbox] | Blackbox:
     """
@@ -81,6 +82,10 @@ def load_blackbox(
         additional arguments to ``instantiate_yahpo``
     :param local_files_only: whether to use local files with no internet check on the Hub
     :param force_download: forces files to be downloaded
+    :param mmap_mode: If given, objectives of tabulated blackboxes are
+        memory-mapped with this mode (see :func:`numpy.load`) instead of being
+        read into memory. With ``"r"``, processes loading the same blackbox
+        share its memory
     :param snapshot_download_kwargs: keyword arguments for `snapshot_download` (other than local_files_only and force_download)
     :return: blackbox with the given name, download it if not present.
     """
@@ -108,13 +113,13 @@ def load_blackbox(
     # TODO avoid switch case of PD1 / HPO-B
     blackbox_path = repository_path / name
     if name.startswith("pd1"):
-        return deserialize_pd1(blackbox_path)
+        return deserialize_pd1(blackbox_path, mmap_mode=mmap_mode)
     elif name.startswith("hpob"):
-        return deserialize_hpob(blackbox_path)
+        return deserialize_hpob(blackbox_path, mmap_mode=mmap_mode)
     elif name.startswith("icml-deepar"):
-        return deserialize_hpob(blackbox_path)
+        return deserialize_hpob(blackbox_path, mmap_mode=mmap_mode)
     elif (blackbox_path / "hyperparameters.parquet").exists():
-        return deserialize_tabular(blackbox_path)
+        return deserialize_tabular(blackbox_path, mmap_mode=mmap_mode)
     else:
         return deserialize_offline(blackbox_path)
 
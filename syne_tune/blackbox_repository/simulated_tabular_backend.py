@@ -1,10 +1,11 @@
 import logging
-from pathlib import Path
 from typing import Any
 
 import numpy as np
 
-from syne_tune.backend.simulator_backend.simulator_backend import SimulatorBackend
+from syne_tune.backend.simulator_backend.simulator_backend import (
+    InMemorySimulatorBackend,
+)
 from syne_tune.backend.trial_status import Status
 from syne_tune.blackbox_repository import add_surrogate, load_blackbox
 from syne_tune.blackbox_repository.blackbox import Blackbox
@@ -19,7 +20,7 @@ from syne_tune.config_space import (
 logger = logging.getLogger(__name__)
 
 
-class _BlackboxSimulatorBackend(SimulatorBackend):
+class _BlackboxSimulatorBackend(InMemorySimulatorBackend):
     """
     Shared parent of :class:`BlackboxRepositoryBackend` and
     :class:`UserBlackboxBackend`, see comments of
@@ -35,7 +36,6 @@ class _BlackboxSimulatorBackend(SimulatorBackend):
         **simulatorbackend_kwargs,
     ):
         super().__init__(
-            entry_point=str(Path(__file__)),  # Dummy value
             elapsed_time_attr=elapsed_time_attr,
             **simulatorbackend_kwargs,
         )
@@ -66,6 +66,16 @@ class _BlackboxSimulatorBackend(SimulatorBackend):
             resource = int(result[time_attr])
             self._resource_paused_for_trial[trial_id] = resource
 
+    def copy_checkpoint(self, src_trial_id: int, tgt_trial_id: int):
+        # The simulated checkpoint of a trial is the resource level it has
+        # been paused at
+        resource = self._resource_paused_for_trial.get(src_trial_id)
+        if resource is not None:
+            self._resource_paused_for_trial[tgt_trial_id] = resource
+
+    def delete_checkpoint(self, trial_id: int):
+        self._resource_paused_for_trial.pop(trial_id, None)
+
     def _filter_config(self, config: dict[str, Any]) -> dict[str, Any]:
         config_space = self.blackbox.configuration_space
         return {k: v for k, v in config.items() if k in config_space}
@@ -265,8 +275,14 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
         space of the original blackbox is used. However, its numerical parameters
         have finite domains (categorical or ordinal), which is usually not what
         we want for a surrogate.
+    :param mmap_mode: If given, the objectives of a tabulated blackbox are
+        memory-mapped with this mode instead of being read into memory, see
+        :func:`~syne_tune.blackbox_repository.load_blackbox`. Use ``"r"`` to
+        share the memory of the blackbox between processes running
+        simulations in parallel
     :param simulatorbackend_kwargs: Additional arguments to parent
-        :class:`~syne_tune.backend.simulator_backend.SimulatorBackend`
+        :class:`~syne_tune.backend.simulator_backend.simulator_backend.InMemorySimulatorBackend`,
+        for example ``record_to_disk``
     """
 
     def __init__(
@@ -281,6 +297,7 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
         surrogate_kwargs: dict | None = None,
         add_surrogate_kwargs: dict | None = None,
         config_space_surrogate: dict | None = None,
+        mmap_mode: str | None = None,
         **simulatorbackend_kwargs,
     ):
         assert (
@@ -295,6 +312,7 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
         )
         self.blackbox_name = blackbox_name
         self.dataset = dataset
+        self._mmap_mode = mmap_mode
         self._blackbox = None
         if surrogate is not None:
             # makes sure the surrogate can be constructed
@@ -321,6 +339,7 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
             self._blackbox = load_blackbox(
                 self.blackbox_name,
                 yahpo_kwargs=self._surrogate_kwargs,
+                mmap_mode=self._mmap_mode,
             )
             if self.dataset is None:
                 assert not isinstance(self._blackbox, dict), (
@@ -356,6 +375,7 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
             "dataset": self.dataset,
             "surrogate": self._surrogate,
             "surrogate_kwargs": self._surrogate_kwargs,
+            "mmap_mode": self._mmap_mode,
         }
         if self._config_space_surrogate is not None:
             state["config_space_surrogate"] = config_space_to_json_dict(
@@ -376,6 +396,7 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
         self.dataset = state["dataset"]
         self._surrogate = state["surrogate"]
         self._surrogate_kwargs = state["surrogate_kwargs"]
+        self._mmap_mode = state.get("mmap_mode")
         self._blackbox = None
         if "config_space_surrogate" in state:
             self._config_space_surrogate = config_space_from_json_dict(
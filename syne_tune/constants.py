@@ -55,17 +55,38 @@ ST_REMOTE_UPLOAD_DIR_NAME = "tuner"
 ST_RESULTS_DATAFRAME_FILENAME = "results.csv.zip"
 """Name for results dataframe stored in ``StoreResultsCallback``"""  # pylint: disable=W0105
 
+ST_RESULTS_SEGMENTS_DIRNAME = "results_segments"
+"""Name for directory of results segments appended to by ``StoreResultsCallback``
+while tuning is running"""  # pylint: disable=W0105
+
+ST_METRICS_HISTORY_DIRNAME = "metrics_history"
+"""Name for directory to which trial backends spill metrics reported by trials,
+if ``max_results_in_memory`` is set in ``Tuner``"""  # pylint: disable=W0105
+
 ST_METADATA_FILENAME = "metadata.json"
 """Name for metadata file stored in ``Tuner``"""  # pylint: disable=W0105
 
 ST_TUNER_DILL_FILENAME = "tuner.dill"
 """Name for final tuner object file stored in ``Tuner``"""  # pylint: disable=W0105
 
+ST_PROFILE_FILENAME = "profile.json"
+"""Name for profile of the tuning loop stored in ``Tuner``, if ``profile`` is
+set"""  # pylint: disable=W0105
+
+ST_METRICS_FILENAME = "metrics.ndjson"
+"""Name for per-trial metrics file written by :class:`~syne_tune.Reporter`, if
+the metrics file channel is used"""  # pylint: disable=W0105
+
 ST_DATETIME_FORMAT = "%Y-%m-%d-%H-%M-%S"
 """Datetime format used in result path names"""  # pylint: disable=W0105
 
 TUNER_DEFAULT_SLEEP_TIME = 5.0
 """Default value for ``sleep_time``"""  # pylint: disable=W0105
 
+ST_METRICS_FILE_ENV_VAR = "ST_METRICS_FILE"
+"""Environment variable with path of a file. If set, :class:`~syne_tune.Reporter`
+appends reported metrics to this file as JSON lines, instead of printing them to
+stdout"""  # pylint: disable=W0105
+
 ST_METRIC_TAG = "tune-metric"
 """Tag for log lines used in :class:`~syne_tune.Reporter`"""  # pylint: disable=W0105
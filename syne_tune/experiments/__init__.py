@@ -1,6 +1,7 @@
 from syne_tune.experiments.experiment_result import (
     ExperimentResult,
     load_experiment,
+    load_results_dataframe,
     get_metadata,
     list_experiments,
     load_experiments_df,
@@ -10,6 +11,7 @@ from syne_tune.experiments.multiobjective import hypervolume_indicator_column_ge
 __all__ = [
     "ExperimentResult",
     "load_experiment",
+    "load_results_dataframe",
     "get_metadata",
     "list_experiments",
     "load_experiments_df",
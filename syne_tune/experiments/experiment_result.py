@@ -14,9 +14,11 @@ from syne_tune import Tuner
 from syne_tune.constants import (
     ST_METADATA_FILENAME,
     ST_RESULTS_DATAFRAME_FILENAME,
+    ST_RESULTS_SEGMENTS_DIRNAME,
     ST_TUNER_CREATION_TIMESTAMP,
     ST_TUNER_TIME,
 )
+from syne_tune.results_callback import load_results_segments
 from syne_tune.util import experiment_path, metric_name_mode
 
 logger = logging.getLogger(__name__)
@@ -217,6 +219,28 @@ class ExperimentResult:
         )
 
 
+def load_results_dataframe(
+    path: Path, usecols: list[str] | None = None
+) -> pd.DataFrame:
+    """
+    Loads the results of an experiment, written by
+    :class:`~syne_tune.results_callback.StoreResultsCallback`. Segments are
+    present while the experiment is running (or if it was interrupted), and
+    are more recent than the compacted results then.
+
+    :param path: Path of experiment
+    :param usecols: If given, only these columns are returned
+    :return: Results dataframe
+    """
+    results = load_results_segments(path / ST_RESULTS_SEGMENTS_DIRNAME)
+    if results is not None:
+        return results if usecols is None else results[usecols]
+    results_fname = ST_RESULTS_DATAFRAME_FILENAME
+    if not (path / results_fname).exists():
+        results_fname = results_fname[:-4]
+    return pd.read_csv(path / results_fname, usecols=usecols)
+
+
 def load_experiment(
     tuner_name: str,
     load_tuner: bool = False,
@@ -240,11 +264,7 @@ def load_experiment(
     except FileNotFoundError:
         metadata = None
     try:
-        results_fname = ST_RESULTS_DATAFRAME_FILENAME
-        if (path / results_fname).exists():
-            results = pd.read_csv(path / results_fname)
-        else:
-            results = pd.read_csv(path / results_fname[:-4])
+        results = load_results_dataframe(path)
     except Exception:
         results = None
     if load_tuner:
@@ -0,0 +1,58 @@
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+NUMA_NODES_PATH = Path("/sys/devices/system/node")
+
+
+def get_available_cpus() -> list[int]:
+    """
+    :return: Sorted list of CPU cores the current process may run on
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _parse_cpu_list(cpu_list: str) -> list[int]:
+    """
+    Parses lists of CPU cores in the format used by Linux (e.g., "0-3,8,10-11").
+    """
+    cpus = []
+    for part in cpu_list.strip().split(","):
+        if part:
+            if "-" in part:
+                first, last = part.split("-")
+                cpus.extend(range(int(first), int(last) + 1))
+            else:
+                cpus.append(int(part))
+    return cpus
+
+
+def get_numa_nodes(cpus: list[int]) -> list[list[int]]:
+    """
+    Groups CPU cores by NUMA node, if the topology is exposed by the system
+    (Linux). Otherwise, all cores are in a single group.
+
+    :param cpus: CPU cores to group
+    :return: List of non-empty groups of cores, one for each NUMA node
+    """
+    cpu_set = set(cpus)
+    nodes = []
+    try:
+        for node_path in sorted(NUMA_NODES_PATH.glob("node[0-9]*")):
+            node_cpus = _parse_cpu_list((node_path / "cpulist").read_text())
+            node_cpus = [cpu for cpu in node_cpus if cpu in cpu_set]
+            if node_cpus:
+                nodes.append(node_cpus)
+    except (OSError, ValueError) as ex:
+        logger.debug(f"Cannot read NUMA topology: {ex}")
+        nodes = []
+    covered = set(cpu for node in nodes for cpu in node)
+    if covered != cpu_set:
+        # Topology not exposed, or inconsistent
+        nodes = [sorted(cpu_set)]
+    return nodes
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from syne_tune.backend.trial_status import Trial
+from syne_tune.config_space import cast_config_values, postprocess_config
 
 logger = logging.getLogger(__name__)
 
@@ -146,6 +147,49 @@ class TrialScheduler:
         """
         raise NotImplementedError
 
+    def suggest_batch(self, num_suggestions: int) -> list[TrialSuggestion]:
+        """Returns several suggestions at once, used if several workers are
+        free at the same time
+
+        The default implementation calls :meth:`suggest` repeatedly.
+        Schedulers should override this method if their searcher can suggest
+        several configurations at the cost of one (e.g., by fitting a
+        surrogate model only once, see
+        :meth:`~syne_tune.optimizer.schedulers.searchers.BaseSearcher.suggest_batch`).
+
+        :param num_suggestions: Number of suggestions to return
+        :return: List of suggestions, see :meth:`suggest`. It has fewer than
+            ``num_suggestions`` entries if no further suggestions can be made
+        """
+        suggestions = []
+        for _ in range(num_suggestions):
+            suggestion = self.suggest()
+            if suggestion is None:
+                break
+            suggestions.append(suggestion)
+        return suggestions
+
+    @staticmethod
+    def _start_suggestions(
+        configs: list[dict[str, Any]], config_space: dict[str, Any]
+    ) -> list[TrialSuggestion]:
+        """Turns configurations returned by a searcher into suggestions for new
+        trials, shared by :meth:`suggest` and :meth:`suggest_batch` of
+        schedulers which start every trial from a searcher suggestion
+
+        :param configs: Configurations suggested by the searcher
+        :param config_space: Configuration space
+        :return: Suggestions to start a trial for each of ``configs``
+        """
+        return [
+            TrialSuggestion.start_suggestion(
+                postprocess_config(
+                    cast_config_values(config, config_space), config_space
+                )
+            )
+            for config in configs
+        ]
+
     def on_trial_add(self, trial: Trial):
         """Called when a new trial is added to the trial runner.
 
@@ -194,6 +238,13 @@ class TrialScheduler:
         """
         pass
 
+    def close(self):
+        """Releases resources held by the scheduler or its searcher, such as
+        background threads or processes. Called by the tuner at the end of
+        tuning.
+        """
+        pass
+
     def metadata(self) -> dict[str, Any]:
         """
         :return: Metadata for the scheduler
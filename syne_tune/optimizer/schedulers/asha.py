@@ -19,10 +19,8 @@ from syne_tune.optimizer.schedulers.multiobjective.multiobjective_priority impor
 )
 from syne_tune.util import dump_json_with_numpy
 from syne_tune.config_space import (
-    cast_config_values,
     config_space_to_json_dict,
     remove_constant_and_cast,
-    postprocess_config,
 )
 
 
@@ -126,12 +124,14 @@ class AsynchronousSuccessiveHalving(TrialScheduler):
 
     def suggest(self) -> TrialSuggestion | None:
         config = self.searcher.suggest()
-        if config is not None:
-            config = cast_config_values(config, self.config_space)
-            config = TrialSuggestion.start_suggestion(
-                postprocess_config(config, self.config_space)
-            )
-        return config
+        if config is None:
+            return None
+        return self._start_suggestions([config], self.config_space)[0]
+
+    def suggest_batch(self, num_suggestions: int) -> list[TrialSuggestion]:
+        return self._start_suggestions(
+            self.searcher.suggest_batch(num_suggestions), self.config_space
+        )
 
     def on_trial_add(self, trial: Trial):
         sizes = np.array([len(b.rungs) for b in self.brackets])
@@ -196,6 +196,9 @@ class AsynchronousSuccessiveHalving(TrialScheduler):
     def metric_mode(self) -> str:
         return "min" if self.do_minimize else "max"
 
+    def close(self):
+        self.searcher.close()
+
     def metadata(self) -> dict[str, Any]:
         """
         :return: Metadata for the scheduler
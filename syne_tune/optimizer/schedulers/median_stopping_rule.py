@@ -83,6 +83,9 @@ class MedianStoppingRule(TrialScheduler):
     def suggest(self) -> TrialSuggestion | None:
         return self.scheduler.suggest()
 
+    def suggest_batch(self, num_suggestions: int) -> list[TrialSuggestion]:
+        return self.scheduler.suggest_batch(num_suggestions)
+
     def on_trial_result(self, trial: Trial, result: dict) -> str:
         new_metric = result[self.metric] * self.metric_multiplier
 
@@ -127,6 +130,9 @@ class MedianStoppingRule(TrialScheduler):
             return True
         return False
 
+    def close(self):
+        self.scheduler.close()
+
     def metadata(self) -> dict[str, Any]:
         """
         :return: Metadata for the scheduler
@@ -139,14 +139,38 @@ class ExpectedHyperVolumeImprovement(BaseSearcher):
                 config_suggested = self._sample_next_candidate()
 
         if config_suggested is not None:
-            trial_id = len(self.trial_configs)
+            self._register_pending(config_suggested)
 
-            # register pending
-            self.pending_trials.add(trial_id)
+        return config_suggested
 
-            self.trial_configs[trial_id] = config_suggested
+    def suggest_batch(self, num_suggestions: int, **kwargs) -> list[dict]:
+        """
+        The GP is fitted only once, and the configurations not taken from
+        ``points_to_evaluate`` jointly maximize the batch (q > 1) acquisition
+        function.
+        """
+        configs = self._next_points_to_evaluate_batch(num_suggestions)
+        # Initial configurations are pending when sampling the remaining ones
+        for config in configs:
+            self._register_pending(config)
+        num_remaining = num_suggestions - len(configs)
+        if num_remaining > 0:
+            if self.objectives().shape[0] < self.num_minimum_observations:
+                new_configs = self._get_random_configs(num_remaining)
+            else:
+                new_configs = self._sample_next_candidates(num_remaining)
+            for config in new_configs:
+                self._register_pending(config)
+            configs.extend(new_configs)
+        return configs
 
-        return config_suggested
+    def _register_pending(self, config: dict):
+        trial_id = len(self.trial_configs)
+
+        # register pending
+        self.pending_trials.add(trial_id)
+
+        self.trial_configs[trial_id] = config
 
     def register_pending(
         self,
@@ -179,6 +203,9 @@ class ExpectedHyperVolumeImprovement(BaseSearcher):
             for k, v in self.config_space.items()
         }
 
+    def _get_random_configs(self, num_configs: int) -> list[dict]:
+        return [self._get_random_config() for _ in range(num_configs)]
+
     def _sample_next_candidate(self) -> dict | None:
         """
         :return: A next candidate to evaluate, if possible it is obtained by
@@ -186,6 +213,15 @@ class ExpectedHyperVolumeImprovement(BaseSearcher):
             of numerical difficulties with non PSD matrices, then the candidate
             is sampled at random.
         """
+        return self._sample_next_candidates(num_candidates=1)[0]
+
+    def _sample_next_candidates(self, num_candidates: int) -> list[dict]:
+        """
+        :param num_candidates: Number of candidates (``q``)
+        :return: Next candidates to evaluate, see
+            :meth:`_sample_next_candidate`. If ``num_candidates > 1``, they
+            jointly maximize the batch acquisition function
+        """
         try:
             X = np.array(self._config_to_feature_matrix(self._configs_with_results()))
             Y = Tensor(self.objectives())
@@ -234,26 +270,27 @@ class ExpectedHyperVolumeImprovement(BaseSearcher):
                     self.num_raw_samples, len(self._hp_ranges.get_ndarray_bounds())
                 )
                 acq_values = acq_func(X[:, None, :])  # warm up
-                best_idx = acq_values.argmax()
-                candidate = X[best_idx].reshape(1, -1)
+                # Best raw samples w.r.t. the acquisition function
+                best_idx = acq_values.argsort(descending=True)[:num_candidates]
+                candidates = X[best_idx].reshape(num_candidates, -1)
             elif self.optimization_strategy == "gradient":
-                candidate, acq_value = optimize_acqf(
+                candidates, acq_value = optimize_acqf(
                     acq_func,
                     bounds=self._get_gp_bounds(),
-                    q=1,
+                    q=num_candidates,
                     num_restarts=self.num_restarts,
                     raw_samples=self.num_raw_samples,
                 )
 
-            candidate = candidate.detach().numpy()[0]
-            return self._config_from_ndarray(candidate)
+            candidates = candidates.detach().numpy()
+            return [self._config_from_ndarray(candidate) for candidate in candidates]
 
         except NotPSDError as _:
             logging.warning("Chlolesky inversion failed, sampling randomly.")
-            return self._get_random_config()
+            return self._get_random_configs(num_candidates)
         except ModelFittingError as _:
             logging.warning("Botorch was unable to fit the model, sampling randomly.")
-            return self._get_random_config()
+            return self._get_random_configs(num_candidates)
 
     #        except:
     # BoTorch can raise different errors, easier to not try to catch them individually
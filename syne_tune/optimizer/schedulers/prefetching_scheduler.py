@@ -0,0 +1,285 @@
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from syne_tune.backend.trial_status import Trial
+from syne_tune.optimizer.scheduler import TrialScheduler, TrialSuggestion
+from syne_tune.optimizer.schedulers.remove_checkpoints import (
+    RemoveCheckpointsSchedulerMixin,
+)
+from syne_tune.optimizer.schedulers.searchers.model_fitting import (
+    AsyncModelFittingMixin,
+)
+from syne_tune.tuner_callback import TunerCallback
+from syne_tune.tuning_status import TuningStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PrefetchedSuggestion:
+    """
+    Suggestion computed ahead of time by :class:`PrefetchingScheduler`.
+
+    :param suggestion: Suggestion returned by the base scheduler, or ``None``
+        if it could not make one
+    :param num_results: Number of results reported to the scheduler when the
+        suggestion was computed
+    :param is_initial: Was the suggestion taken from ``points_to_evaluate``?
+        Such suggestions do not depend on results, so they are never stale
+    """
+
+    suggestion: TrialSuggestion | None
+    num_results: int
+    is_initial: bool = False
+
+
+class PrefetchingScheduler(TrialScheduler, RemoveCheckpointsSchedulerMixin):
+    """
+    Wraps a scheduler, so that suggestions are computed ahead of time in a
+    background thread, while all workers are busy. When a worker becomes free,
+    :meth:`suggest` returns a prefetched suggestion immediately, instead of
+    waiting for the base scheduler. This hides the latency of model-based
+    searchers (e.g., fitting a surrogate model and optimizing an acquisition
+    function), which may otherwise leave workers idle for several seconds.
+
+    Once a suggestion has been returned, up to ``num_prefetch`` further
+    suggestions are computed in the background. A prefetched suggestion does
+    not account for results reported after it was computed. If
+    ``max_results_before_refresh`` is given, prefetched suggestions are
+    discarded once this many results have been reported since, and a fresh
+    suggestion is computed instead. Note that the base scheduler is not
+    informed about discarded suggestions. This is fine for searchers which do
+    not keep track of configurations they suggested, but not for searchers
+    which do (e.g., to register pending evaluations), which is why discarding
+    is switched off by default. Suggestions taken from ``points_to_evaluate``
+    are never discarded.
+
+    The base scheduler is not thread-safe, so calls to it are serialized by a
+    lock: if results are reported while a suggestion is computed in the
+    background, :meth:`on_trial_result` waits until the computation is done.
+    If the searcher of the base scheduler fits its surrogate model in
+    :meth:`suggest` (``model_fitting="sync"``, see
+    :class:`~syne_tune.optimizer.schedulers.searchers.model_fitting.AsyncModelFittingMixin`),
+    the model is fitted in the background thread without holding the lock,
+    on a snapshot of the training data. It is fitted again if results were
+    reported in the meantime. Only the remaining work of :meth:`suggest`
+    (e.g., optimizing the acquisition function) is done under the lock. The
+    background thread is stopped by :meth:`close`, which the tuner calls
+    at the end of tuning.
+
+    Early checkpoint removal is supported if the base scheduler supports it
+    (see :class:`~syne_tune.optimizer.schedulers.remove_checkpoints.RemoveCheckpointsSchedulerMixin`).
+    Attributes not defined here are looked up in the base scheduler, but
+    ``isinstance`` checks for other capabilities (e.g.,
+    :class:`~syne_tune.optimizer.schedulers.multi_fidelity.MultiFidelitySchedulerMixin`)
+    fail for the wrapper.
+
+    .. code-block:: python
+
+       scheduler = PrefetchingScheduler(
+           base_scheduler=BORE(config_space, metric=metric),
+           num_prefetch=1,
+       )
+
+    :param base_scheduler: Scheduler to be wrapped
+    :param num_prefetch: Maximum number of suggestions computed ahead of time.
+        Defaults to 1
+    :param max_results_before_refresh: See above. Defaults to ``None``
+        (prefetched suggestions are never discarded)
+    """
+
+    def __init__(
+        self,
+        base_scheduler: TrialScheduler,
+        num_prefetch: int = 1,
+        max_results_before_refresh: int | None = None,
+    ):
+        super().__init__(random_seed=base_scheduler.random_seed)
+        assert num_prefetch >= 1, "num_prefetch must be positive"
+        assert (
+            max_results_before_refresh is None or max_results_before_refresh >= 1
+        ), "max_results_before_refresh must be positive"
+        self.base_scheduler = base_scheduler
+        self.num_prefetch = num_prefetch
+        self.max_results_before_refresh = max_results_before_refresh
+        self._num_results = 0
+        self._prefetched = deque()
+        self._lock = threading.RLock()
+        self._executor = None
+        self._future = None
+
+    def __getattr__(self, name: str):
+        # Guard against recursion if ``base_scheduler`` is not set yet (e.g.,
+        # during unpickling)
+        if name == "base_scheduler":
+            raise AttributeError(name)
+        return getattr(self.base_scheduler, name)
+
+    def __getstate__(self):
+        # Suggestion computed in the background (if any) is not serialized
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        state["_executor"] = None
+        state["_future"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def _num_points_to_evaluate(self) -> int:
+        searcher = getattr(self.base_scheduler, "searcher", None)
+        return len(getattr(searcher, "points_to_evaluate", []))
+
+    def _compute_suggestion(self) -> PrefetchedSuggestion:
+        with self._lock:
+            num_points_to_evaluate = self._num_points_to_evaluate()
+            suggestion = self.base_scheduler.suggest()
+            return PrefetchedSuggestion(
+                suggestion=suggestion,
+                num_results=self._num_results,
+                is_initial=self._num_points_to_evaluate() < num_points_to_evaluate,
+            )
+
+    def _is_stale(self, prefetched: PrefetchedSuggestion) -> bool:
+        return (
+            self.max_results_before_refresh is not None
+            and not prefetched.is_initial
+            and prefetched.suggestion is not None
+            and self._num_results - prefetched.num_results
+            >= self.max_results_before_refresh
+        )
+
+    def _prefetch(self):
+        """
+        Runs in the background thread, computes suggestions until
+        ``num_prefetch`` of them are available.
+        """
+        while True:
+            with self._lock:
+                if len(self._prefetched) >= self.num_prefetch:
+                    return
+            self._fit_model_without_lock()
+            with self._lock:
+                prefetched = self._compute_suggestion()
+                self._prefetched.append(prefetched)
+            if prefetched.suggestion is None:
+                return  # Base scheduler cannot make further suggestions
+
+    def _fit_model_without_lock(self):
+        """
+        Fits the surrogate model of the searcher of the base scheduler, if it
+        would otherwise be fitted in :meth:`suggest`. Only taking the snapshot
+        of the training data and setting the model are done under the lock.
+        """
+        searcher = getattr(self.base_scheduler, "searcher", None)
+        if not isinstance(searcher, AsyncModelFittingMixin):
+            return
+        while True:
+            with self._lock:
+                snapshot = searcher._model_fitting_snapshot()
+            if snapshot is None:
+                return  # Model is fitted on all observations
+            num_observations, data = snapshot
+            model = searcher._fit_model(data)
+            with self._lock:
+                searcher._set_fitted_model(model, num_observations)
+
+    def _start_prefetch(self):
+        if self._future is not None:
+            if not self._future.done():
+                return
+            # Raises exception if prefetching failed
+            self._future.result()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="syne-tune-prefetch"
+            )
+        self._future = self._executor.submit(self._prefetch)
+
+    def _wait_for_prefetch(self) -> bool:
+        """
+        :return: Was a computation running in the background?
+        """
+        future: Future | None = self._future
+        if future is None:
+            return False
+        self._future = None
+        # Raises exception if prefetching failed
+        future.result()
+        return True
+
+    def _next_prefetched(self) -> PrefetchedSuggestion | None:
+        while True:
+            with self._lock:
+                while self._prefetched:
+                    prefetched = self._prefetched.popleft()
+                    if not self._is_stale(prefetched):
+                        return prefetched
+                    logger.debug(
+                        f"Discarding prefetched suggestion {prefetched.suggestion}, "
+                        f"since {self._num_results - prefetched.num_results} "
+                        "results were reported after it was computed"
+                    )
+            if not self._wait_for_prefetch():
+                return None
+
+    def suggest(self) -> TrialSuggestion | None:
+        prefetched = self._next_prefetched()
+        if prefetched is None:
+            prefetched = self._compute_suggestion()
+        if prefetched.suggestion is not None:
+            self._start_prefetch()
+        return prefetched.suggestion
+
+    def on_trial_add(self, trial: Trial):
+        with self._lock:
+            self.base_scheduler.on_trial_add(trial)
+
+    def on_trial_error(self, trial: Trial):
+        with self._lock:
+            self.base_scheduler.on_trial_error(trial)
+
+    def on_trial_result(self, trial: Trial, result: dict[str, Any]) -> str:
+        with self._lock:
+            self._num_results += 1
+            return self.base_scheduler.on_trial_result(trial, result)
+
+    def on_trial_complete(self, trial: Trial, result: dict[str, Any]):
+        with self._lock:
+            self.base_scheduler.on_trial_complete(trial, result)
+
+    def on_trial_remove(self, trial: Trial):
+        with self._lock:
+            self.base_scheduler.on_trial_remove(trial)
+
+    def metric_names(self) -> list[str]:
+        return self.base_scheduler.metric_names()
+
+    def metric_mode(self) -> str:
+        return self.base_scheduler.metric_mode()
+
+    def metadata(self) -> dict[str, Any]:
+        return self.base_scheduler.metadata()
+
+    def callback_for_checkpoint_removal(
+        self, stop_criterion: Callable[[TuningStatus], bool]
+    ) -> TunerCallback | None:
+        if isinstance(self.base_scheduler, RemoveCheckpointsSchedulerMixin):
+            return self.base_scheduler.callback_for_checkpoint_removal(stop_criterion)
+        return None
+
+    def close(self):
+        if self._executor is not None:
+            try:
+                self._wait_for_prefetch()
+            except Exception as ex:
+                logger.warning(f"Prefetching suggestions failed: {ex}")
+            self._executor.shutdown()
+            self._executor = None
+        self.base_scheduler.close()
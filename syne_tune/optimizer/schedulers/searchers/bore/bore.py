@@ -1,4 +1,5 @@
 from typing import Any
+import copy
 import time
 import xgboost
 import logging
@@ -9,6 +10,9 @@ from sklearn.ensemble import RandomForestClassifier
 from sklearn.calibration import CalibratedClassifierCV
 
 from syne_tune.optimizer.schedulers.searchers.bore.mlp_classififer import MLP
+from syne_tune.optimizer.schedulers.searchers.model_fitting import (
+    AsyncModelFittingMixin,
+)
 from syne_tune.optimizer.schedulers.searchers.single_objective_searcher import (
     SingleObjectiveBaseSearcher,
 )
@@ -23,7 +27,7 @@ from syne_tune.optimizer.schedulers.searchers.bore.de import (
 logger = logging.getLogger(__name__)
 
 
-class Bore(SingleObjectiveBaseSearcher):
+class Bore(AsyncModelFittingMixin, SingleObjectiveBaseSearcher):
     """
     Implements "Bayesian optimization by Density Ratio Estimation" as described
     in the following paper:
@@ -54,8 +58,17 @@ class Bore(SingleObjectiveBaseSearcher):
         until at least ``init_random`` observations have been recorded in
         :meth:`update`. After that, the BORE algorithm is used. Defaults to 6
     :param classifier_kwargs: Parameters for classifier. Optional
+    :param model_fitting: If "sync", the classifier is trained in
+        :meth:`suggest` whenever new observations are available. If "thread"
+        or "process", a copy of the classifier is trained in the background,
+        and :meth:`suggest` uses the classifier trained most recently, or
+        returns a random configuration if there is none yet. See
+        :class:`~syne_tune.optimizer.schedulers.searchers.model_fitting.AsyncModelFittingMixin`.
+        Defaults to "sync"
     """
 
+    _model_fitting_attributes = ("gamma", "calibrate", "model", "model_fitting")
+
     def __init__(
         self,
         config_space: dict[str, Any],
@@ -69,6 +82,7 @@ class Bore(SingleObjectiveBaseSearcher):
         random_prob: float | None = 0.0,
         init_random: int | None = 6,
         classifier_kwargs: dict | None = None,
+        model_fitting: str = "sync",
     ):
         super().__init__(
             config_space=config_space,
@@ -110,12 +124,13 @@ class Bore(SingleObjectiveBaseSearcher):
 
         self.inputs = []
         self.targets = []
+        self._init_model_fitting(model_fitting)
 
-    def _loss(self, x):
+    def _loss(self, x, model):
         if len(x.shape) < 2:
-            y = -self.model.predict_proba(x[None, :])
+            y = -model.predict_proba(x[None, :])
         else:
-            y = -self.model.predict_proba(x)
+            y = -model.predict_proba(x)
         if self.classifier in ["gp", "mlp"]:
             return y[:, 0]
         else:
@@ -138,60 +153,13 @@ class Bore(SingleObjectiveBaseSearcher):
             ):
                 config = self._get_random_config()
             else:
-                # train model
-                if not self._train_model(self.inputs, self.targets):
+                model = self._current_model()
+                if model is None:
                     config = self._get_random_config()
                 elif self.acq_optimizer == "de":
-
-                    def wrapper(x):
-                        l = self._loss(x)
-                        return l[:, None]
-
-                    bounds = np.array(self._hp_ranges.get_ndarray_bounds())
-                    lower = bounds[:, 0]
-                    upper = bounds[:, 1]
-
-                    de = DifferentialevolutionOptimizer(
-                        wrapper, lower, upper, self.feval_acq
-                    )
-                    best, traj = de.run()
-                    config = self._hp_ranges.from_ndarray(best)
-
-                elif self.acq_optimizer == "rs_with_replacement":
-                    # sample random configurations with replacement
-                    candidates = [
-                        self._get_random_config() for _ in range(self.feval_acq)
-                    ]
-                    values = [
-                        self._loss(self._hp_ranges.to_ndarray(candidate))[0]
-                        for candidate in candidates
-                    ]
-                    ind = np.array(values).argmin()
-                    config = candidates[ind]
-
+                    config = self._optimize_acquisition_with_de(model)
                 else:
-                    # sample random configurations without replacement
-                    values = []
-                    candidates = []
-                    counter = 0
-                    while len(candidates) < self.feval_acq:
-                        xi = self._get_random_config()
-                        counter += 1
-                        if counter > 10000:
-                            logging.error(
-                                f"Tried 10000 times to sample a new configuration "
-                                f"without replacement with no success."
-                                f"We will stop now! Current candidate set contains {len(candidates)} "
-                                f"configurations. Try reduce the total number of samples feval_acq."
-                            )
-                            break
-                        if xi in candidates:
-                            continue
-                        counter = 0
-                        candidates.append(xi)
-                        values.append(self._loss(self._hp_ranges.to_ndarray(xi))[0])
-                    ind = np.array(values).argmin()
-                    config = candidates[ind]
+                    config = self._candidates_by_loss(model)[0]
 
         if config is not None:
             opt_time = time.time() - start_time
@@ -203,17 +171,112 @@ class Bore(SingleObjectiveBaseSearcher):
 
         return config
 
-    def _train_model(self, train_data: list, train_targets: list) -> bool:
+    def suggest_batch(self, num_suggestions: int, **kwargs) -> list[dict[str, Any]]:
         """
-        :param train_data: Training input feature matrix X
-        :param train_targets: Training targets y
-        :return: Was training successful?
+        The model is trained only once, and configurations are the best
+        candidates w.r.t. the acquisition function among a single set of
+        random candidates. If ``acq_optimizer == "de"``, :meth:`suggest` is
+        called repeatedly.
+        """
+        if self.acq_optimizer == "de":
+            return super().suggest_batch(num_suggestions, **kwargs)
+        configs = self._next_points_to_evaluate_batch(num_suggestions)
+        num_remaining = num_suggestions - len(configs)
+        if num_remaining == 0:
+            return configs
+        if len(self.inputs) < self.init_random:
+            is_random = np.ones(num_remaining, dtype=bool)
+        else:
+            is_random = self.random_state.rand(num_remaining) < self.random_prob
+        candidates = []
+        if not is_random.all():
+            model = self._current_model()
+            if model is not None:
+                candidates = self._candidates_by_loss(model)
+        for random_config in is_random:
+            if random_config or not candidates:
+                configs.append(self._get_random_config())
+            else:
+                configs.append(candidates.pop(0))
+        return configs
+
+    def _optimize_acquisition_with_de(self, model) -> dict[str, Any]:
+        def wrapper(x):
+            l = self._loss(x, model)
+            return l[:, None]
+
+        bounds = np.array(self._hp_ranges.get_ndarray_bounds())
+        lower = bounds[:, 0]
+        upper = bounds[:, 1]
+
+        de = DifferentialevolutionOptimizer(wrapper, lower, upper, self.feval_acq)
+        best, traj = de.run()
+        return self._hp_ranges.from_ndarray(best)
+
+    def _sample_candidates(self) -> list[dict[str, Any]]:
+        """
+        :return: Random configurations on which the acquisition function is
+            evaluated, sampled with or without replacement depending on
+            ``acq_optimizer``
+        """
+        if self.acq_optimizer == "rs_with_replacement":
+            return [self._get_random_config() for _ in range(self.feval_acq)]
+        candidates = []
+        counter = 0
+        while len(candidates) < self.feval_acq:
+            xi = self._get_random_config()
+            counter += 1
+            if counter > 10000:
+                logging.error(
+                    f"Tried 10000 times to sample a new configuration "
+                    f"without replacement with no success."
+                    f"We will stop now! Current candidate set contains {len(candidates)} "
+                    f"configurations. Try reduce the total number of samples feval_acq."
+                )
+                break
+            if xi in candidates:
+                continue
+            counter = 0
+            candidates.append(xi)
+        return candidates
+
+    def _candidates_by_loss(self, model) -> list[dict[str, Any]]:
+        """
+        :return: Distinct random candidates, sorted by increasing value of
+            the acquisition function (lower is better)
+        """
+        candidates = self._sample_candidates()
+        losses = self._loss(
+            np.array(
+                [self._hp_ranges.to_ndarray(candidate) for candidate in candidates]
+            ),
+            model,
+        )
+        sorted_candidates = []
+        match_strings = set()
+        for ind in np.argsort(losses, kind="stable"):
+            # Candidates sampled with replacement can contain duplicates
+            match_str = self._hp_ranges.config_to_match_string(candidates[ind])
+            if match_str not in match_strings:
+                match_strings.add(match_str)
+                sorted_candidates.append(candidates[ind])
+        return sorted_candidates
+
+    def _num_observations(self) -> int:
+        return len(self.inputs)
+
+    def _training_data(self) -> tuple[np.ndarray, np.ndarray]:
+        return np.array(self.inputs), np.array(self.targets)
+
+    def _fit_model(self, data: tuple[np.ndarray, np.ndarray]):
+        """
+        :param data: Training input feature matrix X and targets y
+        :return: Trained classifier, or ``None`` if training failed
         """
 
         start_time = time.time()
 
-        X = np.array(train_data)
-        y = np.array(train_targets)
+        X, y = data
 
         tau = np.quantile(y, q=self.gamma)
         z = np.less_equal(y, tau)
@@ -223,18 +286,21 @@ class Bore(SingleObjectiveBaseSearcher):
                 "observed configurations obtain the same value."
                 "Return a random configuration instead."
             )
-            return False
+            return None
 
+        # If trained in the background, the classifier used by the searcher
+        # must not be modified
+        model = (
+            self.model if self.model_fitting == "sync" else copy.deepcopy(self.model)
+        )
         if self.calibrate:
-            self.model = CalibratedClassifierCV(
-                self.model,
+            model = CalibratedClassifierCV(
+                model,
                 cv=2,
             )
-            self.model.fit(X, np.array(z, dtype=np.int64))
-        else:
-            self.model.fit(X, np.array(z, dtype=np.int64))
+        model.fit(X, np.array(z, dtype=np.int64))
 
-        z_hat = self.model.predict(X)
+        z_hat = model.predict(X)
         if len(z_hat.shape) == 2:
             z_hat = z_hat[:, 0]
         accuracy = np.mean(z_hat == z)
@@ -246,7 +312,7 @@ class Bore(SingleObjectiveBaseSearcher):
             f"dataset size: {X.shape[0]}, "
             f"train time : {train_time}"
         )
-        return True
+        return model
 
     def on_trial_complete(
         self,
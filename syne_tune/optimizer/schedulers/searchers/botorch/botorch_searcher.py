@@ -3,6 +3,9 @@ import logging
 
 import numpy as np
 
+from syne_tune.optimizer.schedulers.searchers.model_fitting import (
+    AsyncModelFittingMixin,
+)
 from syne_tune.optimizer.schedulers.searchers.single_objective_searcher import (
     SingleObjectiveBaseSearcher,
 )
@@ -27,7 +30,7 @@ from linear_operator.utils.errors import NotPSDError
 logger = logging.getLogger(__name__)
 
 
-class BoTorchSearcher(SingleObjectiveBaseSearcher):
+class BoTorchSearcher(AsyncModelFittingMixin, SingleObjectiveBaseSearcher):
     """
     A searcher that suggest configurations using BOTORCH to build GP surrogate
     and optimize acquisition function.
@@ -63,8 +66,17 @@ class BoTorchSearcher(SingleObjectiveBaseSearcher):
         ``num_restarts`` are used with ``num_raw_samples`` each to optimize
         the acquisition function via gradient-based optimization. Defaults to "gradient"
     :param random_seed: Seed for initializing random number generators.
+    :param model_fitting: If "sync", the GP is fitted in :meth:`suggest`
+        whenever new observations are available. If "thread" or "process",
+        the GP is fitted in the background, and :meth:`suggest` uses the GP
+        fitted most recently, or returns a random configuration if there is
+        none yet. See
+        :class:`~syne_tune.optimizer.schedulers.searchers.model_fitting.AsyncModelFittingMixin`.
+        Defaults to "sync"
     """
 
+    _model_fitting_attributes = ("double_precision", "input_warping", "noise_level")
+
     def __init__(
         self,
         config_space: dict[str, Any],
@@ -79,6 +91,7 @@ class BoTorchSearcher(SingleObjectiveBaseSearcher):
         optimization_strategy: str = "gradient",
         num_raw_samples: int = 200,
         random_seed: int = None,
+        model_fitting: str = "sync",
     ):
         super(BoTorchSearcher, self).__init__(
             config_space, points_to_evaluate=points_to_evaluate, random_seed=random_seed
@@ -97,6 +110,7 @@ class BoTorchSearcher(SingleObjectiveBaseSearcher):
         self.num_restarts = num_restarts
         self._hp_ranges = make_hyperparameter_ranges(config_space)
         self.optimization_strategy = optimization_strategy
+        self._init_model_fitting(model_fitting)
 
         # Set the random seed for botorch as well
         random.manual_seed(self.random_seed)
@@ -133,15 +147,39 @@ class BoTorchSearcher(SingleObjectiveBaseSearcher):
                 config_suggested = self._sample_next_candidate()
 
         if config_suggested is not None:
-            # assign new internal trial_id
-            trial_id = len(self.trial_configs)
+            self._register_pending(config_suggested)
+
+        return config_suggested
+
+    def suggest_batch(self, num_suggestions: int, **kwargs) -> list[dict]:
+        """
+        The GP is fitted only once, and the configurations not taken from
+        ``points_to_evaluate`` jointly maximize the batch (q > 1) acquisition
+        function.
+        """
+        configs = self._next_points_to_evaluate_batch(num_suggestions)
+        # Initial configurations are pending when sampling the remaining ones
+        for config in configs:
+            self._register_pending(config)
+        num_remaining = num_suggestions - len(configs)
+        if num_remaining > 0:
+            if len(self.objectives()) < self.num_minimum_observations:
+                new_configs = self._get_random_configs(num_remaining)
+            else:
+                new_configs = self._sample_next_candidates(num_remaining)
+            for config in new_configs:
+                self._register_pending(config)
+            configs.extend(new_configs)
+        return configs
 
-            # register pending
-            self.pending_trials.add(trial_id)
+    def _register_pending(self, config: dict):
+        # assign new internal trial_id
+        trial_id = len(self.trial_configs)
 
-            self.trial_configs[trial_id] = config_suggested
+        # register pending
+        self.pending_trials.add(trial_id)
 
-        return config_suggested
+        self.trial_configs[trial_id] = config
 
     def evaluation_failed(self, trial_id: int):
         self.cleanup_pending(trial_id)
@@ -166,31 +204,20 @@ class BoTorchSearcher(SingleObjectiveBaseSearcher):
             of numerical difficulties with non PSD matrices, then the candidate
             is sampled at random.
         """
-        try:
-            X = np.array(self._config_to_feature_matrix(self._configs_with_results()))
-            y = self.objectives()
-            # qExpectedImprovement only supports maximization
-            y *= -1
-
-            if (
-                self.max_num_observations is not None
-                and len(X) >= self.max_num_observations
-            ):
-                perm = self.random_state.permutation(len(X))[
-                    : self.max_num_observations
-                ]
-                X = X[perm]
-                y = y[perm]
-                subsample = True
-            else:
-                subsample = False
-
-            X_tensor = Tensor(X)
-            Y_tensor = standardize(Tensor(y).reshape(-1, 1))
-            gp = self._make_gp(X_tensor=X_tensor, Y_tensor=Y_tensor)
-            mll = ExactMarginalLogLikelihood(gp.likelihood, gp)
-            fit_gpytorch_mll(mll, max_attempts=1)
+        return self._sample_next_candidates(num_candidates=1)[0]
 
+    def _sample_next_candidates(self, num_candidates: int) -> list[dict]:
+        """
+        :param num_candidates: Number of candidates (``q``)
+        :return: Next candidates to evaluate, see
+            :meth:`_sample_next_candidate`. If ``num_candidates > 1``, they
+            jointly maximize the batch acquisition function
+        """
+        model = self._current_model()
+        if model is None:
+            return self._get_random_configs(num_candidates)
+        gp, best_f, subsample = model
+        try:
             if self.pending_trials and self.fantasising and not subsample:
                 X_pending = self._config_to_feature_matrix(self._configs_pending())
             else:
@@ -198,7 +225,7 @@ class BoTorchSearcher(SingleObjectiveBaseSearcher):
 
             acq = qLogExpectedImprovement(
                 model=gp,
-                best_f=Y_tensor.max().item(),
+                best_f=best_f,
                 X_pending=X_pending,
             )
 
@@ -209,29 +236,75 @@ class BoTorchSearcher(SingleObjectiveBaseSearcher):
                     self.num_raw_samples, len(self._hp_ranges.get_ndarray_bounds())
                 )
                 acq_values = acq(X[:, None, :])  # warm up
-                best_idx = acq_values.argmax()
-                candidate = X[best_idx].reshape(1, -1)
+                # Best raw samples w.r.t. the acquisition function
+                best_idx = acq_values.argsort(descending=True)[:num_candidates]
+                candidates = X[best_idx].reshape(num_candidates, -1)
             elif self.optimization_strategy == "gradient":
-                candidate, acq_value = optimize_acqf(
+                candidates, acq_value = optimize_acqf(
                     acq,
                     bounds=self._get_gp_bounds(),
-                    q=1,
+                    q=num_candidates,
                     num_restarts=self.num_restarts,
                     raw_samples=self.num_raw_samples,
                 )
-            candidate = candidate.detach().numpy()[0]
-            return self._config_from_ndarray(candidate)
+            candidates = candidates.detach().numpy()
+            return [self._config_from_ndarray(candidate) for candidate in candidates]
+
+        except:
+            # BoTorch can raise different errors, easier to not try to catch them individually
+            logging.warning(
+                "Botorch was unable to optimize the acquisition function, sampling randomly."
+            )
+            return self._get_random_configs(num_candidates)
+
+    def _num_observations(self) -> int:
+        return len(self.trial_observations)
+
+    def _training_data(self) -> tuple[np.ndarray, np.ndarray, bool]:
+        X = np.array(self._config_to_feature_matrix(self._configs_with_results()))
+        y = self.objectives()
+        # qExpectedImprovement only supports maximization
+        y *= -1
+
+        if (
+            self.max_num_observations is not None
+            and len(X) >= self.max_num_observations
+        ):
+            perm = self.random_state.permutation(len(X))[: self.max_num_observations]
+            X = X[perm]
+            y = y[perm]
+            subsample = True
+        else:
+            subsample = False
+        return X, y, subsample
 
+    def _fit_model(
+        self, data: tuple[np.ndarray, np.ndarray, bool]
+    ) -> tuple[SingleTaskGP, float, bool] | None:
+        """
+        :param data: Training inputs, targets, and whether data was subsampled
+        :return: Fitted GP, best target value, and whether data was
+            subsampled; or ``None`` if the GP could not be fitted
+        """
+        X, y, subsample = data
+        try:
+            X_tensor = Tensor(X)
+            Y_tensor = standardize(Tensor(y).reshape(-1, 1))
+            gp = self._make_gp(X_tensor=X_tensor, Y_tensor=Y_tensor)
+            mll = ExactMarginalLogLikelihood(gp.likelihood, gp)
+            fit_gpytorch_mll(mll, max_attempts=1)
+            return gp, Y_tensor.max().item(), subsample
         except NotPSDError as _:
             logging.warning("Chlolesky inversion failed, sampling randomly.")
-            return self._get_random_config()
         except ModelFittingError as _:
             logging.warning("Botorch was unable to fit the model, sampling randomly.")
-            return self._get_random_config()
         except:
             # BoTorch can raise different errors, easier to not try to catch them individually
             logging.warning("Botorch was unable to fit the model, sampling randomly.")
-            return self._get_random_config()
+        return None
+
+    def _get_random_configs(self, num_configs: int) -> list[dict]:
+        return [self._get_random_config() for _ in range(num_configs)]
 
     def _make_gp(self, X_tensor: Tensor, Y_tensor: Tensor) -> SingleTaskGP:
 
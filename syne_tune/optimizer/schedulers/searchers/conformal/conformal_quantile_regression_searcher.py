@@ -13,6 +13,9 @@ from syne_tune.optimizer.schedulers.searchers.conformal.surrogate.surrogate_mode
 from syne_tune.optimizer.schedulers.searchers.conformal.surrogate.quantile_regression_surrogate import (
     QuantileRegressionSurrogateModel,
 )
+from syne_tune.optimizer.schedulers.searchers.model_fitting import (
+    AsyncModelFittingMixin,
+)
 from syne_tune.optimizer.schedulers.searchers.single_objective_searcher import (
     SingleObjectiveBaseSearcher,
 )
@@ -22,7 +25,14 @@ from syne_tune.util import catchtime
 logger = logging.getLogger(__name__)
 
 
-class ConformalQuantileRegression(SingleObjectiveBaseSearcher):
+class ConformalQuantileRegression(AsyncModelFittingMixin, SingleObjectiveBaseSearcher):
+    _model_fitting_attributes = (
+        "config_space",
+        "surrogate_cls",
+        "surrogate_kwargs",
+        "max_fit_samples",
+    )
+
     def __init__(
         self,
         config_space: dict,
@@ -32,6 +42,7 @@ class ConformalQuantileRegression(SingleObjectiveBaseSearcher):
         update_frequency: int = 1,
         max_fit_samples: int = None,
         surrogate_cls: SurrogateModel = QuantileRegressionSurrogateModel,
+        model_fitting: str = "sync",
         **surrogate_kwargs,
     ):
         """
@@ -50,6 +61,9 @@ class ConformalQuantileRegression(SingleObjectiveBaseSearcher):
         :param max_fit_samples: if the number of observation exceed this parameter, then `max_fit_samples` random samples
         are used to fit the model.
         :param surrogate_cls: SurrogateModel class to model the objective function
+        :param model_fitting: if "sync", the surrogate is fitted in `suggest`. If "thread" or "process", it is
+        fitted in the background, and `suggest` uses the surrogate fitted most recently, or samples at random if
+        there is none yet, see `AsyncModelFittingMixin`. Defaults to "sync".
         :param surrogate_kwargs: additional kwargs for the surrogate model
         """
         super(ConformalQuantileRegression, self).__init__(
@@ -65,23 +79,18 @@ class ConformalQuantileRegression(SingleObjectiveBaseSearcher):
         self.trial_configs = {}
         self.hp_ranges = make_hyperparameter_ranges(config_space=config_space)
         self.surrogate_model = None
-        self.index_last_result_fit = None
         self.new_candidates_sampled = False
         self.sampler = None
         self.max_fit_samples = max_fit_samples
         self.surrogate_cls = surrogate_cls
         self.random_state = np.random.RandomState(self.random_seed)
+        self._init_model_fitting(model_fitting)
 
     def suggest(self, **kwargs) -> dict[str, Any] | None:
         config = self._next_points_to_evaluate()
 
         if config is None:
-            if self.should_update():
-                with catchtime(
-                    f"fit model with {self.num_results()} observations", show=False
-                ):
-                    self.fit_model()
-                self.index_last_result_fit = self.num_results()
+            self.surrogate_model = self._current_model()
             if self.surrogate_model is not None:
                 logger.debug(f"sample from model")
                 config = self.surrogate_model.suggest()
@@ -90,19 +99,52 @@ class ConformalQuantileRegression(SingleObjectiveBaseSearcher):
                 config = self.sample_random()
         return config
 
+    def suggest_batch(self, num_suggestions: int, **kwargs) -> list[dict[str, Any]]:
+        """
+        The model is fitted at most once, and configurations are the best
+        candidates w.r.t. a single prediction of the model.
+        """
+        configs = self._next_points_to_evaluate_batch(num_suggestions)
+        num_remaining = num_suggestions - len(configs)
+        if num_remaining == 0:
+            return configs
+        self.surrogate_model = self._current_model()
+        if self.surrogate_model is not None:
+            configs.extend(self.surrogate_model.suggest_batch(num_remaining))
+        else:
+            configs.extend(self.sample_random() for _ in range(num_remaining))
+        return configs
+
     def should_update(self) -> bool:
-        enough_observations = self.num_results() >= self.num_init_random_draws
+        return self._needs_refit(self.num_results())
+
+    def _needs_refit(self, num_observations: int) -> bool:
+        enough_observations = num_observations >= self.num_init_random_draws
         if enough_observations:
-            if self.index_last_result_fit is None:
+            if self._num_observations_fit is None:
                 return True
             else:
                 new_results_seen_since_last_fit = (
-                    self.num_results() - self.index_last_result_fit
+                    num_observations - self._num_observations_fit
                 )
                 return new_results_seen_since_last_fit >= self.update_frequency
         else:
             return False
 
+    def _num_observations(self) -> int:
+        return self.num_results()
+
+    def _training_data(
+        self,
+    ) -> tuple[pd.DataFrame, np.ndarray, np.random.RandomState]:
+        X, z = self.make_input_target()
+        if self.model_fitting == "sync":
+            random_state = self.random_state
+        else:
+            # ``random_state`` of the searcher must not be used in the background
+            random_state = np.random.RandomState(self.random_state.randint(2**31))
+        return X, z, random_state
+
     def num_results(self) -> int:
         return len(self.trial_results)
 
@@ -116,17 +158,24 @@ class ConformalQuantileRegression(SingleObjectiveBaseSearcher):
         return X, z
 
     def fit_model(self):
-        X, z = self.make_input_target()
-        self.surrogate_model = self.surrogate_cls(
+        self.surrogate_model = self._fit_model(self._training_data())
+
+    def _fit_model(
+        self, data: tuple[pd.DataFrame, np.ndarray, np.random.RandomState]
+    ) -> SurrogateModel:
+        X, z, random_state = data
+        surrogate_model = self.surrogate_cls(
             config_space=self.config_space,
             max_fit_samples=self.max_fit_samples,
-            random_state=self.random_state,
+            random_state=random_state,
             mode="min",
             min_samples_to_conformalize=32,
             valid_fraction=0.1,
             **self.surrogate_kwargs,
         )
-        self.surrogate_model.fit(df_features=X, y=z)
+        with catchtime(f"fit model with {len(z)} observations", show=False):
+            surrogate_model.fit(df_features=X, y=z)
+        return surrogate_model
 
     def on_trial_complete(
         self,
@@ -34,6 +34,28 @@ class SurrogateModel:
             self.config_seen.add(tuple(config.values()))
         return config
 
+    def suggest_batch(self, num_suggestions: int) -> list[dict]:
+        """
+        :param num_suggestions: Number of configurations to suggest
+        :return: Best candidates w.r.t. a single sample from the predictive
+            distribution, or random configurations if the model is not fitted
+        """
+        configs = []
+        if self._sampler:
+            residual_samples = self._surrogate_pred()
+            if self.mode == "max":
+                residual_samples *= -1
+            config_indices = np.argsort(residual_samples, kind="stable")
+            configs = [
+                self.config_candidates[config_idx]
+                for config_idx in config_indices[:num_suggestions]
+            ]
+        num_random = num_suggestions - len(configs)
+        configs += [self._sample_random() for _ in range(num_random)]
+        for config in configs:
+            self.config_seen.add(tuple(config.values()))
+        return configs
+
     def fit(
         self,
         df_features: pd.DataFrame,
@@ -4,6 +4,9 @@ import numpy as np
 import statsmodels.api as sm
 import scipy.stats as sps
 
+from syne_tune.optimizer.schedulers.searchers.model_fitting import (
+    AsyncModelFittingMixin,
+)
 from syne_tune.optimizer.schedulers.searchers.single_objective_searcher import (
     SingleObjectiveBaseSearcher,
 )
@@ -12,7 +15,7 @@ import syne_tune.config_space as sp
 logger = logging.getLogger(__name__)
 
 
-class KernelDensityEstimator(SingleObjectiveBaseSearcher):
+class KernelDensityEstimator(AsyncModelFittingMixin, SingleObjectiveBaseSearcher):
     """
     Fits two kernel density estimators (KDE) to model the density of the top N
     configurations as well as the density of the configurations that are not
@@ -58,8 +61,20 @@ class KernelDensityEstimator(SingleObjectiveBaseSearcher):
         drawn uniformly at random instead of sampling from the model.
         Defaults to 0.33
     :param random_seed: Seed for initializing random number generators.
+    :param model_fitting: If "thread" or "process", the KDEs are fitted in the
+        background, and configurations are drawn at random until they are
+        available, see
+        :class:`~syne_tune.optimizer.schedulers.searchers.model_fitting.AsyncModelFittingMixin`.
+        Defaults to "sync"
     """
 
+    _model_fitting_attributes = (
+        "vartypes",
+        "min_bandwidth",
+        "num_min_data_points",
+        "top_n_percent",
+    )
+
     def __init__(
         self,
         config_space: dict[str, Any],
@@ -71,6 +86,7 @@ class KernelDensityEstimator(SingleObjectiveBaseSearcher):
         bandwidth_factor: int = 3,
         random_fraction: float = 0.33,
         random_seed: int | None = None,
+        model_fitting: str = "sync",
     ):
         super().__init__(
             config_space=config_space,
@@ -99,6 +115,7 @@ class KernelDensityEstimator(SingleObjectiveBaseSearcher):
 
         self.good_kde = None
         self.bad_kde = None
+        self._init_model_fitting(model_fitting)
 
         self.vartypes = list()
 
@@ -210,10 +227,7 @@ class KernelDensityEstimator(SingleObjectiveBaseSearcher):
     def suggest(self, **kwargs) -> dict[str, Any] | None:
         suggestion = self._next_points_to_evaluate()
         if suggestion is None:
-            if self.y:
-                models = self._train_kde(np.array(self.X), np.array(self.y))
-            else:
-                models = None
+            models = self._current_model() if self.y else None
 
             if models is None or self.random_state.rand() < self.random_fraction:
                 # return random candidate because a) we don't have enough data points or
@@ -222,66 +236,10 @@ class KernelDensityEstimator(SingleObjectiveBaseSearcher):
             else:
                 self.bad_kde = models[0]
                 self.good_kde = models[1]
-                l = self.good_kde.pdf
-                g = self.bad_kde.pdf
-
-                def acquisition_function(x):
-                    return max(1e-32, g(x)) / max(l(x), 1e-32)
-
-                val_current_best = None
-                for i in range(self.num_candidates):
-                    idx = self.random_state.randint(0, len(self.good_kde.data))
-                    mean = self.good_kde.data[idx]
-                    candidate = []
-
-                    for m, bw, t in zip(mean, self.good_kde.bw, self.vartypes):
-                        bw = max(bw, self.min_bandwidth)
-                        vartype = t[0]
-                        domain = t[1]
-                        if vartype == "c":
-                            # continuous parameter
-                            bw = self.bandwidth_factor * bw
-                            candidate.append(
-                                sps.truncnorm.rvs(
-                                    -m / bw,
-                                    (1 - m) / bw,
-                                    loc=m,
-                                    scale=bw,
-                                    random_state=self.random_state,
-                                )
-                            )
-                        else:
-                            # categorical or integer parameter
-                            if self.random_state.rand() < (1 - bw):
-                                candidate.append(m)
-                            else:
-                                if vartype == "o":
-                                    # integer
-                                    sample = self.random_state.randint(
-                                        domain[0], domain[1]
-                                    )
-                                    sample = (sample - domain[0]) / (
-                                        domain[1] - domain[0]
-                                    )
-                                    candidate.append(sample)
-                                elif vartype == "u":
-                                    # categorical
-                                    candidate.append(
-                                        self.random_state.randint(domain) / domain
-                                    )
-                    val = acquisition_function(candidate)
-
-                    if not np.isfinite(val):
-                        logging.warning(
-                            "candidate has non finite acquisition function value"
-                        )
-
-                    config = self._from_feature(candidate)
-                    if val_current_best is None or val_current_best > val:
-                        suggestion = config
-                        val_current_best = val
-
-                if suggestion is None:
+                candidates = self._candidates_by_acquisition()
+                if candidates:
+                    suggestion = candidates[0]
+                else:
                     # This can happen if the configuration space is almost exhausted
                     logger.warning(
                         "Could not find configuration by optimizing the acquisition function. Drawing at random instead."
@@ -290,6 +248,91 @@ class KernelDensityEstimator(SingleObjectiveBaseSearcher):
 
         return suggestion
 
+    def suggest_batch(self, num_suggestions: int, **kwargs) -> list[dict[str, Any]]:
+        """
+        The KDEs are fitted only once, and configurations are the best
+        candidates w.r.t. the acquisition function among a single set of
+        candidates.
+        """
+        suggestions = self._next_points_to_evaluate_batch(num_suggestions)
+        num_remaining = num_suggestions - len(suggestions)
+        if num_remaining == 0:
+            return suggestions
+        models = self._current_model() if self.y else None
+        if models is None:
+            is_random = np.ones(num_remaining, dtype=bool)
+        else:
+            is_random = self.random_state.rand(num_remaining) < self.random_fraction
+        candidates = []
+        if not is_random.all():
+            self.bad_kde = models[0]
+            self.good_kde = models[1]
+            candidates = self._candidates_by_acquisition()
+        for random_config in is_random:
+            if random_config or not candidates:
+                suggestions.append(self._get_random_config())
+            else:
+                suggestions.append(candidates.pop(0))
+        return suggestions
+
+    def _candidates_by_acquisition(self) -> list[dict[str, Any]]:
+        """
+        Samples candidates from the KDE fitted to the top configurations.
+
+        :return: Candidates, sorted by increasing value of the acquisition
+            function (lower is better)
+        """
+        l = self.good_kde.pdf
+        g = self.bad_kde.pdf
+
+        def acquisition_function(x):
+            return max(1e-32, g(x)) / max(l(x), 1e-32)
+
+        scored_candidates = []
+        for i in range(self.num_candidates):
+            idx = self.random_state.randint(0, len(self.good_kde.data))
+            mean = self.good_kde.data[idx]
+            candidate = []
+
+            for m, bw, t in zip(mean, self.good_kde.bw, self.vartypes):
+                bw = max(bw, self.min_bandwidth)
+                vartype = t[0]
+                domain = t[1]
+                if vartype == "c":
+                    # continuous parameter
+                    bw = self.bandwidth_factor * bw
+                    candidate.append(
+                        sps.truncnorm.rvs(
+                            -m / bw,
+                            (1 - m) / bw,
+                            loc=m,
+                            scale=bw,
+                            random_state=self.random_state,
+                        )
+                    )
+                else:
+                    # categorical or integer parameter
+                    if self.random_state.rand() < (1 - bw):
+                        candidate.append(m)
+                    else:
+                        if vartype == "o":
+                            # integer
+                            sample = self.random_state.randint(domain[0], domain[1])
+                            sample = (sample - domain[0]) / (domain[1] - domain[0])
+                            candidate.append(sample)
+                        elif vartype == "u":
+                            # categorical
+                            candidate.append(self.random_state.randint(domain) / domain)
+            val = acquisition_function(candidate)
+
+            if not np.isfinite(val):
+                logging.warning("candidate has non finite acquisition function value")
+
+            scored_candidates.append((val, self._from_feature(candidate)))
+
+        order = np.argsort([val for val, _ in scored_candidates], kind="stable")
+        return [scored_candidates[ind][1] for ind in order]
+
     def _check_data_shape_and_good_size(self, data_shape: list[int, int]) -> int | None:
         """
         Determine size of data for "good" model (the rest of the data is for the
@@ -333,3 +376,12 @@ class KernelDensityEstimator(SingleObjectiveBaseSearcher):
         good_kde.bw = np.clip(good_kde.bw, self.min_bandwidth, None)
 
         return bad_kde, good_kde
+
+    def _num_observations(self) -> int:
+        return len(self.y)
+
+    def _training_data(self) -> tuple[np.ndarray, np.ndarray]:
+        return np.array(self.X), np.array(self.y)
+
+    def _fit_model(self, data: tuple[np.ndarray, np.ndarray]) -> list[Any, Any] | None:
+        return self._train_kde(*data)
@@ -125,6 +125,8 @@ class LastValueMultiFidelitySearcher(SingleObjectiveBaseSearcher):
 
     def fit_model(self):
         configs, metrics = self.make_input_target()
+        if self.searcher is not None:
+            self.searcher.close()
         self.searcher = self.searcher_cls(
             config_space=self.config_space,
             # TODO BaseSearcher expects a int for random_seed, so we cannot pass a random state, we could change to pass both
@@ -160,6 +162,10 @@ class LastValueMultiFidelitySearcher(SingleObjectiveBaseSearcher):
         self.trial_configs[trial_id] = config
         self.trial_results[trial_id].append(metric)
 
+    def close(self):
+        if self.searcher is not None:
+            self.searcher.close()
+
     def sample_random(self) -> dict:
         return {
             k: v.sample(random_state=self.random_state) if isinstance(v, Domain) else v
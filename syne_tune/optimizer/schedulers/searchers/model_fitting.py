@@ -0,0 +1,207 @@
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+MODEL_FITTING_MODES = ("sync", "thread", "process")
+
+
+class AsyncModelFittingMixin:
+    """
+    Mixin for model-based searchers, which allows to fit the surrogate model
+    in the background, so that the latency of :meth:`suggest` does not grow
+    with the number of observations.
+
+    Searchers implement :meth:`_num_observations`, :meth:`_training_data` and
+    :meth:`_fit_model`, and obtain the model to suggest configurations from by
+    calling :meth:`_current_model`. Depending on ``model_fitting``:
+
+    * "sync": The model is refitted in :meth:`_current_model` whenever new
+      observations are available. This is the default behaviour
+    * "thread", "process": Refitting is started in a background thread or
+      process whenever new observations are available, while
+      :meth:`_current_model` returns the model fitted most recently. Until
+      the first model is fitted, ``None`` is returned, in which case the
+      searcher samples configurations at random. In "process" mode, training
+      data and fitted model are passed by pickling. Searchers should list the
+      attributes :meth:`_fit_model` depends on in
+      :attr:`_model_fitting_attributes`, so that only these are pickled along
+      with the training data, not the whole searcher
+
+    :meth:`wait_for_model` blocks until the model fitted in the background is
+    available, which is useful to obtain deterministic behaviour in tests.
+
+    :meth:`_init_model_fitting` has to be called in the constructor, and
+    :meth:`close` stops the background thread or process.
+    """
+
+    # Attributes of the searcher used in :meth:`_fit_model`. If ``None``, the
+    # whole searcher is pickled in "process" mode
+    _model_fitting_attributes: tuple[str, ...] | None = None
+
+    def _init_model_fitting(self, model_fitting: str = "sync"):
+        """
+        :param model_fitting: See above. Defaults to "sync"
+        """
+        assert (
+            model_fitting in MODEL_FITTING_MODES
+        ), f"model_fitting = {model_fitting} not supported, must be in {MODEL_FITTING_MODES}"
+        self.model_fitting = model_fitting
+        self._model = None
+        # Number of observations used in the last fit started
+        self._num_observations_fit = None
+        # Number of observations used to fit ``_model``
+        self._num_observations_model = None
+        self._num_observations_pending = None
+        self._model_fitting_executor = None
+        self._model_fitting_future = None
+
+    def __getstate__(self):
+        # Model being fitted in the background (if any) is not serialized
+        state = self.__dict__.copy()
+        if "_model_fitting_future" not in state:
+            return state  # Copy returned by :meth:`_model_fitter`
+        state["_model_fitting_executor"] = None
+        state["_model_fitting_future"] = None
+        if self._model_fitting_future is not None:
+            # Fit is started again once the searcher is loaded
+            state["_num_observations_fit"] = self._num_observations_model
+            state["_num_observations_pending"] = None
+        return state
+
+    def _num_observations(self) -> int:
+        """
+        :return: Number of observations the model would be fitted on
+        """
+        raise NotImplementedError
+
+    def _training_data(self) -> Any:
+        """
+        :return: Snapshot of the data the model is fitted on, passed to
+            :meth:`_fit_model`
+        """
+        raise NotImplementedError
+
+    def _fit_model(self, data: Any) -> Any | None:
+        """
+        Fits the surrogate model. Must not modify the state of the searcher,
+        since it may run in a background thread or process.
+
+        :param data: Result of :meth:`_training_data`
+        :return: Fitted model, or ``None`` if it cannot be fitted
+        """
+        raise NotImplementedError
+
+    def _needs_refit(self, num_observations: int) -> bool:
+        """
+        :param num_observations: Current number of observations
+        :return: Should the model be fitted again? By default, this is the
+            case whenever new observations are available
+        """
+        return num_observations != self._num_observations_fit
+
+    def _executor(self) -> Executor:
+        if self._model_fitting_executor is None:
+            if self.model_fitting == "thread":
+                self._model_fitting_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="syne-tune-model-fitting"
+                )
+            else:
+                self._model_fitting_executor = ProcessPoolExecutor(max_workers=1)
+        return self._model_fitting_executor
+
+    def _model_fitter(self) -> "AsyncModelFittingMixin":
+        """
+        :return: Object whose :meth:`_fit_model` is run in the background. In
+            "process" mode, this is a copy of the searcher with
+            :attr:`_model_fitting_attributes` only
+        """
+        if self.model_fitting != "process" or self._model_fitting_attributes is None:
+            return self
+        fitter = object.__new__(type(self))
+        fitter.__dict__.update(
+            {name: getattr(self, name) for name in self._model_fitting_attributes}
+        )
+        return fitter
+
+    def _collect_model(self, blocking: bool):
+        future = self._model_fitting_future
+        if future is not None and (blocking or future.done()):
+            self._model_fitting_future = None
+            self._num_observations_model = self._num_observations_pending
+            self._num_observations_pending = None
+            # Raises exception if model fitting failed
+            self._model = future.result()
+
+    def _current_model(self) -> Any | None:
+        """
+        :return: Model to suggest configurations from, or ``None`` if no model
+            is available (the searcher should sample at random then)
+        """
+        num_observations = self._num_observations()
+        if self.model_fitting == "sync":
+            if self._needs_refit(num_observations):
+                self._num_observations_fit = num_observations
+                self._num_observations_model = num_observations
+                self._model = self._fit_model(self._training_data())
+            return self._model
+        self._collect_model(blocking=False)
+        if self._model_fitting_future is None and self._needs_refit(num_observations):
+            self._num_observations_fit = num_observations
+            self._num_observations_pending = num_observations
+            logger.debug(f"Fitting model on {num_observations} observations")
+            self._model_fitting_future = self._executor().submit(
+                self._model_fitter()._fit_model, self._training_data()
+            )
+        return self._model
+
+    def _model_fitting_snapshot(self) -> tuple[int, Any] | None:
+        """
+        In "sync" mode, the model can also be fitted by the caller of
+        :meth:`_fit_model` on a snapshot of the training data, without holding
+        a lock on the searcher (see
+        :class:`~syne_tune.optimizer.schedulers.prefetching_scheduler.PrefetchingScheduler`).
+        The fitted model is passed to :meth:`_set_fitted_model`.
+
+        :return: ``(num_observations, data)`` if the model needs to be fitted
+            again in "sync" mode, ``None`` otherwise
+        """
+        if self.model_fitting != "sync":
+            return None
+        num_observations = self._num_observations()
+        if not self._needs_refit(num_observations):
+            return None
+        return num_observations, self._training_data()
+
+    def _set_fitted_model(self, model: Any | None, num_observations: int):
+        """
+        :param model: Model fitted on data returned by
+            :meth:`_model_fitting_snapshot`
+        :param num_observations: Number of observations returned along with
+            this data
+        """
+        self._num_observations_fit = num_observations
+        self._num_observations_model = num_observations
+        self._model = model
+
+    def wait_for_model(self):
+        """
+        Waits until the model fitted in the background (if any) is available.
+        """
+        self._collect_model(blocking=True)
+
+    def close(self):
+        """
+        Stops the background thread or process used for model fitting. A model
+        being fitted is discarded. The searcher can still be used afterwards.
+        """
+        if self._model_fitting_future is not None:
+            self._model_fitting_future.cancel()
+            self._model_fitting_future = None
+            self._num_observations_fit = self._num_observations_model
+            self._num_observations_pending = None
+        if self._model_fitting_executor is not None:
+            self._model_fitting_executor.shutdown(wait=True)
+            self._model_fitting_executor = None
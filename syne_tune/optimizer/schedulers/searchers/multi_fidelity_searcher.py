@@ -125,3 +125,7 @@ class IndependentMultiFidelitySearcher(BaseSearcher):
         self.searchers[resource_level].on_trial_complete(
             trial_id=trial_id, config=config, metric=metric
         )
+
+    def close(self):
+        for searcher in self.searchers.values():
+            searcher.close()
@@ -15,6 +15,30 @@ def sample_random_config(config_space):
     }
 
 
+def sample_random_configs(
+    config_space: dict[str, Any], num_configs: int
+) -> list[dict[str, Any]]:
+    """
+    Samples ``num_configs`` configurations at random. Values are sampled for
+    all configurations at once, one hyperparameter after the other.
+
+    :param config_space: Configuration space
+    :param num_configs: Number of configurations to sample
+    :return: List of configurations
+    """
+    values = dict()
+    for name, domain in config_space.items():
+        if hasattr(domain, "sample"):
+            samples = domain.sample(size=num_configs)
+            values[name] = samples if num_configs > 1 else [samples]
+        else:
+            values[name] = [domain] * num_configs
+    return [
+        {name: samples[pos] for name, samples in values.items()}
+        for pos in range(num_configs)
+    ]
+
+
 class RandomSearcher(SingleObjectiveBaseSearcher):
     """
     Sample hyperparameter configurations uniformly at random from the given configuration space.
@@ -47,6 +71,13 @@ class RandomSearcher(SingleObjectiveBaseSearcher):
             new_config = sample_random_config(self.config_space)
         return new_config
 
+    def suggest_batch(self, num_suggestions: int, **kwargs) -> list[dict]:
+        configs = self._next_points_to_evaluate_batch(num_suggestions)
+        num_random = num_suggestions - len(configs)
+        if num_random > 0:
+            configs.extend(sample_random_configs(self.config_space, num_random))
+        return configs
+
 
 class MultiObjectiveRandomSearcher(BaseSearcher):
     """
@@ -75,3 +106,10 @@ class MultiObjectiveRandomSearcher(BaseSearcher):
         if new_config is None:
             new_config = sample_random_config(self.config_space)
         return new_config
+
+    def suggest_batch(self, num_suggestions: int, **kwargs) -> list[dict]:
+        configs = self._next_points_to_evaluate_batch(num_suggestions)
+        num_random = num_suggestions - len(configs)
+        if num_random > 0:
+            configs.extend(sample_random_configs(self.config_space, num_random))
+        return configs
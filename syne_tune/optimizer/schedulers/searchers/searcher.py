@@ -44,6 +44,18 @@ class BaseSearcher:
         else:
             return None  # No more initial configs
 
+    def _next_points_to_evaluate_batch(
+        self, num_suggestions: int
+    ) -> list[dict[str, Any]]:
+        """
+        :param num_suggestions: Maximum number of entries to return
+        :return: Up to ``num_suggestions`` next entries from remaining
+            ``points_to_evaluate`` (popped from front)
+        """
+        configs = self.points_to_evaluate[:num_suggestions]
+        self.points_to_evaluate = self.points_to_evaluate[num_suggestions:]
+        return configs
+
     def suggest(self, **kwargs) -> dict[str, Any] | None:
         """Suggest a new configuration.
 
@@ -60,6 +72,28 @@ class BaseSearcher:
         """
         raise NotImplementedError
 
+    def suggest_batch(self, num_suggestions: int, **kwargs) -> list[dict[str, Any]]:
+        """Suggest several new configurations at once, to be evaluated in
+        parallel.
+
+        The default implementation calls :meth:`suggest` repeatedly. Searchers
+        should override this method if several configurations can be obtained
+        at the cost of one, for example by fitting a surrogate model only once.
+
+        :param num_suggestions: Number of configurations to suggest
+        :param kwargs: Extra information may be passed from scheduler to
+            searcher
+        :return: List of new configurations. It has fewer than
+            ``num_suggestions`` entries if :meth:`suggest` returns ``None``
+        """
+        configs = []
+        for _ in range(num_suggestions):
+            config = self.suggest(**kwargs)
+            if config is None:
+                break
+            configs.append(config)
+        return configs
+
     def on_trial_result(
         self,
         trial_id: int,
@@ -113,3 +147,10 @@ class BaseSearcher:
         :param metrics: See :meth:`~syne_tune.optimizer.schedulers.TrialScheduler.on_trial_result`
         """
         return
+
+    def close(self):
+        """Releases resources held by the searcher, such as background threads
+        or processes. Called by the scheduler at the end of tuning. The
+        searcher can still be used afterwards.
+        """
+        return
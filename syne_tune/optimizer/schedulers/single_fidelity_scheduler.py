@@ -3,10 +3,8 @@ import logging
 
 from syne_tune.backend.trial_status import Trial
 from syne_tune.config_space import (
-    cast_config_values,
     config_space_to_json_dict,
     remove_constant_and_cast,
-    postprocess_config,
 )
 from syne_tune.optimizer.schedulers.searchers.searcher import BaseSearcher
 from syne_tune.optimizer.schedulers.searchers.single_objective_searcher import (
@@ -82,12 +80,14 @@ class SingleFidelityScheduler(TrialScheduler):
     def suggest(self) -> TrialSuggestion | None:
 
         config = self.searcher.suggest()
-        if config is not None:
-            config = cast_config_values(config, self.config_space)
-            config = TrialSuggestion.start_suggestion(
-                postprocess_config(config, self.config_space)
-            )
-        return config
+        if config is None:
+            return None
+        return self._start_suggestions([config], self.config_space)[0]
+
+    def suggest_batch(self, num_suggestions: int) -> list[TrialSuggestion]:
+        return self._start_suggestions(
+            self.searcher.suggest_batch(num_suggestions), self.config_space
+        )
 
     def on_trial_error(self, trial: Trial):
         self.searcher.on_trial_error(trial.trial_id)
@@ -136,6 +136,9 @@ class SingleFidelityScheduler(TrialScheduler):
         else:
             self.searcher.on_trial_complete(trial.trial_id, config, metrics)
 
+    def close(self):
+        self.searcher.close()
+
     def metadata(self) -> dict[str, Any]:
         """
         :return: Metadata for the scheduler
@@ -140,6 +140,9 @@ class BoundingBox(TransferLearningMixin, SingleObjectiveScheduler):
     def suggest(self) -> TrialSuggestion | None:
         return self.scheduler.suggest()
 
+    def suggest_batch(self, num_suggestions: int) -> list[TrialSuggestion]:
+        return self.scheduler.suggest_batch(num_suggestions)
+
     def on_trial_add(self, trial: Trial):
         self.scheduler.on_trial_add(trial)
 
@@ -155,5 +158,8 @@ class BoundingBox(TransferLearningMixin, SingleObjectiveScheduler):
     def on_trial_result(self, trial: Trial, result: dict[str, Any]) -> str:
         return self.scheduler.on_trial_result(trial, result)
 
+    def close(self):
+        self.scheduler.close()
+
     def metric_mode(self) -> str:
         return self.scheduler.metric_mode()
@@ -27,14 +27,24 @@ class SimpleProfiler:
     therefore lists of durations.
 
     Tags can have multiple levels of prefixes, corresponding to brackets.
+
+    If ``record_events`` is ``True``, every measurement is also recorded as
+    event with its start time, so that measurements can be exported in the
+    Chrome trace format, see :meth:`chrome_trace`.
+
+    :param record_events: See above. Defaults to ``False``
     """
 
-    def __init__(self):
+    def __init__(self, record_events: bool = False):
         self.records = list()
         self.start_time = dict()
         self.time_stamp_first_block = None
         self.meta_keys = None
         self.prefix = ""
+        self.record_events = record_events
+        # Entries are ``(tag, start, duration)``, where ``start`` is relative
+        # to the time stamp of the first block
+        self.events = list()
 
     def begin_block(self, meta: dict[str, Any]):
         assert not self.start_time, "Timers for these tags still running:\n{}".format(
@@ -43,14 +53,14 @@ class SimpleProfiler:
         meta_keys = tuple(sorted(meta.keys()))
         if self.time_stamp_first_block is None:
             self.meta_keys = meta_keys
-            self.time_stamp_first_block = time.time()
+            self.time_stamp_first_block = time.perf_counter()
         else:
             assert (
                 meta_keys == self.meta_keys
             ), "meta.keys() = {}, but must be the same as for all previous meta dicts ({})".format(
                 meta_keys, self.meta_keys
             )
-        time_stamp = time.time() - self.time_stamp_first_block
+        time_stamp = time.perf_counter() - self.time_stamp_first_block
         new_block = ProfilingBlock(
             meta=meta.copy(), time_stamp=time_stamp, durations=dict()
         )
@@ -74,19 +84,38 @@ class SimpleProfiler:
         assert self.records, "No block has been started yet (use 'begin_block')"
         tag = self.prefix + tag
         assert tag not in self.start_time, "Timer for '{}' already running".format(tag)
-        self.start_time[tag] = time.time()
+        self.start_time[tag] = time.perf_counter()
 
     def stop(self, tag: str):
         assert self.records, "No block has been started yet (use 'begin_block')"
         tag = self.prefix + tag
         assert tag in self.start_time, "Timer for '{}' does not exist".format(tag)
-        duration = time.time() - self.start_time[tag]
+        start_time = self.start_time.pop(tag)
+        duration = time.perf_counter() - start_time
+        self._append(tag, duration)
+        if self.record_events:
+            self.events.append(
+                (tag, start_time - self.time_stamp_first_block, duration)
+            )
+
+    def add(self, tag: str, value: float):
+        """
+        Records a value for ``tag`` in the current block, which has not been
+        measured by :meth:`start` and :meth:`stop`. For example, this can be
+        the amount of some resource used since the last call.
+
+        :param tag: Tag (the current prefix is prepended)
+        :param value: Value to be recorded
+        """
+        assert self.records, "No block has been started yet (use 'begin_block')"
+        self._append(self.prefix + tag, value)
+
+    def _append(self, tag: str, duration: float):
         block = self.records[-1]
         if tag in block.durations:
             block.durations[tag].append(duration)
         else:
             block.durations[tag] = [duration]
-        del self.start_time[tag]
 
     def clear(self):
         remaining_tags = list(self.start_time.keys())
@@ -134,6 +163,48 @@ class SimpleProfiler:
                 data[tag + "_sum"][-1] = sum(durations)
         return data
 
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        Aggregates measurements over all blocks.
+
+        :return: Dictionary with tags as keys. Values are dictionaries with
+            keys "num" (number of measurements), "sum", "mean" and "max"
+        """
+        durations_per_tag = dict()
+        for block in self.records:
+            for tag, durations in block.durations.items():
+                durations_per_tag.setdefault(tag, []).extend(durations)
+        return {
+            tag: {
+                "num": len(durations),
+                "sum": float(np.sum(durations)),
+                "mean": float(np.mean(durations)),
+                "max": float(np.max(durations)),
+            }
+            for tag, durations in durations_per_tag.items()
+        }
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """
+        Returns events recorded if ``record_events`` is ``True``, in the Chrome
+        trace event format. Stored as JSON, this can be visualized with
+        ``chrome://tracing`` or `Perfetto <https://ui.perfetto.dev>`__.
+
+        :return: Dictionary in the Chrome trace event format
+        """
+        trace_events = [
+            {
+                "name": tag,
+                "ph": "X",
+                "ts": start * 1e6,
+                "dur": duration * 1e6,
+                "pid": 0,
+                "tid": 0,
+            }
+            for tag, start, duration in self.events
+        ]
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
     def _union_of_tags(self):
         union_tags = set()
         for block in self.records:
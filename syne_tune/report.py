@@ -1,10 +1,12 @@
 import json
 import logging
+import os
 import re
 import sys
 from dataclasses import dataclass
+from pathlib import Path
 from time import time, perf_counter
-from typing import Any
+from typing import Any, BinaryIO, TextIO
 
 from syne_tune.constants import (
     ST_WORKER_TIME,
@@ -12,6 +14,7 @@ from syne_tune.constants import (
     ST_WORKER_TIMESTAMP,
     ST_WORKER_ITER,
     ST_METRIC_TAG,
+    ST_METRICS_FILE_ENV_VAR,
 )
 from syne_tune.util import dump_json_with_numpy
 
@@ -34,6 +37,12 @@ class Reporter:
            # ...
            report(epoch=epoch, accuracy=accuracy)
 
+    If the environment variable
+    :const:`~syne_tune.constants.ST_METRICS_FILE_ENV_VAR` is set (this is done
+    by backends with ``use_metrics_file=True``), metrics are appended as JSON
+    lines to the file it points to, instead of being printed to stdout. This
+    keeps metrics separate from other logging of the training script.
+
     :param add_time: If True (default), the time (in secs) since creation of the
         :class:`Reporter` object is reported automatically as
         :const:`~syne_tune.constants.ST_WORKER_TIME`
@@ -45,6 +54,11 @@ class Reporter:
         if self.add_time:
             self.start = perf_counter()
             self.iter = 0
+        metrics_file = os.environ.get(ST_METRICS_FILE_ENV_VAR)
+        if metrics_file:
+            self._metrics_file = open(metrics_file, "a")
+        else:
+            self._metrics_file = None
 
     def __call__(self, **kwargs) -> None:
         """Report metric values from training function back to Syne Tune
@@ -72,7 +86,10 @@ class Reporter:
                 kwargs[ST_WORKER_COST] = seconds_spent * self.dollar_cost
         kwargs[ST_WORKER_ITER] = self.iter
         self.iter += 1
-        _report_logger(**kwargs)
+        if self._metrics_file is None:
+            _report_logger(**kwargs)
+        else:
+            _report_to_file(self._metrics_file, **kwargs)
 
     @staticmethod
     def _check_reported_values(kwargs: dict[str, Any]):
@@ -86,6 +103,11 @@ def _report_logger(**kwargs):
     sys.stdout.flush()
 
 
+def _report_to_file(file: TextIO, **kwargs):
+    file.write(_serialize_report_dict(kwargs) + "\n")
+    file.flush()
+
+
 def _serialize_report_dict(report_dict: dict[str, Any]) -> str:
     """
     :param report_dict: a dictionary of metrics to be serialized
@@ -106,6 +128,11 @@ def _serialize_report_dict(report_dict: dict[str, Any]) -> str:
         raise e
 
 
+_METRIC_REGEX = re.compile(r"\[" + ST_METRIC_TAG + r"\]: (\{.*\})")
+
+_METRIC_TAG_BYTES = ST_METRIC_TAG.encode()
+
+
 def retrieve(log_lines: list[str]) -> list[dict[str, float]]:
     """Retrieves metrics reported with :func:`_report_logger` given log lines.
 
@@ -113,7 +140,109 @@ def retrieve(log_lines: list[str]) -> list[dict[str, float]]:
     :return: list of metrics retrieved from the log lines.
     """
     metrics = []
-    regex = r"\[" + ST_METRIC_TAG + r"\]: (\{.*\})"
-    for metric_values in re.findall(regex, "\n".join(log_lines)):
+    for metric_values in _METRIC_REGEX.findall("\n".join(log_lines)):
         metrics.append(json.loads(metric_values))
     return metrics
+
+
+class MetricsLogTailer:
+    """
+    Incrementally retrieves metrics reported with :func:`_report_logger` from
+    a log file which is appended to while the trial is running. In contrast to
+    :func:`retrieve`, which parses the whole log on every call, only bytes
+    appended since the previous call of :meth:`read` are scanned. To this end,
+    we maintain the byte offset into the file and the trailing partial line
+    (if the writer has not finished the line yet).
+
+    The file handle is kept open between calls. It can be released with
+    :meth:`close`, in which case it is reopened (at the same offset) by the
+    next call of :meth:`read`. Open handles are not serialized.
+
+    :param path: Path of log file (typically ``std.out`` of a trial)
+    :param metrics: Optional. Initially empty list-like container to which
+        metrics are appended, such as
+        :class:`~syne_tune.backend.metrics_history.MetricsHistory`. Defaults to
+        a list
+    """
+
+    def __init__(self, path: str | Path, metrics: list[dict[str, Any]] | None = None):
+        self.path = Path(path)
+        # All metrics retrieved so far, in the order they were reported
+        self.metrics = [] if metrics is None else metrics
+        self._offset = 0
+        self._partial_line = b""
+        self._file: BinaryIO | None = None
+
+    def read(self, final: bool = False) -> list[dict[str, Any]]:
+        """
+        Scans the part of the log written since the last call, and appends
+        metrics found there to :attr:`metrics`.
+
+        :param final: Set this if the writer has finished (e.g., its process
+            has exited). In this case, a final line without trailing newline
+            is parsed as well. Defaults to ``False``
+        :return: New metrics found in this call
+        """
+        if self._file is None:
+            if not self.path.exists():
+                return []
+            self._file = open(self.path, "rb")
+            self._file.seek(self._offset)
+        chunk = self._file.read()
+        self._offset += len(chunk)
+        lines = (self._partial_line + chunk).split(b"\n")
+        # Last entry is the incomplete line (empty if chunk ends with newline)
+        self._partial_line = lines.pop()
+        new_metrics = []
+        for line in lines:
+            metric = self._parse_line(line)
+            if metric is not None:
+                new_metrics.append(metric)
+        if final and self._partial_line:
+            metric = self._parse_final_line(self._partial_line)
+            if metric is not None:
+                new_metrics.append(metric)
+            self._partial_line = b""
+        self.metrics.extend(new_metrics)
+        return new_metrics
+
+    def _parse_final_line(self, line: bytes) -> dict[str, Any] | None:
+        # Writer may have been killed while writing this line
+        try:
+            return self._parse_line(line)
+        except ValueError:
+            logger.warning(f"Skipping incomplete final line in {self.path}")
+            return None
+
+    def _parse_line(self, line: bytes) -> dict[str, Any] | None:
+        if _METRIC_TAG_BYTES in line:
+            match = _METRIC_REGEX.search(line.decode("utf-8", errors="replace"))
+            if match is not None:
+                return json.loads(match.group(1))
+        return None
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_file"] = None
+        return state
+
+
+class MetricsFileTailer(MetricsLogTailer):
+    """
+    Version of :class:`MetricsLogTailer` for metrics files written by
+    :class:`Reporter` if :const:`~syne_tune.constants.ST_METRICS_FILE_ENV_VAR`
+    is set. Each line is a JSON record, so no pattern matching is needed.
+
+    :param path: Path of metrics file
+    :param metrics: See :class:`MetricsLogTailer`
+    """
+
+    def _parse_line(self, line: bytes) -> dict[str, Any] | None:
+        if line.strip():
+            return json.loads(line)
+        return None
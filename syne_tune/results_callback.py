@@ -1,6 +1,13 @@
+from pathlib import Path
 from typing import Any
 from time import perf_counter
 import copy
+import json
+import logging
+import os
+import shutil
+
+import numpy as np
 import pandas as pd
 
 from syne_tune.backend.trial_status import Trial
@@ -10,10 +17,55 @@ from syne_tune.constants import (
     ST_STATUS,
     ST_TUNER_TIME,
     ST_RESULTS_DATAFRAME_FILENAME,
+    ST_RESULTS_SEGMENTS_DIRNAME,
 )
 from syne_tune.tuner_callback import TunerCallback
 from syne_tune.util import RegularCallback
 
+logger = logging.getLogger(__name__)
+
+
+MAX_SEGMENT_SIZE = 16 * 1024 * 1024
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+
+def _segment_paths(segments_path: Path) -> list[Path]:
+    return sorted(segments_path.glob("*.ndjson"))
+
+
+def _count_lines(path: Path) -> int:
+    with open(path, "r") as f:
+        return sum(1 for _ in f)
+
+
+def load_results_segments(segments_path: str | Path) -> pd.DataFrame | None:
+    """
+    Loads results appended by :class:`StoreResultsCallback` to segment files
+    while tuning is running. A final line which is incomplete (e.g., since
+    the tuner was interrupted while writing) is skipped.
+
+    :param segments_path: Directory containing segment files
+    :return: Results dataframe, or ``None`` if ``segments_path`` does not
+        contain any segments
+    """
+    segment_paths = _segment_paths(Path(segments_path))
+    if not segment_paths:
+        return None
+    results = []
+    for segment_path in segment_paths:
+        with open(segment_path, "r") as f:
+            for line in f:
+                try:
+                    results.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping incomplete line in {segment_path}")
+    return pd.DataFrame(results)
+
 
 class ExtraResultsComposer:
     """
@@ -52,21 +104,51 @@ class StoreResultsCallback(TunerCallback):
     Default implementation of :class:`~TunerCallback` which records all
     reported results, and allows to store them as CSV file.
 
+    While tuning is running, results are stored incrementally: every
+    ``results_update_interval`` seconds, results reported since the last
+    update are appended as JSON lines to segment files in
+    ``{tuner.tuner_path}/{ST_RESULTS_SEGMENTS_DIRNAME}``, so the cost of an
+    update does not depend on the number of results stored before. A new
+    segment is started once the current one exceeds ``max_segment_size``
+    bytes, so that storage synced to remote only uploads the last segment. At
+    the end of tuning, segments are compacted into
+    ``{tuner.tuner_path}/{ST_RESULTS_DATAFRAME_FILENAME}``.
+    :func:`~syne_tune.experiments.load_experiment` reads results from either
+    of them.
+
+    If ``keep_results_in_memory`` is ``False``, results are dropped from
+    :attr:`results` once they have been appended to a segment, so that memory
+    does not grow with the number of results. :meth:`dataframe` then reads
+    results back from the segments.
+
     :param add_wallclock_time: If ``True``, wallclock time since call of
         ``on_tuning_start`` is stored as
         :const:`~syne_tune.constants.ST_TUNER_TIME`.
     :param extra_results_composer: Optional. If given, this is called in
         :meth:`on_trial_result`, and the resulting dictionary is appended as
         extra columns to the results dataframe
+    :param max_segment_size: Maximum size of a segment file (in bytes).
+        Defaults to :const:`MAX_SEGMENT_SIZE`
+    :param keep_results_in_memory: See above. Defaults to ``True``
     """
 
     def __init__(
         self,
         add_wallclock_time: bool = True,
         extra_results_composer: ExtraResultsComposer | None = None,
+        max_segment_size: int = MAX_SEGMENT_SIZE,
+        keep_results_in_memory: bool = True,
     ):
         self.results = []
         self.csv_file = None
+        self.segments_path = None
+        self.max_segment_size = max_segment_size
+        self.keep_results_in_memory = keep_results_in_memory
+        # Number of entries of ``results`` already appended to segments
+        self._num_results_stored = 0
+        # Number of results received in :meth:`on_trial_result`
+        self._num_results_reported = 0
+        self._segment_index = 0
         self.save_results_at_frequency = None
         self.add_wallclock_time = add_wallclock_time
         self._extra_results_composer = extra_results_composer
@@ -105,26 +187,105 @@ class StoreResultsCallback(TunerCallback):
         self._append_extra_results(result)
 
         self.results.append(result)
+        self._num_results_reported += 1
 
         if self.csv_file is not None:
             self.save_results_at_frequency()
 
+    def _segment_path(self) -> Path:
+        return self.segments_path / f"{self._segment_index:06d}.ndjson"
+
+    def _append_to_segment(self, results: list[dict[str, Any]]):
+        lines = "".join(
+            json.dumps(result, default=_json_default) + "\n" for result in results
+        )
+        segment_path = self._segment_path()
+        with open(segment_path, "a") as f:
+            f.write(lines)
+        if segment_path.stat().st_size >= self.max_segment_size:
+            self._segment_index += 1
+
     def store_results(self):
         """
-        Store current results into CSV file, of name
-        ``{tuner.tuner_path}/{ST_RESULTS_DATAFRAME_FILENAME}``.
+        Appends results reported since the last call to the current segment
+        file in ``{tuner.tuner_path}/{ST_RESULTS_SEGMENTS_DIRNAME}``.
         """
-        if self.csv_file is not None:
-            self.dataframe().to_csv(self.csv_file, index=False)
+        if self.segments_path is None or self._num_results_stored == len(self.results):
+            return
+        self._append_to_segment(self.results[self._num_results_stored :])
+        if self.keep_results_in_memory:
+            self._num_results_stored = len(self.results)
+        else:
+            self.results = []
+            self._num_results_stored = 0
+
+    def compact_results(self):
+        """
+        Stores all results into CSV file, of name
+        ``{tuner.tuner_path}/{ST_RESULTS_DATAFRAME_FILENAME}``, and removes
+        the segment files.
+        """
+        if self.csv_file is None:
+            return
+        self.store_results()
+        results_df = load_results_segments(self.segments_path)
+        if results_df is None:
+            results_df = pd.DataFrame()
+        # Write to temporary file first, so that results are never lost if
+        # interrupted
+        tmp_file = self.csv_file + ".tmp"
+        archive_name = Path(self.csv_file).name.removesuffix(".zip")
+        results_df.to_csv(
+            tmp_file,
+            index=False,
+            compression={"method": "zip", "archive_name": archive_name},
+        )
+        os.replace(tmp_file, self.csv_file)
+        shutil.rmtree(self.segments_path, ignore_errors=True)
 
     def dataframe(self) -> pd.DataFrame:
-        return pd.DataFrame(self.results)
+        if self.keep_results_in_memory or self.segments_path is None:
+            return pd.DataFrame(self.results)
+        self.store_results()
+        results_df = load_results_segments(self.segments_path)
+        return pd.DataFrame() if results_df is None else results_df
 
     def on_tuning_start(self, tuner):
         # We set the path of the csv file once the tuner is created, since the
         # path may change when the tuner is stopped and resumed again on a
         # different machine.
         self.csv_file = str(tuner.tuner_path / ST_RESULTS_DATAFRAME_FILENAME)
+        self.segments_path = tuner.tuner_path / ST_RESULTS_SEGMENTS_DIRNAME
+        if self.keep_results_in_memory:
+            # Segments are written from scratch, so that results recorded
+            # before the tuner was stopped and resumed are not lost in the
+            # compaction
+            shutil.rmtree(self.segments_path, ignore_errors=True)
+            self.segments_path.mkdir(parents=True, exist_ok=True)
+            self._num_results_stored = 0
+            self._segment_index = 0
+        else:
+            # Results recorded before the tuner was stopped and resumed are
+            # only available on disk, in segments or (if compacted already)
+            # in the CSV file
+            self.segments_path.mkdir(parents=True, exist_ok=True)
+            self._segment_index = len(_segment_paths(self.segments_path))
+            if self._segment_index == 0 and Path(self.csv_file).exists():
+                self._append_to_segment(
+                    pd.read_csv(self.csv_file).to_dict(orient="records")
+                )
+            # Results may have been stored after the tuner was serialized. If
+            # they were replayed from the journal of the tuner, they must not
+            # be stored again
+            num_results_on_disk = sum(
+                _count_lines(segment_path)
+                for segment_path in _segment_paths(self.segments_path)
+            )
+            num_stored_before = self._num_results_reported - len(self.results)
+            num_to_drop = num_results_on_disk - num_stored_before
+            if num_to_drop > 0:
+                self.results = self.results[num_to_drop:]
+            self._num_results_stored = 0
         # We only save results every ``results_update_frequency`` seconds as
         # this operation may be expensive on remote storage.
         self.save_results_at_frequency = RegularCallback(
@@ -138,5 +299,6 @@ class StoreResultsCallback(TunerCallback):
 
     def on_tuning_end(self):
         # Store the results in case some results were not committed yet (since
-        # they are saved every ``results_update_interval`` seconds)
-        self.store_results()
+        # they are saved every ``results_update_interval`` seconds), and
+        # compact segments into a single file
+        self.compact_results()
@@ -182,16 +182,10 @@ class PlateauStopper(object):
         if status.num_trials_finished == 0:
             return False
 
-        trials = status.trial_rows
-        trajectory = []
-        curr_best = None
-
-        for ti in trials.values():
-            if self._metric in ti:
-                y = self.multiplier * ti[self._metric]
-                if curr_best is None or y < curr_best:
-                    curr_best = y
-                trajectory.append(curr_best)
+        values, present = status.trial_table.get_column(self._metric)
+        trajectory = np.minimum.accumulate(
+            self.multiplier * values[present].astype(np.float64)
+        )
 
         top_values = trajectory[-self._num_trials :]
         # If the current iteration has to stop
@@ -90,23 +90,20 @@ class AutomaticTerminationCriterion(object):
     def __call__(self, status: TuningStatus) -> bool:
         """Return a boolean representing if the tuning has to stop."""
 
-        trials = status.trial_rows
+        trial_table = status.trial_table
 
-        if len(trials) == 0:
+        if len(trial_table) == 0:
             return False
 
-        evaluations = []
-        observations = []
-        for trial in trials.values():
-            if self._metric not in trial:
-                continue
-            y = self.multiplier * trial[self._metric]
-            evaluations.append(y)
-
-            observation = {}
-            for hp in self._config_space:
-                observation[hp] = trial[hp]
-            observations.append(observation)
+        values, present = trial_table.get_column(self._metric)
+        evaluations = self.multiplier * values[present].astype(np.float64)
+        hp_values = [
+            trial_table.get_column(hp)[0][present].tolist() for hp in self._config_space
+        ]
+        observations = [
+            dict(zip(self._config_space, observation))
+            for observation in zip(*hp_values)
+        ]
 
         if len(observations) < self._warm_up:
             return False
@@ -0,0 +1,270 @@
+import numbers
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+INITIAL_CAPACITY = 64
+
+
+def _kind_of(value: Any) -> str:
+    if isinstance(value, (bool, np.bool_)) or not isinstance(value, numbers.Number):
+        return "object"
+    if isinstance(value, numbers.Integral):
+        return "int"
+    if isinstance(value, numbers.Real):
+        return "float"
+    return "object"
+
+
+_DTYPES = {"int": np.int64, "float": np.float64, "object": object}
+
+_FILL_VALUES = {"int": 0, "float": np.nan, "object": None}
+
+
+class _Column:
+    """
+    Values of a column of :class:`TrialTable`, along with a mask of rows where
+    values are present. ``kind`` is one of "int", "float", "object". Integer
+    columns are converted to float columns if a non-integral number is set,
+    numeric columns are converted to object columns if a non-number is set.
+    """
+
+    def __init__(self, kind: str, capacity: int):
+        self.kind = kind
+        self.values = np.full(capacity, _FILL_VALUES[kind], dtype=_DTYPES[kind])
+        self.present = np.zeros(capacity, dtype=bool)
+
+    def resize(self, capacity: int):
+        values = np.full(capacity, _FILL_VALUES[self.kind], dtype=_DTYPES[self.kind])
+        present = np.zeros(capacity, dtype=bool)
+        num = len(self.values)
+        values[:num] = self.values
+        present[:num] = self.present
+        self.values = values
+        self.present = present
+
+    def set(self, row: int, value: Any):
+        kind = _kind_of(value)
+        if kind != self.kind and self.kind != "object":
+            if kind == "object":
+                self._convert("object")
+            elif self.kind == "int":
+                self._convert("float")
+        self.values[row] = value
+        self.present[row] = True
+
+    def _convert(self, kind: str):
+        if kind == "object":
+            values = np.full(len(self.values), None, dtype=object)
+            for row in np.flatnonzero(self.present):
+                values[row] = self.values[row].item()
+        else:
+            values = self.values.astype(_DTYPES[kind])
+            values[~self.present] = _FILL_VALUES[kind]
+        self.kind = kind
+        self.values = values
+
+    def get(self, row: int) -> Any:
+        value = self.values[row]
+        return value if self.kind == "object" else value.item()
+
+    def to_array(self, rows: np.ndarray) -> np.ndarray:
+        values = self.values[rows]
+        present = self.present[rows]
+        if present.all():
+            return values.copy() if values.base is self.values else values
+        if self.kind == "int":
+            values = values.astype(np.float64)
+        values[~present] = np.nan
+        return values
+
+
+class TrialTable:
+    """
+    Table with a row per trial, stored column by column. Numeric columns are
+    backed by ``numpy`` arrays, whose type stays the same as long as the
+    values are of the same type. Rows are updated in place, and the table
+    keeps track of the order in which rows were updated last, so that the
+    most recently updated rows can be obtained at a cost independent of the
+    number of trials.
+
+    The rows of the table are also available as dictionaries via
+    :meth:`rows`, which returns a read-only mapping from trial ID to row.
+    """
+
+    def __init__(self):
+        self._capacity = INITIAL_CAPACITY
+        self._num_rows = 0
+        # Maps ``trial_id`` to row index
+        self._row_index = dict()
+        self._trial_ids = []
+        # Maps column name to :class:`_Column`, in order of first appearance
+        self._columns = dict()
+        # Names of columns set for each row, in the order they were set
+        self._row_columns = []
+        # Rows in order of their last update
+        self._recently_updated = OrderedDict()
+
+    def __len__(self) -> int:
+        return self._num_rows
+
+    def __contains__(self, trial_id: int) -> bool:
+        return trial_id in self._row_index
+
+    def trial_ids(self) -> list[int]:
+        """
+        :return: Trial IDs in the order their rows were added
+        """
+        return list(self._trial_ids)
+
+    def _add_row(self, trial_id: int) -> int:
+        if self._num_rows == self._capacity:
+            self._capacity *= 2
+            for column in self._columns.values():
+                column.resize(self._capacity)
+        row = self._num_rows
+        self._num_rows += 1
+        self._row_index[trial_id] = row
+        self._trial_ids.append(trial_id)
+        self._row_columns.append(())
+        return row
+
+    def _set(self, row: int, name: str, value: Any):
+        column = self._columns.get(name)
+        if column is None:
+            column = _Column(_kind_of(value), self._capacity)
+            self._columns[name] = column
+        column.set(row, value)
+
+    def _mark_updated(self, row: int):
+        self._recently_updated.pop(row, None)
+        self._recently_updated[row] = None
+
+    def set_row(self, trial_id: int, values: dict[str, Any]):
+        """
+        Sets the row of trial ``trial_id`` to ``values``. Columns not in
+        ``values`` are cleared for this row.
+
+        :param trial_id: ID of trial, a row is added if not present
+        :param values: Values of row
+        """
+        row = self._row_index.get(trial_id)
+        if row is None:
+            row = self._add_row(trial_id)
+        for name in self._row_columns[row]:
+            if name not in values:
+                self._columns[name].present[row] = False
+        for name, value in values.items():
+            self._set(row, name, value)
+        self._row_columns[row] = tuple(values.keys())
+        self._mark_updated(row)
+
+    def set_value(self, trial_id: int, name: str, value: Any):
+        """
+        Sets a single value in the row of trial ``trial_id``, which must be
+        present.
+
+        :param trial_id: ID of trial
+        :param name: Name of column
+        :param value: New value
+        """
+        row = self._row_index[trial_id]
+        self._set(row, name, value)
+        if name not in self._row_columns[row]:
+            self._row_columns[row] = self._row_columns[row] + (name,)
+        self._mark_updated(row)
+
+    def get_row(self, trial_id: int) -> dict[str, Any]:
+        """
+        :param trial_id: ID of trial, must be present
+        :return: Row of trial as dictionary
+        """
+        row = self._row_index[trial_id]
+        return {name: self._columns[name].get(row) for name in self._row_columns[row]}
+
+    def get_value(self, trial_id: int, name: str, default: Any = None) -> Any:
+        """
+        :param trial_id: ID of trial, must be present
+        :param name: Name of column
+        :param default: Returned if there is no value for this trial
+        :return: Value in row of trial
+        """
+        row = self._row_index[trial_id]
+        column = self._columns.get(name)
+        if column is None or not column.present[row]:
+            return default
+        return column.get(row)
+
+    def get_column(self, name: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        :param name: Name of column
+        :return: ``(values, present)``, both over all rows in the order they
+            were added, where ``present`` masks the rows having a value (other
+            entries of ``values`` are undefined). These are views of the
+            table, which must not be modified
+        """
+        column = self._columns.get(name)
+        if column is None:
+            return (
+                np.full(self._num_rows, None, dtype=object),
+                np.zeros(self._num_rows, dtype=bool),
+            )
+        return column.values[: self._num_rows], column.present[: self._num_rows]
+
+    def rows(self) -> Mapping[int, dict[str, Any]]:
+        """
+        :return: Read-only mapping from trial ID to row as dictionary, in the
+            order rows were added. Rows are created when accessed
+        """
+        return _TrialRowsView(self)
+
+    def recently_updated_trial_ids(self, num: int | None = None) -> list[int]:
+        """
+        :param num: Maximum number of trial IDs to return. Defaults to all
+        :return: IDs of the ``num`` trials whose rows were updated last, in the
+            order rows were added
+        """
+        if num is None or num >= self._num_rows:
+            return list(self._trial_ids)
+        rows = []
+        for row in reversed(self._recently_updated):
+            rows.append(row)
+            if len(rows) >= num:
+                break
+        return [self._trial_ids[row] for row in sorted(rows)]
+
+    def to_dataframe(self, trial_ids: list[int] | None = None) -> pd.DataFrame:
+        """
+        :param trial_ids: If given, only rows of these trials are returned,
+            in this order. Defaults to all rows, in the order they were added
+        :return: Table as dataframe. Missing values are NaN
+        """
+        if trial_ids is None:
+            rows = np.arange(self._num_rows)
+        else:
+            rows = np.array([self._row_index[trial_id] for trial_id in trial_ids])
+        data = dict()
+        if len(rows) > 0:
+            for name, column in self._columns.items():
+                if column.present[rows].any():
+                    data[name] = column.to_array(rows)
+        return pd.DataFrame(data).infer_objects()
+
+
+class _TrialRowsView(Mapping):
+    def __init__(self, table: TrialTable):
+        self._table = table
+
+    def __getitem__(self, trial_id: int) -> dict[str, Any]:
+        if trial_id not in self._table:
+            raise KeyError(trial_id)
+        return self._table.get_row(trial_id)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._table.trial_ids())
+
+    def __len__(self) -> int:
+        return len(self._table)
@@ -1,12 +1,15 @@
 import logging
 import time
 from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 from collections.abc import Callable
 
 import dill as dill
 
+from syne_tune.background_saver import BackgroundSaver, write_atomically
 from syne_tune.backend.trial_backend import (
     TrialBackend,
     TrialAndStatusInformation,
@@ -18,13 +21,21 @@ from syne_tune.constants import (
     ST_TUNER_START_TIMESTAMP,
     ST_METADATA_FILENAME,
     ST_TUNER_DILL_FILENAME,
+    ST_METRICS_HISTORY_DIRNAME,
+    ST_PROFILE_FILENAME,
     TUNER_DEFAULT_SLEEP_TIME,
 )
-from syne_tune.optimizer.scheduler import SchedulerDecision, TrialScheduler
+from syne_tune.optimizer.scheduler import (
+    SchedulerDecision,
+    TrialScheduler,
+    TrialSuggestion,
+)
 from syne_tune.optimizer.schedulers.remove_checkpoints import (
     RemoveCheckpointsSchedulerMixin,
 )
+from syne_tune.optimizer.schedulers.utils.simple_profiler import SimpleProfiler
 from syne_tune.tuner_callback import TunerCallback
+from syne_tune.tuner_journal import TunerJournal
 from syne_tune.results_callback import StoreResultsCallback
 from syne_tune.tuning_status import TuningStatus, print_best_metric_found
 from syne_tune.tuner_logger import TunerLogger
@@ -39,6 +50,18 @@ from syne_tune.util import (
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_SNAPSHOT_INTERVAL = 600.0
+
+
+class ConfigSpaceExhausted(Exception):
+    """
+    Raised if the scheduler does not suggest any new configuration. This is not
+    a ``StopIteration``, which cannot be raised through coroutines (PEP 479).
+    """
+
+    pass
+
+
 class Tuner:
     """
     Controller of tuning loop, manages interplay between scheduler and
@@ -54,8 +77,11 @@ class Tuner:
     :param n_workers: Number of workers used here. Note that the backend
         needs to support (at least) this number of workers to be run
         in parallel
-    :param sleep_time: Time to sleep when all workers are busy. Defaults to
-        :const:`~syne_tune.constants.DEFAULT_SLEEP_TIME`
+    :param sleep_time: Maximum time to wait when all workers are busy. The
+        tuner wakes up earlier if the backend signals an event (e.g., a new
+        result or a trial finishing), see
+        :meth:`~syne_tune.backend.trial_backend.TrialBackend.wait_for_events`.
+        Defaults to :const:`~syne_tune.constants.DEFAULT_SLEEP_TIME`
     :param results_update_interval: Frequency at which results are updated and
         stored (in seconds). Defaults to 10.
     :param print_update_interval: Frequency at which result table is printed.
@@ -120,6 +146,47 @@ class Tuner:
         is costly and error-prone.
     :param output_logger: Custom OutputLogger instance for controlling output formatting.
         If None, a default OutputLogger with colors and emojis is used.
+    :param max_results_in_memory: If given, memory used for results does not
+        grow with the length of the experiment. The trial backend keeps at
+        most this many of the most recent results per trial in memory, older
+        ones are spilled to ``{trial_backend_path}/{ST_METRICS_HISTORY_DIRNAME}``
+        (see
+        :meth:`~syne_tune.backend.trial_backend.TrialBackend.set_metrics_spill`),
+        and :class:`~syne_tune.results_callback.StoreResultsCallback` callbacks
+        drop results from memory once they are stored. Per-trial summaries
+        used for the tuning status are not affected. Defaults to ``None``
+        (all results are kept in memory)
+    :param save_journal: If ``True`` (and ``save_tuner`` is ``True``), tuning
+        events (trials started or resumed, results and status changes) are
+        appended to a journal in ``tuner_path`` in every iteration of the
+        tuning loop, while the :class:`Tuner` object is serialized only every
+        ``snapshot_interval`` seconds. :meth:`load` restores the latest
+        snapshot and replays the journal since then, so that no results are
+        lost if the experiment is interrupted. Results are replayed into the
+        scheduler, the tuning status and
+        :class:`~syne_tune.results_callback.StoreResultsCallback` callbacks,
+        other callbacks do not see them again. Defaults to ``False``
+    :param snapshot_interval: Frequency at which the :class:`Tuner` object is
+        serialized (in seconds) if ``save_journal`` is ``True``. Defaults to
+        :const:`DEFAULT_SNAPSHOT_INTERVAL`
+    :param save_in_background: If ``True``, the :class:`Tuner` object is
+        serialized and written to disk by a forked child process while the
+        tuning loop continues, so that serializing and writing large
+        scheduler states does not delay the scheduling of trials. Where
+        ``os.fork`` is not available, the tuner is serialized in the tuning
+        loop and only written in the background. A save is
+        skipped if the previous one is still in flight. The final save at the
+        end of :meth:`run` waits for any save in flight and is done
+        synchronously. Defaults to ``False``
+    :param profile: If ``True``, the time spent in each iteration of the
+        tuning loop is measured and broken down into fetching results from
+        the backend, scheduler calls (``on_trial_result``,
+        ``on_trial_complete``, ``suggest``), each callback, saving the tuner
+        and sleeping. Also, the number of idle workers is integrated over
+        time (tag "idle_worker_seconds"). At the end of :meth:`run`, a summary
+        is printed, and all measurements are stored in
+        ``{tuner_path}/{ST_PROFILE_FILENAME}``, in the Chrome trace event
+        format. Defaults to ``False``
     """
 
     def __init__(
@@ -142,6 +209,11 @@ class Tuner:
         start_jobs_without_delay: bool = True,
         trial_backend_path: str | None = None,
         output_logger: TunerLogger | None = None,
+        max_results_in_memory: int | None = None,
+        save_journal: bool = False,
+        snapshot_interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+        save_in_background: bool = False,
+        profile: bool = False,
     ):
         self.trial_backend = trial_backend
         self.scheduler = scheduler
@@ -189,6 +261,18 @@ class Tuner:
             tuner_name=self.name,
         )
         self._init_callbacks(callbacks)
+        self.max_results_in_memory = max_results_in_memory
+        if max_results_in_memory is not None:
+            self._limit_results_in_memory()
+        self.snapshot_interval = snapshot_interval
+        self._journal = (
+            TunerJournal(self.tuner_path) if save_journal and save_tuner else None
+        )
+        self._replaying_journal = False
+        self._background_saver = BackgroundSaver() if save_in_background else None
+        self.profile = profile
+        self._profiler = None
+        self._idle_workers_since = None
         self.tuning_status = None
         self.tuner_saver = None
         self.status_printer = None
@@ -207,6 +291,15 @@ class Tuner:
                 )
         self.callbacks: list[TunerCallback] = callbacks
 
+    def _limit_results_in_memory(self):
+        self.trial_backend.set_metrics_spill(
+            path=Path(self.trial_backend_path) / ST_METRICS_HISTORY_DIRNAME,
+            max_metrics_in_memory=self.max_results_in_memory,
+        )
+        for callback in self.callbacks:
+            if isinstance(callback, StoreResultsCallback):
+                callback.keep_results_in_memory = False
+
     def _initialize_early_checkpoint_removal(self):
         """
         If the scheduler supports early checkpoint removal, the specific callback
@@ -225,41 +318,7 @@ class Tuner:
         """Launches the tuning."""
         done_trials_statuses = OrderedDict()
         try:
-            self.output_logger.print_experiment_header(
-                name=self.name,
-                backend_name=type(self.trial_backend).__name__,
-                n_workers=self.n_workers,
-                scheduler_name=type(self.scheduler).__name__,
-                results_path=self.tuner_path,
-                log_path=self.trial_backend_path,
-            )
-
-            if self.tuning_status is None:
-                self.tuning_status = TuningStatus(
-                    metric_names=self.scheduler.metric_names()
-                )
-            # prints the status every ``print_update_interval`` seconds
-            self.status_printer = RegularCallback(
-                callback=lambda tuning_status: self.output_logger.print_tuning_status(
-                    tuning_status
-                ),
-                call_seconds_frequency=self.print_update_interval,
-            )
-            # saves the tuner every ``results_update_interval`` seconds
-            if self.save_tuner:
-                self.tuner_saver = RegularCallback(
-                    callback=lambda tuner: tuner.save(),
-                    call_seconds_frequency=self.results_update_interval,
-                )
-
-            self.metadata[ST_TUNER_START_TIMESTAMP] = time.time()
-
-            for callback in self.callbacks:
-                callback.on_tuning_start(self)
-
-            self.tuner_path.mkdir(exist_ok=True, parents=True)
-
-            self._save_metadata()
+            self._initialize_tuning()
 
             # ``running_trial_ids`` contains the ids of all trials currently running,
             # whether they were started from scratch or were resumed from a pausing
@@ -269,8 +328,6 @@ class Tuner:
             config_space_exhausted = False
             stop_condition_reached = self._stop_condition()
 
-            self.output_logger.print_tuning_start()
-
             while (
                 # we stop when either the stop condition is reached
                 not stop_condition_reached
@@ -278,8 +335,8 @@ class Tuner:
                 or self.wait_trial_completion_when_stopping
                 and len(running_trials_ids) > 0
             ):
-                for callback in self.callbacks:
-                    callback.on_loop_start()
+                self._begin_iteration()
+                self._call_callbacks("on_loop_start")
 
                 new_done_trial_statuses, new_results = self._process_new_results(
                     running_trials_ids=running_trials_ids,
@@ -301,6 +358,7 @@ class Tuner:
                 # trials in ``running_trials_ids``.
                 done_trials_statuses.update(new_done_trial_statuses)
                 running_trials_ids.difference_update(new_done_trial_statuses.keys())
+                self._record_idle_workers(len(running_trials_ids))
 
                 if (
                     config_space_exhausted
@@ -310,32 +368,28 @@ class Tuner:
                     # if the search space is exhausted, we loop until the running trials are done or until the
                     # stop condition is reached
                     if len(running_trials_ids) > 0:
-                        if config_space_exhausted:
-                            logger.debug(
-                                f"Configuration space exhausted, waiting for completion of running trials "
-                                f"{running_trials_ids}"
-                            )
-                        else:
-                            logger.debug(
-                                f"Stopping criterion reached, waiting for completion of running trials "
-                                f"{running_trials_ids}"
-                            )
+                        self._log_waiting_for_running_trials(
+                            running_trials_ids, config_space_exhausted
+                        )
                         self._sleep()
                     else:
+                        self._end_iteration()
                         break
                 else:
                     try:
                         self._schedule_new_tasks(running_trials_ids=running_trials_ids)
-                    except StopIteration:
+                    except ConfigSpaceExhausted:
                         self.output_logger.print_config_space_exhausted()
                         config_space_exhausted = True
+                self._record_idle_workers(len(running_trials_ids))
 
                 self.status_printer(self.tuning_status)
 
-                for callback in self.callbacks:
-                    callback.on_loop_end()
+                self._call_callbacks("on_loop_end")
 
+                self._flush_journal()
                 stop_condition_reached = self._stop_condition()
+                self._end_iteration()
         except Exception as e:
             self.output_logger.print_error(
                 "An error happened during the tuning, cleaning up resources before throwing the exception."
@@ -345,39 +399,211 @@ class Tuner:
             # graceful termination block called when the tuner reached its stop condition, when an error happened or
             # when the job got interrupted (can happen in spot-instances or when sending a SIGINT signal with ctrl+C).
             # the block displays the best configuration found and stops trials that may still be running.
-            self.output_logger.print_tuning_complete()
+            self._finalize_tuning()
+            self.output_logger.print_stopping_trials()
+            self.trial_backend.stop_all()
+            self._finalize_after_stopping_trials(done_trials_statuses)
 
-            print_best_metric_found(
-                tuning_status=self.tuning_status,
-                metric_names=self.scheduler.metric_names(),
-                mode=self.scheduler.metric_mode(),
+    def _initialize_tuning(self):
+        """
+        Called at the start of :meth:`run`, before the tuning loop.
+        """
+        self.output_logger.print_experiment_header(
+            name=self.name,
+            backend_name=type(self.trial_backend).__name__,
+            n_workers=self.n_workers,
+            scheduler_name=type(self.scheduler).__name__,
+            results_path=self.tuner_path,
+            log_path=self.trial_backend_path,
+        )
+
+        if self.tuning_status is None:
+            self.tuning_status = TuningStatus(
+                metric_names=self.scheduler.metric_names()
+            )
+        # prints the status every ``print_update_interval`` seconds
+        self.status_printer = RegularCallback(
+            callback=lambda tuning_status: self.output_logger.print_tuning_status(
+                tuning_status
+            ),
+            call_seconds_frequency=self.print_update_interval,
+        )
+        # saves the tuner every ``results_update_interval`` seconds, or every
+        # ``snapshot_interval`` seconds if events are written to the journal
+        if self.save_tuner:
+            self.tuner_saver = RegularCallback(
+                callback=lambda tuner: tuner._save_snapshot(),
+                call_seconds_frequency=(
+                    self.results_update_interval
+                    if self._journal is None
+                    else self.snapshot_interval
+                ),
             )
 
-            # Callbacks (typically includes writing final results)
-            for callback in self.callbacks:
-                callback.on_tuning_end()
+        self.metadata[ST_TUNER_START_TIMESTAMP] = time.time()
+        if self.profile:
+            self._profiler = SimpleProfiler(record_events=True)
+            self._idle_workers_since = None
 
-            # Serialize Tuner object
-            if self.save_tuner:
-                self.save()
+        for callback in self.callbacks:
+            callback.on_tuning_start(self)
 
-            self.output_logger.print_stopping_trials()
-            self.trial_backend.stop_all()
+        self.tuner_path.mkdir(exist_ok=True, parents=True)
 
-            # notify tuning status that jobs were stopped without having to query their status in the backend since
-            # we know that all trials were stopped
-            self.tuning_status.mark_running_job_as_stopped()
+        self._save_metadata()
 
-            # in case too many errors were triggered, show log of last failed job and terminates with an error
-            if self.tuning_status.num_trials_failed > self.max_failures:
-                self._handle_failure(done_trials_statuses=done_trials_statuses)
+        if self.save_tuner and self._journal is not None:
+            # Journal can only be replayed on top of a snapshot
+            self._journal.path = self.tuner_path
+            self._save_snapshot(synchronous=True)
 
-            self.output_logger.print_tuning_finished(self.tuner_path)
+        self.output_logger.print_tuning_start()
+
+    def _finalize_tuning(self):
+        """
+        Called once the tuning loop terminates, before trials which may still
+        be running are stopped.
+        """
+        self.output_logger.print_tuning_complete()
+
+        print_best_metric_found(
+            tuning_status=self.tuning_status,
+            metric_names=self.scheduler.metric_names(),
+            mode=self.scheduler.metric_mode(),
+        )
+
+        # Callbacks (typically includes writing final results)
+        self._call_callbacks("on_tuning_end")
+
+        # Serialize Tuner object
+        if self.save_tuner:
+            self._flush_journal()
+            self._save_snapshot(synchronous=True)
+        if self._background_saver is not None:
+            self._background_saver.shutdown()
+        self.scheduler.close()
+
+        if self._profiler is not None:
+            self._save_profile()
+
+    def _finalize_after_stopping_trials(
+        self, done_trials_statuses: dict[int, tuple[Trial, str]]
+    ):
+        """
+        Called at the very end of :meth:`run`, after all trials have been
+        stopped.
+
+        :param done_trials_statuses: Trials which are done, along with their
+            status
+        """
+        # notify tuning status that jobs were stopped without having to query their status in the backend since
+        # we know that all trials were stopped
+        self.tuning_status.mark_running_job_as_stopped()
+
+        # in case too many errors were triggered, show log of last failed job and terminates with an error
+        if self.tuning_status.num_trials_failed > self.max_failures:
+            self._handle_failure(done_trials_statuses=done_trials_statuses)
+
+        self.output_logger.print_tuning_finished(self.tuner_path)
+
+    @staticmethod
+    def _log_waiting_for_running_trials(
+        running_trials_ids: set[int], config_space_exhausted: bool
+    ):
+        if config_space_exhausted:
+            logger.debug(
+                f"Configuration space exhausted, waiting for completion of running trials "
+                f"{running_trials_ids}"
+            )
+        else:
+            logger.debug(
+                f"Stopping criterion reached, waiting for completion of running trials "
+                f"{running_trials_ids}"
+            )
 
     def _sleep(self):
-        time.sleep(self.sleep_time)
+        start_time = time.perf_counter()
+        with self._profiled("sleep"):
+            self.trial_backend.wait_for_events(timeout=self.sleep_time)
+        sleep_time = time.perf_counter() - start_time
+        self._call_callbacks("on_tuning_sleep", sleep_time)
+
+    def _call_callbacks(self, hook: str, *args, **kwargs):
+        """
+        Calls method ``hook`` of all callbacks.
+
+        :param hook: Name of method of
+            :class:`~syne_tune.tuner_callback.TunerCallback`
+        :param args: Positional arguments of the method
+        :param kwargs: Keyword arguments of the method
+        """
         for callback in self.callbacks:
-            callback.on_tuning_sleep(self.sleep_time)
+            with self._profiled(f"callback:{type(callback).__name__}"):
+                getattr(callback, hook)(*args, **kwargs)
+
+    @contextmanager
+    def _profiled(self, tag: str):
+        """
+        Measures the time spent in the body of the ``with`` statement if
+        ``profile`` is set. Nothing is measured outside of iterations of the
+        tuning loop.
+
+        :param tag: Tag of the measurement
+        """
+        profiler = self._profiler
+        if profiler is None or not profiler.records:
+            yield
+        else:
+            profiler.start(tag)
+            try:
+                yield
+            finally:
+                profiler.stop(tag)
+
+    def _begin_iteration(self):
+        if self._profiler is not None:
+            self._profiler.begin_block({"iteration": len(self._profiler.records)})
+            self._profiler.start("iteration")
+
+    def _end_iteration(self):
+        if self._profiler is not None:
+            self._profiler.stop("iteration")
+
+    def _record_idle_workers(self, num_running_trials: int):
+        """
+        Integrates the number of idle workers over time, assuming that it
+        has not changed since the previous call.
+
+        :param num_running_trials: Number of trials running from now on
+        """
+        if self._profiler is None:
+            return
+        now = time.perf_counter()
+        if self._idle_workers_since is not None:
+            since, num_idle_workers = self._idle_workers_since
+            if num_idle_workers > 0:
+                self._profiler.add(
+                    "idle_worker_seconds", (now - since) * num_idle_workers
+                )
+        self._idle_workers_since = (now, max(self.n_workers - num_running_trials, 0))
+
+    def _save_profile(self):
+        """
+        Stores measurements of ``profile`` in
+        ``{tuner_path}/{ST_PROFILE_FILENAME}`` and prints a summary.
+        """
+        # Timers still running if the tuning loop was interrupted
+        self._profiler.clear()
+        summary = self._profiler.summary()
+        profile = self._profiler.chrome_trace()
+        profile["otherData"] = {
+            "num_iterations": len(self._profiler.records),
+            "n_workers": self.n_workers,
+            "summary": summary,
+        }
+        profile_path = self.tuner_path / ST_PROFILE_FILENAME
+        dump_json_with_numpy(profile, profile_path)
+        self.output_logger.print_profile_summary(summary, profile_path)
 
     @staticmethod
     def _set_metadata(metadata: dict[str, Any], name: str, value):
@@ -426,14 +652,33 @@ class Tuner:
         """
 
         # fetch new results
-        trial_status_dict, new_results = self.trial_backend.fetch_status_results(
-            trial_ids=list(running_trials_ids)
+        with self._profiled("fetch_status_results"):
+            trial_status_dict, new_results = self.trial_backend.fetch_status_results(
+                trial_ids=list(running_trials_ids)
+            )
+        return self._process_fetched_results(
+            running_trials_ids, trial_status_dict, new_results
         )
 
-        for callback in self.callbacks:
-            callback.on_fetch_status_results(
-                trial_status_dict=trial_status_dict, new_results=new_results
-            )
+    def _process_fetched_results(
+        self,
+        running_trials_ids: set[int],
+        trial_status_dict: TrialAndStatusInformation,
+        new_results: TrialIdAndResultList,
+    ) -> (TrialAndStatusInformation, TrialIdAndResultList):
+        """Part of :meth:`_process_new_results` after results have been fetched
+        from the backend.
+
+        :param running_trials_ids: Trials currently running
+        :param trial_status_dict: Result of ``trial_backend.fetch_status_results``
+        :param new_results: Result of ``trial_backend.fetch_status_results``
+        :return: ``(done_trials_statuses, new_results)``
+        """
+        self._call_callbacks(
+            "on_fetch_status_results",
+            trial_status_dict=trial_status_dict,
+            new_results=new_results,
+        )
 
         assert len(running_trials_ids) <= self.n_workers
 
@@ -444,6 +689,7 @@ class Tuner:
         #   timeout argument or a manual interruption
         # - scheduler decided to interrupt them.
         # Note: ``done_trials`` includes trials which are paused.
+        self._record_fetched_results(trial_status_dict, new_results)
         done_trials_statuses = self._update_running_trials(
             trial_status_dict, new_results
         )
@@ -467,15 +713,50 @@ class Tuner:
         :param running_trials_ids: set if trial-ids currently running, gets
             updated if new trials are scheduled.
         """
-        running_trials_threshold = self.n_workers if self.asynchronous_scheduling else 1
         if self.start_jobs_without_delay:
-            # Assume that only the trials in ``running_trial_ids`` are busy (which
-            # is an underestimate for certain backends)
             busy_trial_ids = None
-            num_busy_workers = len(running_trials_ids)
         else:
             # Ask backend how many workers are really busy
             busy_trial_ids = self.trial_backend.busy_trial_ids()
+        num_free_workers, running_trials_ids = self._num_free_workers(
+            running_trials_ids, busy_trial_ids
+        )
+        if num_free_workers is None:
+            self._sleep()
+        else:
+            # Schedule as many trials as we have free workers. Suggestions
+            # for all of them are obtained at once
+            while num_free_workers > 0:
+                suggestions = self._next_suggestions(num_free_workers)
+                for suggestion in suggestions:
+                    trial = self._schedule_new_task(suggestion)
+                    self._register_scheduled_trial(trial, running_trials_ids)
+                num_free_workers -= len(suggestions)
+
+    def _num_free_workers(
+        self,
+        running_trials_ids: set[int],
+        busy_trial_ids: list[tuple[int, str]] | None,
+    ) -> (int | None, set[int]):
+        """
+        :param running_trials_ids: Trials currently running
+        :param busy_trial_ids: Result of ``trial_backend.busy_trial_ids`` if
+            ``start_jobs_without_delay`` is False, otherwise ``None``
+        :return: ``(num_free_workers, running_trials_ids)``, where
+            ``num_free_workers`` is the number of new trials to be scheduled,
+            or ``None`` if the tuner should sleep
+        """
+        num_workers = self.n_workers
+        max_concurrent_trials = self.trial_backend.max_concurrent_trials()
+        if max_concurrent_trials is not None:
+            # Backend may not have resources for ``n_workers`` trials
+            num_workers = min(num_workers, max_concurrent_trials)
+        running_trials_threshold = num_workers if self.asynchronous_scheduling else 1
+        if busy_trial_ids is None:
+            # Assume that only the trials in ``running_trial_ids`` are busy (which
+            # is an underestimate for certain backends)
+            num_busy_workers = len(running_trials_ids)
+        else:
             num_busy_workers = len(busy_trial_ids)
         if num_busy_workers >= running_trials_threshold:
             # Note: For synchronous scheduling, we need to sleep here if at
@@ -484,52 +765,42 @@ class Tuner:
                 f"{num_busy_workers} of {self.n_workers} workers are "
                 f"busy, wait for {self.sleep_time} seconds"
             )
-            self._sleep()
-        else:
-            if not self.start_jobs_without_delay and num_busy_workers < len(
-                running_trials_ids
-            ):
-                # In this case, the information from the backend is more recent
-                running_trials_ids = set(x[0] for x in busy_trial_ids)
-            # Schedule as many trials as we have free workers
-            for _ in range(self.n_workers - num_busy_workers):
-                trial = self._schedule_new_task()
-                trial_id = trial.trial_id
-                running_trials_ids.add(trial_id)
-                # Update tuning status
-                self.tuning_status.update(
-                    trial_status_dict={trial_id: (trial, Status.in_progress)},
-                    new_results=[],
-                )
+            return None, running_trials_ids
+        if busy_trial_ids is not None and num_busy_workers < len(running_trials_ids):
+            # In this case, the information from the backend is more recent
+            running_trials_ids = set(x[0] for x in busy_trial_ids)
+        return num_workers - num_busy_workers, running_trials_ids
+
+    def _register_scheduled_trial(self, trial: Trial, running_trials_ids: set[int]):
+        trial_id = trial.trial_id
+        running_trials_ids.add(trial_id)
+        # Update tuning status
+        self.tuning_status.update(
+            trial_status_dict={trial_id: (trial, Status.in_progress)},
+            new_results=[],
+        )
 
-    def _schedule_new_task(self) -> TrialResult | None:
+    def _schedule_new_task(
+        self, suggestion: TrialSuggestion | None = None
+    ) -> TrialResult | None:
         """Schedules a new task according to scheduler suggestion.
 
+        :param suggestion: Suggestion to be scheduled. If not given, the next
+            suggestion is obtained from the scheduler
         :return: Information for the trial suggested, ``None`` if the scheduler does
             not suggest a new configuration (this can happen if its configuration
             space is exhausted)
         """
-
-        if isinstance(self.scheduler, TrialScheduler):
-            suggestion = self.scheduler.suggest()
-        else:
-            self.output_logger.print_scheduler_deprecated(type(self.scheduler).__name__)
-            suggestion = self.scheduler.suggest(self.trial_backend.new_trial_id())
         if suggestion is None:
-            self.output_logger.print_searcher_out_of_candidates()
-            raise StopIteration
-        elif suggestion.spawn_new_trial_id:
+            suggestion = self._next_suggestion()
+        if suggestion.spawn_new_trial_id:
             # we schedule a new trial, possibly using the checkpoint of ``checkpoint_trial_id``
             # if given.
             trial = self.trial_backend.start_trial(
                 config=suggestion.config.copy(),
                 checkpoint_trial_id=suggestion.checkpoint_trial_id,
             )
-            self.scheduler.on_trial_add(trial=trial)
-            for callback in self.callbacks:
-                callback.on_start_trial(trial)
-            self.output_logger.print_trial_started(trial.trial_id, suggestion.config)
-            return trial
+            self._on_trial_started(trial, suggestion)
         else:
             # suggestion is a trial_id to resume, with possibly a new configuration
             self.output_logger.print_trial_resumed(
@@ -538,9 +809,193 @@ class Tuner:
             trial = self.trial_backend.resume_trial(
                 trial_id=suggestion.checkpoint_trial_id, new_config=suggestion.config
             )
-            for callback in self.callbacks:
-                callback.on_resume_trial(trial)
-            return trial
+            self._on_trial_resumed(trial)
+        return trial
+
+    def _next_suggestion(self) -> TrialSuggestion:
+        """
+        :return: Next suggestion of the scheduler. If the scheduler does not
+            suggest a new configuration (this can happen if its configuration
+            space is exhausted), :class:`ConfigSpaceExhausted` is raised
+        """
+        with self._profiled("scheduler:suggest"):
+            if isinstance(self.scheduler, TrialScheduler):
+                suggestion = self.scheduler.suggest()
+            else:
+                self.output_logger.print_scheduler_deprecated(
+                    type(self.scheduler).__name__
+                )
+                suggestion = self.scheduler.suggest(self.trial_backend.new_trial_id())
+        if suggestion is None:
+            self.output_logger.print_searcher_out_of_candidates()
+            raise ConfigSpaceExhausted
+        return suggestion
+
+    def _next_suggestions(self, num_suggestions: int) -> list[TrialSuggestion]:
+        """
+        :param num_suggestions: Number of free workers
+        :return: Next suggestions of the scheduler, obtained by a single call
+            of ``suggest_batch``. There may be fewer than ``num_suggestions``
+            of them. If the scheduler does not suggest any new configuration,
+            :class:`ConfigSpaceExhausted` is raised
+        """
+        if not isinstance(self.scheduler, TrialScheduler):
+            # Deprecated schedulers need a new trial ID for every suggestion
+            return [self._next_suggestion()]
+        with self._profiled("scheduler:suggest"):
+            suggestions = self.scheduler.suggest_batch(num_suggestions)
+        if not suggestions:
+            self.output_logger.print_searcher_out_of_candidates()
+            raise ConfigSpaceExhausted
+        return suggestions
+
+    def _on_trial_started(self, trial: TrialResult, suggestion: TrialSuggestion):
+        if self._journal is not None:
+            self._journal.append(
+                "start",
+                trial_id=trial.trial_id,
+                config=trial.config,
+                creation_time=trial.creation_time.isoformat(),
+            )
+        self.scheduler.on_trial_add(trial=trial)
+        self._call_callbacks("on_start_trial", trial)
+        self.output_logger.print_trial_started(trial.trial_id, suggestion.config)
+
+    def _on_trial_resumed(self, trial: TrialResult):
+        if self._journal is not None:
+            self._journal.append("resume", trial_id=trial.trial_id, config=trial.config)
+        self._call_callbacks("on_resume_trial", trial)
+
+    def _record_fetched_results(
+        self,
+        trial_status_dict: TrialAndStatusInformation,
+        new_results: TrialIdAndResultList,
+    ):
+        """
+        Appends results and status changes fetched from the backend to the
+        journal. Trials which are still running are only recorded if they
+        reported results.
+        """
+        if self._journal is None or self._replaying_journal:
+            return
+        trial_ids_with_results = set(trial_id for trial_id, _ in new_results)
+        statuses = {
+            trial_id: status
+            for trial_id, (_, status) in trial_status_dict.items()
+            if status != Status.in_progress or trial_id in trial_ids_with_results
+        }
+        if statuses:
+            self._journal.append("results", statuses=statuses, results=new_results)
+
+    def _flush_journal(self):
+        if self._journal is not None:
+            self._journal.flush()
+
+    def _save_snapshot(self, synchronous: bool = False):
+        """
+        Serializes the tuner. If events are written to the journal, a new
+        generation of the journal is started, and files of previous generations
+        are removed once the snapshot has been written.
+
+        If ``save_in_background`` is set and ``synchronous`` is ``False``, the
+        tuner is serialized and written in the background (see
+        :meth:`~syne_tune.background_saver.BackgroundSaver.dump`), unless a
+        previous save is still in flight, in which case nothing is done.
+
+        :param synchronous: If ``True``, the tuner is serialized in this
+            process, after waiting for a save in flight. Defaults to ``False``
+        """
+        with self._profiled("save"):
+            saver = self._background_saver
+            if saver is not None and not synchronous:
+                if saver.busy():
+                    logger.debug("Previous save of tuner still in flight, skipping")
+                    return
+                if self._journal is not None:
+                    self._journal.start_generation()
+                saver.dump(
+                    obj=self,
+                    path=self.tuner_path / ST_TUNER_DILL_FILENAME,
+                    on_success=self._on_snapshot_saved,
+                )
+            else:
+                if saver is not None:
+                    saver.wait()
+                if self._journal is not None:
+                    self._journal.start_generation()
+                self._write_tuner(self.tuner_path)
+                self._on_snapshot_saved()
+
+    def _on_snapshot_saved(self):
+        if self._journal is not None:
+            self._journal.remove_previous_generations()
+        self.trial_backend.on_tuner_save()  # callback
+
+    def _replay_journal(self):
+        """
+        Replays events written to the journal after the snapshot this tuner
+        was loaded from. Trials are not started, stopped or paused in the
+        backend, which only registers their new status.
+        """
+        events = self._journal.events()
+        if not events:
+            return
+        logger.info(f"Replaying {len(events)} events from tuner journal")
+        callbacks = self.callbacks
+        # Only callbacks storing results see results again
+        self.callbacks = [
+            callback
+            for callback in callbacks
+            if isinstance(callback, StoreResultsCallback)
+        ]
+        for callback in self.callbacks:
+            # Results are written once the tuning is resumed
+            callback.csv_file = None
+        self._replaying_journal = True
+        try:
+            for event in events:
+                self._replay_event(event)
+        finally:
+            self.callbacks = callbacks
+            self._replaying_journal = False
+
+    def _replay_event(self, event: dict[str, Any]):
+        if event["event"] == "start":
+            trial = self.trial_backend.restore_trial(
+                trial_id=event["trial_id"],
+                status=Status.in_progress,
+                config=event["config"],
+                creation_time=datetime.fromisoformat(event["creation_time"]),
+            )
+            self.scheduler.on_trial_add(trial=trial)
+            self._register_scheduled_trial(trial, running_trials_ids=set())
+        elif event["event"] == "resume":
+            trial = self.trial_backend.restore_trial(
+                trial_id=event["trial_id"],
+                status=Status.in_progress,
+                config=event["config"],
+            )
+            self._register_scheduled_trial(trial, running_trials_ids=set())
+        else:
+            trial_status_dict = dict()
+            for trial_id, status in event["statuses"].items():
+                trial_id = int(trial_id)
+                trial = self.trial_backend.restore_trial(trial_id, status=status)
+                trial_status_dict[trial_id] = (
+                    Trial(
+                        trial_id=trial_id,
+                        config=trial.config,
+                        creation_time=trial.creation_time,
+                    ),
+                    status,
+                )
+            new_results = [(trial_id, result) for trial_id, result in event["results"]]
+            done_trials_statuses, _ = self._process_fetched_results(
+                set(), trial_status_dict, new_results
+            )
+            # Decisions of the scheduler to stop or pause trials
+            for trial_id, (_, status) in done_trials_statuses.items():
+                self.trial_backend.restore_trial(trial_id, status=status)
 
     def _handle_failure(self, done_trials_statuses: dict[int, tuple[Trial, str]]):
         self.output_logger.print_max_failures_reached(self.max_failures)
@@ -551,22 +1006,41 @@ class Tuner:
                 self.output_logger.print_failure_logs(trial_id, stdout, stderr)
                 raise ValueError(f"Trial - {trial_id} failed")
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Measurements of ``profile`` are specific to a run of the tuning loop
+        state["_profiler"] = None
+        state["_idle_workers_since"] = None
+        return state
+
     def save(self, folder: str | None = None):
-        if folder is None:
-            tuner_serialized_path = self.tuner_path / ST_TUNER_DILL_FILENAME
-        else:
-            tuner_serialized_path = Path(folder) / ST_TUNER_DILL_FILENAME
-        with open(tuner_serialized_path, "wb") as f:
-            logger.debug(f"saving tuner in {tuner_serialized_path}")
-            dill.dump(self, f)
-            self.trial_backend.on_tuner_save()  # callback
+        self._write_tuner(self.tuner_path if folder is None else Path(folder))
+        self.trial_backend.on_tuner_save()  # callback
+
+    def _write_tuner(self, folder: Path):
+        tuner_serialized_path = folder / ST_TUNER_DILL_FILENAME
+        logger.debug(f"saving tuner in {tuner_serialized_path}")
+        write_atomically(dill.dumps(self), tuner_serialized_path)
 
     @staticmethod
     def load(tuner_path: str | None):
         with open(Path(tuner_path) / ST_TUNER_DILL_FILENAME, "rb") as f:
             tuner = dill.load(f)
-            tuner.tuner_path = Path(experiment_path(tuner_name=tuner.name))
-            return tuner
+        tuner.tuner_path = Path(experiment_path(tuner_name=tuner.name))
+        if not hasattr(tuner, "_journal"):
+            # Object was serialized before the journal was introduced
+            tuner._journal = None
+            tuner._replaying_journal = False
+            tuner._background_saver = None
+        if not hasattr(tuner, "profile"):
+            # Object was serialized before profiling was introduced
+            tuner.profile = False
+            tuner._profiler = None
+            tuner._idle_workers_since = None
+        if tuner._journal is not None:
+            tuner._journal.path = Path(tuner_path)
+            tuner._replay_journal()
+        return tuner
 
     def _update_running_trials(
         self,
@@ -597,29 +1071,34 @@ class Tuner:
 
                 # communicate new result to the searcher and the scheduler
                 self.last_seen_result_per_trial[trial_id] = result
-                decision = self.scheduler.on_trial_result(trial=trial, result=result)
-
-                for callback in self.callbacks:
-                    callback.on_trial_result(
-                        trial=trial,
-                        status=status,
-                        result=result,
-                        decision=decision,
+                with self._profiled("scheduler:on_trial_result"):
+                    decision = self.scheduler.on_trial_result(
+                        trial=trial, result=result
                     )
 
+                self._call_callbacks(
+                    "on_trial_result",
+                    trial=trial,
+                    status=status,
+                    result=result,
+                    decision=decision,
+                )
+
                 if decision == SchedulerDecision.STOP:
                     if status != Status.completed:
                         # we override the status immediately, this avoids calling the backend status another time to
                         # update after the change which may be expensive
                         status = Status.stopped
-                        self.trial_backend.stop_trial(trial_id=trial_id, result=result)
+                        if not self._replaying_journal:
+                            self._stop_trial(trial_id=trial_id, result=result)
                     self.scheduler.on_trial_remove(trial=trial)
                     done_trials[trial_id] = (trial, status)
                     self.trials_scheduler_stopped.add(trial_id)
 
                 elif decision == SchedulerDecision.PAUSE:
                     status = Status.paused
-                    self.trial_backend.pause_trial(trial_id=trial_id, result=result)
+                    if not self._replaying_journal:
+                        self._pause_trial(trial_id=trial_id, result=result)
                     self.scheduler.on_trial_remove(trial=trial)
                     done_trials[trial_id] = (trial, status)
 
@@ -654,10 +1133,10 @@ class Tuner:
 
                 last_result = self.last_seen_result_per_trial[trial_id]
                 if trial_id not in done_trials:
-                    self.scheduler.on_trial_complete(trial, last_result)
+                    with self._profiled("scheduler:on_trial_complete"):
+                        self.scheduler.on_trial_complete(trial, last_result)
                 if status == Status.completed:
-                    for callback in self.callbacks:
-                        callback.on_trial_complete(trial, last_result)
+                    self._call_callbacks("on_trial_complete", trial, last_result)
                 done_trials[trial_id] = (trial, status)
 
             if status == Status.failed:
@@ -679,6 +1158,12 @@ class Tuner:
 
         return done_trials
 
+    def _stop_trial(self, trial_id: int, result: dict[str, Any]):
+        self.trial_backend.stop_trial(trial_id=trial_id, result=result)
+
+    def _pause_trial(self, trial_id: int, result: dict[str, Any]):
+        self.trial_backend.pause_trial(trial_id=trial_id, result=result)
+
     @staticmethod
     def _default_callback():
         """
@@ -86,7 +86,9 @@ class TunerCallback:
     def on_tuning_sleep(self, sleep_time: float):
         """Called just after tuner has slept, because no worker was available
 
-        :param sleep_time: Time (in secs) for which tuner has just slept
+        :param sleep_time: Time (in secs) for which tuner has just slept. This
+            is at most ``tuner.sleep_time``, but can be shorter if the backend
+            signalled an event before
         """
         pass
 
@@ -0,0 +1,126 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, TextIO
+
+from syne_tune.util import dump_json_with_numpy
+
+logger = logging.getLogger(__name__)
+
+
+class TunerJournal:
+    """
+    Append-only journal of tuning events (trials started or resumed, results
+    and status changes fetched from the backend), used by
+    :class:`~syne_tune.Tuner` if ``save_journal`` is set. Events are written
+    as JSON lines, which is cheap compared to serializing the whole tuner, so
+    they can be made durable in every iteration of the tuning loop.
+
+    Snapshots of the tuner are taken less frequently. Each snapshot starts a
+    new generation of the journal, so that :meth:`~syne_tune.Tuner.load`
+    restores the snapshot and replays the events of all generations since
+    then. Files of older generations are removed once the snapshot has been
+    written.
+
+    The file handle is not serialized, it is reopened when events are written
+    next.
+
+    :param path: Directory for journal files
+    :param fsync: If ``True``, :meth:`flush` calls ``os.fsync``, so that events
+        survive a crash of the machine. Defaults to ``True``
+    """
+
+    def __init__(self, path: str | Path, fsync: bool = True):
+        self.path = Path(path)
+        self.fsync = fsync
+        self.generation = 0
+        self._pending_events = []
+        self._file: TextIO | None = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_file"] = None
+        state["_pending_events"] = []
+        return state
+
+    def _journal_file(self, generation: int) -> Path:
+        return self.path / f"tuner_journal.{generation:06d}.ndjson"
+
+    def append(self, event: str, **kwargs):
+        """
+        Records an event. It is written to disk with the next call of
+        :meth:`flush`.
+
+        :param event: Type of event
+        :param kwargs: Content of event, must be JSON-serializable
+        """
+        self._pending_events.append(dict(kwargs, event=event))
+
+    def flush(self):
+        """
+        Writes events recorded since the last call.
+        """
+        if not self._pending_events:
+            return
+        if self._file is None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._file = open(self._journal_file(self.generation), "a")
+        self._file.write(
+            "".join(
+                dump_json_with_numpy(event) + "\n" for event in self._pending_events
+            )
+        )
+        self._pending_events = []
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def start_generation(self):
+        """
+        Called before a snapshot is taken. Events recorded afterwards are
+        written to a new file.
+        """
+        self.close()
+        self.generation += 1
+
+    def remove_previous_generations(self):
+        """
+        Called once a snapshot has been written. Removes journal files of
+        generations before the current one.
+        """
+        for file in self.path.glob("tuner_journal.*.ndjson"):
+            if self._generation_of(file) < self.generation:
+                file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _generation_of(file: Path) -> int:
+        return int(file.name.split(".")[1])
+
+    def events(self) -> list[dict[str, Any]]:
+        """
+        :return: Events of the current and all later generations (the latter
+            exist if the tuner was interrupted while writing a snapshot), in
+            the order they were recorded. A final line which is incomplete
+            (e.g., since the tuner was interrupted while writing) is skipped
+        """
+        files = sorted(
+            file
+            for file in self.path.glob("tuner_journal.*.ndjson")
+            if self._generation_of(file) >= self.generation
+        )
+        events = []
+        for file in files:
+            with open(file, "r") as f:
+                for line in f:
+                    try:
+                        events.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping incomplete line in {file}")
+        return events
@@ -278,6 +278,32 @@ class TunerLogger:
             f"✨ {self._color('Happy training with your optimized hyperparameters!', Colors.CYAN)}\n"
         )
 
+    def print_profile_summary(
+        self, summary: dict[str, dict[str, float]], profile_path: Path
+    ):
+        """Print summary of time spent in the tuning loop, see ``Tuner(profile=True)``."""
+        profile_msg = "Tuning Loop Profile"
+        if self.use_emojis:
+            profile_msg = "⏱️ " + profile_msg
+        print(f"\n{self._color(profile_msg, Colors.BOLD)}")
+        total_time = summary.get("iteration", {}).get("sum", 0.0)
+        print(
+            f"{'Tag':<40} {'Num':>8} {'Total (s)':>10} {'Mean (ms)':>10} {'Share':>7}"
+        )
+        for tag, stats in sorted(
+            summary.items(), key=lambda item: item[1]["sum"], reverse=True
+        ):
+            share = (
+                f"{100 * stats['sum'] / total_time:6.1f}%"
+                if total_time > 0 and not tag.startswith("idle")
+                else ""
+            )
+            print(
+                f"{tag:<40} {stats['num']:>8d} {stats['sum']:>10.3f} "
+                f"{1000 * stats['mean']:>10.3f} {share:>7}"
+            )
+        print(f"Profile saved to: {self._color(str(profile_path), Colors.BLUE)}\n")
+
     def print_error(self, message: str):
         """Print error message."""
         print(self._format_message("💥", message, Colors.RED))
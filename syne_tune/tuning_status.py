@@ -1,8 +1,9 @@
+from collections.abc import Mapping
 from typing import Any
 import numbers
 import logging
 import time
-from collections import defaultdict, OrderedDict
+from collections import Counter, defaultdict, OrderedDict
 import pandas as pd
 from numpy import inf as np_inf
 
@@ -12,6 +13,9 @@ from syne_tune.backend.trial_backend import (
     TrialAndStatusInformation,
     TrialIdAndResultList,
 )
+from syne_tune.trial_table import TrialTable
+
+DEFAULT_MAX_TRIALS_PRINTED = 50
 
 
 class MetricsStatistics:
@@ -63,19 +67,74 @@ class TuningStatus:
     Information of a tuning job to display as progress or to use to decide whether
     to stop the tuning job.
 
+    Counts of trials per status, as well as :attr:`user_time` and :attr:`cost`,
+    are maintained incrementally in :meth:`update`, so they can be queried at
+    constant cost in every iteration of the tuning loop.
+
+    Information about trials is kept in :attr:`trial_table`, a
+    :class:`~syne_tune.trial_table.TrialTable`. The row of a trial is only
+    rewritten if its status, configuration or results changed. When printed,
+    only the rows of the ``max_trials_printed`` most recently updated trials
+    are shown.
+
     :param metric_names: Names of metrics reported
+    :param max_trials_printed: Maximum number of trials shown when printed.
+        If ``None``, all trials are shown. Defaults to
+        :const:`DEFAULT_MAX_TRIALS_PRINTED`
     """
 
     # TODO: ``metric_names`` not used for anything. Remove?
-    def __init__(self, metric_names: list[str]):
+    def __init__(
+        self,
+        metric_names: list[str],
+        max_trials_printed: int | None = DEFAULT_MAX_TRIALS_PRINTED,
+    ):
         self.metric_names = metric_names
+        self.max_trials_printed = max_trials_printed
         self.start_time = time.perf_counter()
 
         self.overall_metric_statistics = MetricsStatistics()
         self.trial_metric_statistics = defaultdict(lambda: MetricsStatistics())
 
         self.last_trial_status_seen = OrderedDict()
-        self.trial_rows = OrderedDict({})
+        self.trial_table = TrialTable()
+        # Configurations of trials as of their last row update
+        self._trial_configs = dict()
+        # Aggregates maintained incrementally
+        self._status_counts = Counter()
+        self._user_time = 0
+        self._cost = 0.0
+
+    def __setstate__(self, state):
+        trial_rows = state.pop("trial_rows", None)
+        self.__dict__.update(state)
+        if trial_rows is not None:
+            # Object was serialized before the trial table was introduced
+            self.trial_table = TrialTable()
+            for trial_id, row in trial_rows.items():
+                self.trial_table.set_row(trial_id, row)
+            self._trial_configs = dict()
+        if "max_trials_printed" not in state:
+            self.max_trials_printed = DEFAULT_MAX_TRIALS_PRINTED
+        if "_status_counts" not in state:
+            # Object was serialized before aggregates were introduced
+            self._status_counts = Counter(self.last_trial_status_seen.values())
+            self._user_time = self._sum_of_max_metric(ST_WORKER_TIME)
+            self._cost = self._sum_of_max_metric(ST_WORKER_COST)
+
+    def _sum_of_max_metric(self, metric_name: str):
+        return sum(
+            metric.max_metrics.get(metric_name, 0)
+            for metric in self.trial_metric_statistics.values()
+        )
+
+    def _set_trial_status(self, trial_id: int, status: str):
+        previous_status = self.last_trial_status_seen.get(trial_id)
+        if previous_status != status:
+            if previous_status is not None:
+                self._status_counts[previous_status] -= 1
+            self._status_counts[status] += 1
+            self.last_trial_status_seen[trial_id] = status
 
     def update(
         self,
@@ -90,46 +149,68 @@ class TuningStatus:
         :param new_results: New results, along with trial IDs
         """
 
-        self.last_trial_status_seen.update(
-            {k: v[1] for k, v in trial_status_dict.items()}
-        )
+        # Rows only need to be rewritten for trials whose status, configuration
+        # or results changed
+        trials_to_update = {trial_id for trial_id, _ in new_results}
+        for trial_id, (trial, status) in trial_status_dict.items():
+            if self.last_trial_status_seen.get(trial_id) != status:
+                trials_to_update.add(trial_id)
+                self._set_trial_status(trial_id, status)
+            previous_config = self._trial_configs.get(trial_id)
+            if previous_config is not trial.config and previous_config != trial.config:
+                trials_to_update.add(trial_id)
 
         for trial_id, new_result in new_results:
             self.overall_metric_statistics.add(new_result)
-            self.trial_metric_statistics[trial_id].add(new_result)
+            trial_statistics = self.trial_metric_statistics[trial_id]
+            max_metrics = trial_statistics.max_metrics
+            previous_time = max_metrics.get(ST_WORKER_TIME, 0)
+            previous_cost = max_metrics.get(ST_WORKER_COST, 0)
+            trial_statistics.add(new_result)
+            self._user_time += max_metrics.get(ST_WORKER_TIME, 0) - previous_time
+            self._cost += max_metrics.get(ST_WORKER_COST, 0) - previous_cost
 
         for trial_id, (trial, status) in trial_status_dict.items():
-            num_metrics = self.trial_metric_statistics[trial_id].count
+            if trial_id not in trials_to_update and trial_id in self.trial_table:
+                continue
+            trial_statistics = self.trial_metric_statistics[trial_id]
             row = {
                 "trial_id": trial_id,
                 "status": status,
-                "iter": num_metrics,
+                "iter": trial_statistics.count,
             }
             row.update(trial.config)
-            row.update(self.trial_metric_statistics[trial_id].last_metrics)
+            row.update(trial_statistics.last_metrics)
 
-            if ST_WORKER_TIME in self.trial_metric_statistics[trial_id].max_metrics:
-                row["worker-time"] = self.trial_metric_statistics[trial_id].max_metrics[
-                    ST_WORKER_TIME
-                ]
-            if ST_WORKER_COST in self.trial_metric_statistics[trial_id].max_metrics:
-                row["worker-cost"] = self.trial_metric_statistics[trial_id].max_metrics[
-                    ST_WORKER_COST
-                ]
+            if ST_WORKER_TIME in trial_statistics.max_metrics:
+                row["worker-time"] = trial_statistics.max_metrics[ST_WORKER_TIME]
+            if ST_WORKER_COST in trial_statistics.max_metrics:
+                row["worker-cost"] = trial_statistics.max_metrics[ST_WORKER_COST]
 
-            self.trial_rows[trial_id] = row
+            self.trial_table.set_row(trial_id, row)
+            self._trial_configs[trial_id] = trial.config
 
     def mark_running_job_as_stopped(self):
         """
         Update the status of all trials still running to be marked as stop.
         """
-        self.last_trial_status_seen = {
-            k: v if v != Status.in_progress else Status.stopped
-            for k, v in self.last_trial_status_seen.items()
-        }
-        for trial_id, row in self.trial_rows.items():
-            if row["status"] == Status.in_progress:
-                row["status"] = Status.stopped
+        for trial_id, status in self.last_trial_status_seen.items():
+            if status == Status.in_progress:
+                self.last_trial_status_seen[trial_id] = Status.stopped
+        self._status_counts[Status.stopped] += self._status_counts[Status.in_progress]
+        self._status_counts[Status.in_progress] = 0
+        for trial_id in self.trial_table.trial_ids():
+            if self.trial_table.get_value(trial_id, "status") == Status.in_progress:
+                self.trial_table.set_value(trial_id, "status", Status.stopped)
+
+    @property
+    def trial_rows(self) -> Mapping[int, dict[str, Any]]:
+        """
+        :return: Read-only mapping from trial ID to information about the
+            trial, as dictionary. Rows are created when accessed, use
+            :attr:`trial_table` for column-wise access
+        """
+        return self.trial_table.rows()
 
     @property
     def num_trials_started(self):
@@ -143,10 +224,7 @@ class TuningStatus:
             status = set([status])
         elif not isinstance(status, set):
             status = set(status)
-        return sum(
-            trial_status in status
-            for trial_status in self.last_trial_status_seen.values()
-        )
+        return sum(self._status_counts[trial_status] for trial_status in status)
 
     @property
     def num_trials_completed(self):
@@ -168,8 +246,6 @@ class TuningStatus:
         :return: Number of trials that finished, e.g. that completed, were
             stopped or are stopping, or failed
         """
-        # note it may be inefficient to query several times the dataframe in case a very large number of jobs are
-        #  present, we could query the dataframe only once
         status_finished = {
             Status.completed,
             Status.stopped,
@@ -198,43 +274,38 @@ class TuningStatus:
         """
         :return: the total user time spent in the workers
         """
-        if ST_WORKER_TIME in self.overall_metric_statistics.metric_names:
-            usertime_per_trial = [
-                metric.max_metrics.get(ST_WORKER_TIME, 0)
-                for trial, metric in self.trial_metric_statistics.items()
-            ]
-            return sum(usertime_per_trial)
-        else:
-            return 0
+        return self._user_time
 
     @property
     def cost(self):
         """
         :return: the estimated dollar-cost spent while tuning
         """
-        if ST_WORKER_COST in self.overall_metric_statistics.metric_names:
-            cost_per_trial = [
-                metric.max_metrics.get(ST_WORKER_COST, 0)
-                for trial, metric in self.trial_metric_statistics.items()
-            ]
-            return sum(cost_per_trial)
-        else:
-            return 0.0
+        return self._cost
 
     def get_dataframe(self) -> pd.DataFrame:
         """
         :return: Information about all trials as dataframe
         """
-        return pd.DataFrame(self.trial_rows.values())
+        return self.trial_table.to_dataframe()
 
     def __str__(self):
         num_running = self.num_trials_running
         num_finished = self.num_trials_started - num_running
 
-        if len(self.trial_rows) > 0:
-            df = self.get_dataframe()
+        num_rows = len(self.trial_table)
+        if num_rows > 0:
+            trial_ids = self.trial_table.recently_updated_trial_ids(
+                self.max_trials_printed
+            )
+            df = self.trial_table.to_dataframe(trial_ids)
             cols = [col for col in df.columns if not col.startswith("st_")]
             res_str = df.loc[:, cols].to_string(index=False, na_rep="-") + "\n"
+            if len(trial_ids) < num_rows:
+                res_str += (
+                    f"(showing {len(trial_ids)} of {num_rows} trials, "
+                    "most recently updated)\n"
+                )
         else:
             res_str = ""
         res_str += (
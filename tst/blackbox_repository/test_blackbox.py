@@ -227,6 +227,25 @@ def test_blackbox_tabular_serialization():
                 bb2.objectives_evaluations.reshape(-1),
             )
 
+        # Objectives of all tasks are views into the same read-only map
+        bb_dict3 = deserialize_tabular(tmpdirname, mmap_mode="r")
+        for key in bb_dict3.keys():
+            objectives_evaluations = bb_dict3[key].objectives_evaluations
+            assert isinstance(objectives_evaluations, np.memmap)
+            assert not objectives_evaluations.flags.writeable
+            np.testing.assert_allclose(
+                bb_dict[key].objectives_evaluations.reshape(-1),
+                objectives_evaluations.reshape(-1),
+                rtol=1e-6,
+            )
+        assert bb_dict3["slice"].objective_function(
+            {"hp_x1": x1[0], "hp_x2": x2[0]}, fidelity={"hp_epoch": 1}
+        ) == bb_dict2["slice"].objective_function(
+            {"hp_x1": x1[0], "hp_x2": x2[0]}, fidelity={"hp_epoch": 1}
+        )
+        # Release the map before the directory is removed
+        del bb_dict3
+
         # blackbox.serialize(tmpdirname)
         # blackbox_deserialized = deserialize(tmpdirname)
         # for u, v in zip(x1, x2):
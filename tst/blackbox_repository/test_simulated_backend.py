@@ -1,11 +1,27 @@
+import json
+
 import numpy as np
 import pandas as pd
+import pytest
 
+from syne_tune import StoppingCriterion, Tuner
+from syne_tune.backend.simulator_backend.simulator_callback import SimulatorCallback
 from syne_tune.config_space import randint
 from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
 from syne_tune.blackbox_repository.simulated_tabular_backend import (
     UserBlackboxBackend,
 )
+from syne_tune.constants import SYNE_TUNE_ENV_FOLDER, ST_METRICS_FILENAME
+from syne_tune.optimizer.schedulers.asha import AsynchronousSuccessiveHalving
+from examples.training_scripts.height_example.train_height import (
+    height_config_space,
+    TIME_ATTR,
+    METRIC_ATTR,
+    MAX_RESOURCE_ATTR,
+)
+from examples.training_scripts.height_example.blackbox_height import (
+    HeightExampleBlackbox,
+)
 
 
 n = 10
@@ -101,3 +117,58 @@ def test_pause_and_resume():
         if resource == pause_resource + 1:
             got_it[trial_id] = True
     assert all(got_it)
+
+
+@pytest.mark.timeout(30)
+@pytest.mark.parametrize("record_to_disk", [False, True])
+def test_in_memory_simulation(tmp_path, monkeypatch, record_to_disk):
+    monkeypatch.setenv(SYNE_TUNE_ENV_FOLDER, str(tmp_path))
+    max_steps = 9
+    elapsed_time_attr = "elapsed_time"
+    trial_backend = UserBlackboxBackend(
+        blackbox=HeightExampleBlackbox(
+            max_steps=max_steps, sleep_time=0.1, elapsed_time_attr=elapsed_time_attr
+        ),
+        elapsed_time_attr=elapsed_time_attr,
+        max_resource_attr=MAX_RESOURCE_ATTR,
+        record_to_disk=record_to_disk,
+    )
+    scheduler = AsynchronousSuccessiveHalving(
+        height_config_space(max_steps),
+        metric=METRIC_ATTR,
+        do_minimize=True,
+        time_attr=TIME_ATTR,
+    )
+    tuner = Tuner(
+        trial_backend=trial_backend,
+        scheduler=scheduler,
+        n_workers=4,
+        stop_criterion=StoppingCriterion(max_num_trials_finished=10),
+        sleep_time=0,
+        callbacks=[SimulatorCallback()],
+    )
+    tuner.run()
+
+    trial_ids = trial_backend.trial_ids
+    assert len(trial_ids) >= 10
+    assert trial_backend.stdout(trial_ids[0]) == []
+    for trial_id in trial_ids:
+        trial_path = trial_backend.trial_path(trial_id)
+        if not record_to_disk:
+            assert not trial_path.exists()
+        else:
+            with open(trial_path / "config.json", "r") as f:
+                config = json.load(f)
+            assert config == trial_backend._trial_dict[trial_id].config
+            with open(trial_path / ST_METRICS_FILENAME, "r") as f:
+                metrics = [json.loads(line) for line in f]
+            assert [metric[TIME_ATTR] for metric in metrics] == list(
+                range(1, len(metrics) + 1)
+            )
+    # Simulated checkpoint of a paused trial is the resource level it has
+    # been paused at
+    trial_backend._resource_paused_for_trial[0] = 3
+    trial_backend.copy_checkpoint(src_trial_id=0, tgt_trial_id=1)
+    assert trial_backend._resource_paused_for_trial[1] == 3
+    trial_backend.delete_checkpoint(trial_id=1)
+    assert 1 not in trial_backend._resource_paused_for_trial
@@ -1,9 +1,17 @@
 from unittest.mock import Mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from syne_tune.experiments import ExperimentResult
+from syne_tune.backend.trial_status import Status, Trial
+from syne_tune.constants import ST_RESULTS_SEGMENTS_DIRNAME
+from syne_tune.experiments import (
+    ExperimentResult,
+    load_experiment,
+    load_results_dataframe,
+)
+from syne_tune.results_callback import StoreResultsCallback
 
 
 @pytest.mark.parametrize(
@@ -34,3 +42,55 @@ def test_get_best_result(metadata: dict, results: pd.DataFrame, expected_result:
         name="some name", results=results, metadata=metadata, tuner=Mock(), path=Mock()
     )
     assert exp_result.best_config() == expected_result
+
+
+def test_load_experiment_from_results_segments(tmp_path):
+    tuner = Mock(tuner_path=tmp_path, results_update_interval=0)
+    callback = StoreResultsCallback(max_segment_size=1)
+    callback.on_tuning_start(tuner)
+    for trial_id in range(3):
+        trial = Trial(trial_id=trial_id, config={"x": trial_id}, creation_time=None)
+        callback.on_trial_result(
+            trial, Status.in_progress, {"loss": np.float64(trial_id)}, "CONTINUE"
+        )
+        callback.store_results()
+    segments_path = tmp_path / ST_RESULTS_SEGMENTS_DIRNAME
+    # Each result exceeds ``max_segment_size``, so is written to a new segment
+    assert len(list(segments_path.iterdir())) == 3
+    results = load_experiment(tmp_path.name, local_path=str(tmp_path.parent)).results
+    assert results["loss"].tolist() == [0.0, 1.0, 2.0]
+    assert results["config_x"].tolist() == [0, 1, 2]
+    assert load_results_dataframe(tmp_path, usecols=["loss"]).columns.tolist() == [
+        "loss"
+    ]
+
+    callback.on_tuning_end()
+    assert not segments_path.exists()
+    results_compacted = load_experiment(
+        tmp_path.name, local_path=str(tmp_path.parent)
+    ).results
+    pd.testing.assert_frame_equal(results_compacted, results)
+    pd.testing.assert_frame_equal(
+        load_results_dataframe(tmp_path, usecols=["loss"]), results[["loss"]]
+    )
+
+
+def test_store_results_without_keeping_in_memory(tmp_path):
+    tuner = Mock(tuner_path=tmp_path, results_update_interval=0)
+    callback = StoreResultsCallback(keep_results_in_memory=False)
+    callback.on_tuning_start(tuner)
+    for trial_id in range(3):
+        trial = Trial(trial_id=trial_id, config={"x": trial_id}, creation_time=None)
+        callback.on_trial_result(trial, Status.in_progress, {"loss": 1.0}, "CONTINUE")
+        callback.store_results()
+        assert callback.results == []
+    assert callback.dataframe()["config_x"].tolist() == [0, 1, 2]
+    callback.on_tuning_end()
+
+    # Resumed tuner keeps results recorded before
+    callback.on_tuning_start(tuner)
+    trial = Trial(trial_id=3, config={"x": 3}, creation_time=None)
+    callback.on_trial_result(trial, Status.in_progress, {"loss": 1.0}, "CONTINUE")
+    callback.on_tuning_end()
+    results = load_experiment(tmp_path.name, local_path=str(tmp_path.parent)).results
+    assert results["config_x"].tolist() == [0, 1, 2, 3]
@@ -0,0 +1,88 @@
+import dill
+import numpy as np
+import pytest
+
+from syne_tune.config_space import uniform
+from syne_tune.optimizer.schedulers.searchers.bore import Bore
+from syne_tune.optimizer.schedulers.searchers.kde import KernelDensityEstimator
+
+config_space = {"x": uniform(0, 1), "y": uniform(0, 1)}
+
+
+def _make_searcher(name: str, model_fitting: str):
+    if name == "bore":
+        return Bore(
+            config_space,
+            classifier="logreg",
+            init_random=2,
+            feval_acq=20,
+            random_seed=0,
+            model_fitting=model_fitting,
+        )
+    else:
+        return KernelDensityEstimator(
+            config_space,
+            num_min_data_points=3,
+            random_fraction=0,
+            random_seed=0,
+            model_fitting=model_fitting,
+        )
+
+
+def _complete_trials(searcher, num_trials: int, first_trial_id: int = 0):
+    random_state = np.random.RandomState(first_trial_id)
+    for trial_id in range(first_trial_id, first_trial_id + num_trials):
+        config = {"x": random_state.rand(), "y": random_state.rand()}
+        searcher.on_trial_complete(
+            trial_id=trial_id, config=config, metric=config["x"] + config["y"]
+        )
+
+
+@pytest.mark.parametrize("name", ["bore", "kde"])
+def test_sync_model_fitting(name):
+    searcher = _make_searcher(name, model_fitting="sync")
+    _complete_trials(searcher, num_trials=10)
+    assert searcher.suggest() is not None
+    assert searcher._model is not None
+    assert searcher._num_observations_fit == 10
+
+
+@pytest.mark.parametrize("name", ["bore", "kde"])
+@pytest.mark.parametrize("model_fitting", ["thread", "process"])
+def test_async_model_fitting(name, model_fitting):
+    searcher = _make_searcher(name, model_fitting=model_fitting)
+    _complete_trials(searcher, num_trials=10)
+    # Model fitting is started, configuration is sampled at random meanwhile
+    assert searcher.suggest() is not None
+    assert searcher._model is None
+    searcher.wait_for_model()
+    assert searcher._model is not None
+    assert searcher._num_observations_fit == 10
+
+    # Model is not fitted again without new observations
+    assert searcher.suggest() is not None
+    assert searcher._model_fitting_future is None
+    _complete_trials(searcher, num_trials=2, first_trial_id=10)
+    assert searcher.suggest() is not None
+    assert searcher._model_fitting_future is not None
+    searcher_loaded = dill.loads(dill.dumps(searcher))
+    assert searcher_loaded._model_fitting_future is None
+    # Fit which was pending is started again
+    assert searcher_loaded._num_observations_fit == 10
+    assert searcher_loaded.suggest() is not None
+    assert searcher_loaded._model_fitting_future is not None
+    searcher_loaded.close()
+    searcher.wait_for_model()
+    assert searcher._num_observations_fit == 12
+    searcher.close()
+    assert searcher._model_fitting_executor is None
+    assert searcher.suggest() is not None
+
+
+@pytest.mark.parametrize("name", ["bore", "kde"])
+def test_process_model_fitting_pickles_attributes_only(name):
+    searcher = _make_searcher(name, model_fitting="process")
+    _complete_trials(searcher, num_trials=10)
+    fitter = searcher._model_fitter()
+    assert set(fitter.__dict__.keys()) == set(searcher._model_fitting_attributes)
+    assert fitter._fit_model(searcher._training_data()) is not None
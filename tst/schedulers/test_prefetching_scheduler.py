@@ -0,0 +1,160 @@
+import threading
+
+import dill
+import pytest
+
+from syne_tune.backend.trial_status import Trial
+from syne_tune.config_space import uniform
+from syne_tune.optimizer.baselines import RandomSearch
+from syne_tune.optimizer.scheduler import TrialScheduler, TrialSuggestion
+from syne_tune.optimizer.schedulers.prefetching_scheduler import (
+    PrefetchingScheduler,
+)
+from syne_tune.optimizer.schedulers.remove_checkpoints import (
+    RemoveCheckpointsSchedulerMixin,
+)
+from syne_tune.optimizer.schedulers.searchers.model_fitting import (
+    AsyncModelFittingMixin,
+)
+
+
+class CountingScheduler(TrialScheduler):
+    """
+    Suggests the number of results seen so far, which shows whether a
+    suggestion is stale.
+    """
+
+    def __init__(self):
+        super().__init__(random_seed=0)
+        self.num_suggest_calls = 0
+        self.num_results = 0
+
+    def suggest(self) -> TrialSuggestion | None:
+        self.num_suggest_calls += 1
+        return TrialSuggestion.start_suggestion({"num_results": self.num_results})
+
+    def on_trial_result(self, trial: Trial, result: dict) -> str:
+        self.num_results += 1
+        return super().on_trial_result(trial, result)
+
+
+class BlockingFitSearcher(AsyncModelFittingMixin):
+    """
+    Fits a model (the number of observations) only once it is allowed to.
+    """
+
+    def __init__(self):
+        self._init_model_fitting("sync")
+        self.observations = []
+        self.fit_started = threading.Event()
+        self.can_fit = threading.Event()
+
+    def _num_observations(self) -> int:
+        return len(self.observations)
+
+    def _training_data(self) -> list:
+        return list(self.observations)
+
+    def _fit_model(self, data: list) -> int:
+        self.fit_started.set()
+        assert self.can_fit.wait(timeout=10)
+        return len(data)
+
+    def suggest(self) -> dict:
+        return {"model": self._current_model()}
+
+
+class ModelBasedScheduler(TrialScheduler):
+    def __init__(self):
+        super().__init__(random_seed=0)
+        self.searcher = BlockingFitSearcher()
+
+    def suggest(self) -> TrialSuggestion | None:
+        return TrialSuggestion.start_suggestion(self.searcher.suggest())
+
+    def on_trial_result(self, trial: Trial, result: dict) -> str:
+        self.searcher.observations.append(result["y"])
+        return super().on_trial_result(trial, result)
+
+
+def _report_result(scheduler: PrefetchingScheduler):
+    trial = Trial(trial_id=0, config={}, creation_time=None)
+    scheduler.on_trial_result(trial, {"y": 1.0})
+
+
+def test_suggestions_are_prefetched():
+    points_to_evaluate = [{"x": 0.1}, {"x": 0.2}]
+    scheduler = PrefetchingScheduler(
+        base_scheduler=RandomSearch(
+            {"x": uniform(0, 1)},
+            metrics=["y"],
+            points_to_evaluate=points_to_evaluate,
+        ),
+        num_prefetch=2,
+    )
+    assert scheduler.suggest().config == points_to_evaluate[0]
+    scheduler._wait_for_prefetch()
+    # Second initial point and a random configuration have been prefetched
+    assert len(scheduler._prefetched) == 2
+    assert scheduler._prefetched[0].is_initial
+    assert not scheduler._prefetched[1].is_initial
+    assert scheduler.suggest().config == points_to_evaluate[1]
+    assert 0 <= scheduler.suggest().config["x"] <= 1
+    assert scheduler.metric_names() == ["y"]
+
+    scheduler_loaded = dill.loads(dill.dumps(scheduler))
+    assert scheduler_loaded.suggest() is not None
+    scheduler_loaded.close()
+    # Capabilities and attributes of the base scheduler are available
+    assert isinstance(scheduler, RemoveCheckpointsSchedulerMixin)
+    assert scheduler.callback_for_checkpoint_removal(stop_criterion=None) is None
+    assert scheduler.searcher is scheduler.base_scheduler.searcher
+    scheduler.close()
+    assert scheduler._executor is None
+
+
+def test_stale_suggestions_are_refreshed():
+    base_scheduler = CountingScheduler()
+    scheduler = PrefetchingScheduler(base_scheduler, max_results_before_refresh=2)
+    assert scheduler.suggest().config == {"num_results": 0}
+    scheduler._wait_for_prefetch()
+    _report_result(scheduler)
+    # Prefetched suggestion is used
+    assert scheduler.suggest().config == {"num_results": 0}
+    scheduler._wait_for_prefetch()
+    _report_result(scheduler)
+    _report_result(scheduler)
+    # Prefetched suggestion is stale and computed again
+    assert scheduler.suggest().config == {"num_results": 3}
+    assert base_scheduler.num_suggest_calls == 4
+
+    # Without refresh, prefetched suggestions are always used
+    scheduler = PrefetchingScheduler(CountingScheduler())
+    scheduler.suggest()
+    scheduler._wait_for_prefetch()
+    for _ in range(3):
+        _report_result(scheduler)
+    assert scheduler.suggest().config == {"num_results": 0}
+
+
+@pytest.mark.timeout(20)
+def test_results_not_blocked_by_model_fit():
+    scheduler = PrefetchingScheduler(ModelBasedScheduler())
+    searcher = scheduler.base_scheduler.searcher
+    searcher.can_fit.set()
+    assert scheduler.suggest().config == {"model": 0}
+    scheduler._wait_for_prefetch()
+    _report_result(scheduler)
+    searcher.can_fit.clear()
+    searcher.fit_started.clear()
+    # Model is fitted on one observation in the background
+    assert scheduler.suggest().config == {"model": 0}
+    assert searcher.fit_started.wait(timeout=5)
+    # Results are processed while the model is fitted
+    _report_result(scheduler)
+    assert not scheduler._future.done()
+    searcher.can_fit.set()
+    scheduler._wait_for_prefetch()
+    # Model is fitted again on the result reported during the first fit
+    assert scheduler.suggest().config == {"model": 2}
+    scheduler.close()
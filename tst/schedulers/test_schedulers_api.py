@@ -280,6 +280,12 @@ def test_schedulers_api(scheduler):
         ), "suggestion configuration should contain all keys of config_space."
         trials.append(Trial(trial_id=i, config=suggestion.config, creation_time=None))
 
+    # checks batches of suggestions are properly formatted
+    suggestions = scheduler.suggest_batch(3)
+    assert len(suggestions) == 3
+    for suggestion in suggestions:
+        assert all(x in suggestion.config.keys() for x in config_space.keys())
+
     for trial in trials:
         scheduler.on_trial_add(trial=trial)
 
@@ -309,3 +315,74 @@ def test_schedulers_api(scheduler):
     meta = scheduler.metadata()
     assert meta["scheduler_name"] == str(scheduler.__class__.__name__)
     assert "config_space" in meta
+
+
+@pytest.mark.timeout(20)
+@pytest.mark.parametrize("searcher", ["random_search", "bore", "kde", "botorch", "cqr"])
+def test_suggest_batch_with_model(searcher):
+    scheduler = SingleObjectiveScheduler(
+        config_space,
+        searcher=searcher,
+        metric=metric1,
+        random_seed=random_seed,
+        searcher_kwargs={"points_to_evaluate": [{"x": 3, "y": 0.5, "z": "a"}]},
+    )
+    for trial_id in range(12):
+        suggestion = scheduler.suggest()
+        trial = Trial(trial_id=trial_id, config=suggestion.config, creation_time=None)
+        scheduler.on_trial_add(trial=trial)
+        scheduler.on_trial_complete(
+            trial, {metric1: suggestion.config["x"] + suggestion.config["y"]}
+        )
+    # Surrogate model (if any) is fitted once for the whole batch
+    suggestions = scheduler.suggest_batch(4)
+    assert len(suggestions) == 4
+    for suggestion in suggestions:
+        assert suggestion.spawn_new_trial_id
+        assert all(x in suggestion.config.keys() for x in config_space.keys())
+
+
+@pytest.mark.timeout(20)
+def test_suggest_batch_bore_with_replacement_distinct():
+    small_config_space = {"x": choice([0, 1, 2]), "y": choice([0, 1, 2])}
+    scheduler = SingleObjectiveScheduler(
+        small_config_space,
+        searcher="bore",
+        metric=metric1,
+        random_seed=random_seed,
+        searcher_kwargs={"acq_optimizer": "rs_with_replacement", "feval_acq": 200},
+    )
+    for trial_id in range(12):
+        suggestion = scheduler.suggest()
+        trial = Trial(trial_id=trial_id, config=suggestion.config, creation_time=None)
+        scheduler.on_trial_add(trial=trial)
+        scheduler.on_trial_complete(
+            trial, {metric1: suggestion.config["x"] + suggestion.config["y"]}
+        )
+    # Candidates are sampled with replacement from only 9 configurations
+    suggestions = scheduler.suggest_batch(4)
+    configs = {(s.config["x"], s.config["y"]) for s in suggestions}
+    assert len(configs) == 4
+
+
+@pytest.mark.timeout(20)
+def test_suggest_batch_cqr_records_configs_seen():
+    scheduler = SingleObjectiveScheduler(
+        config_space,
+        searcher="cqr",
+        metric=metric1,
+        random_seed=random_seed,
+    )
+    for trial_id in range(12):
+        suggestion = scheduler.suggest()
+        trial = Trial(trial_id=trial_id, config=suggestion.config, creation_time=None)
+        scheduler.on_trial_add(trial=trial)
+        scheduler.on_trial_complete(
+            trial, {metric1: suggestion.config["x"] + suggestion.config["y"]}
+        )
+    suggestions = scheduler.suggest_batch(4)
+    surrogate_model = scheduler.searcher.surrogate_model
+    assert surrogate_model is not None
+    for suggestion in suggestions:
+        config = {k: suggestion.config[k] for k in config_space.keys()}
+        assert surrogate_model._config_already_seen(config)
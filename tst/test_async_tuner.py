@@ -0,0 +1,155 @@
+import asyncio
+import threading
+
+import pytest
+
+from syne_tune import StoppingCriterion
+from syne_tune.async_tuner import AsyncTuner
+from syne_tune.backend.async_trial_backend import ThreadedTrialBackend
+from syne_tune.backend.simulator_backend.simulator_callback import SimulatorCallback
+from syne_tune.blackbox_repository.simulated_tabular_backend import (
+    UserBlackboxBackend,
+)
+from syne_tune.constants import SYNE_TUNE_ENV_FOLDER
+from syne_tune.optimizer.schedulers.asha import AsynchronousSuccessiveHalving
+from syne_tune.optimizer.schedulers.searchers.random_searcher import RandomSearcher
+from syne_tune.optimizer.schedulers.searchers.searcher import BaseSearcher
+from syne_tune.optimizer.schedulers.single_fidelity_scheduler import (
+    SingleFidelityScheduler,
+)
+from syne_tune.tuner import Tuner
+from examples.training_scripts.height_example.train_height import (
+    height_config_space,
+    TIME_ATTR,
+    METRIC_ATTR,
+    MAX_RESOURCE_ATTR,
+)
+from examples.training_scripts.height_example.blackbox_height import (
+    HeightExampleBlackbox,
+)
+
+
+@pytest.mark.timeout(20)
+def test_async_tuner_simulated(tmp_path, monkeypatch):
+    monkeypatch.setenv(SYNE_TUNE_ENV_FOLDER, str(tmp_path))
+    max_steps = 9
+    n_workers = 4
+    elapsed_time_attr = "elapsed_time"
+    trial_backend = UserBlackboxBackend(
+        blackbox=HeightExampleBlackbox(
+            max_steps=max_steps, sleep_time=0.1, elapsed_time_attr=elapsed_time_attr
+        ),
+        elapsed_time_attr=elapsed_time_attr,
+        max_resource_attr=MAX_RESOURCE_ATTR,
+    )
+    scheduler = AsynchronousSuccessiveHalving(
+        height_config_space(max_steps),
+        metric=METRIC_ATTR,
+        do_minimize=True,
+        time_attr=TIME_ATTR,
+        random_seed=382378624,
+    )
+    tuner = AsyncTuner(
+        trial_backend=trial_backend,
+        scheduler=scheduler,
+        n_workers=n_workers,
+        stop_criterion=StoppingCriterion(max_wallclock_time=10),
+        sleep_time=0,
+        callbacks=[SimulatorCallback()],
+    )
+    assert isinstance(tuner.trial_backend, ThreadedTrialBackend)
+    tuner.run()
+
+    assert tuner.tuning_status.num_trials_started > n_workers
+    assert tuner.tuning_status.num_trials_running == 0
+    # Trials were stopped early by the scheduler
+    assert len(tuner.trials_scheduler_stopped) > 0
+    results = tuner.callbacks[0].dataframe()
+    num_trials_with_results = results["trial_id"].nunique()
+    assert n_workers < num_trials_with_results <= tuner.tuning_status.num_trials_started
+    # Tuner can be serialized, including the backend adapter
+    tuner_loaded = Tuner.load(tuner.tuner_path)
+    assert isinstance(tuner_loaded, AsyncTuner)
+    assert isinstance(tuner_loaded.trial_backend, ThreadedTrialBackend)
+    assert tuner_loaded.trial_backend.trial_ids == trial_backend.trial_ids
+
+
+class _FiniteSearcher(RandomSearcher):
+    def __init__(self, config_space, num_configs: int):
+        super().__init__(config_space, random_seed=382378624)
+        self.num_remaining = num_configs
+
+    def suggest(self, **kwargs):
+        if self.num_remaining == 0:
+            return None
+        self.num_remaining -= 1
+        return super().suggest()
+
+    def suggest_batch(self, num_suggestions: int, **kwargs):
+        return BaseSearcher.suggest_batch(self, num_suggestions, **kwargs)
+
+
+@pytest.mark.timeout(20)
+def test_async_tuner_config_space_exhausted(tmp_path, monkeypatch):
+    monkeypatch.setenv(SYNE_TUNE_ENV_FOLDER, str(tmp_path))
+    max_steps = 3
+    elapsed_time_attr = "elapsed_time"
+    trial_backend = UserBlackboxBackend(
+        blackbox=HeightExampleBlackbox(
+            max_steps=max_steps, sleep_time=0.1, elapsed_time_attr=elapsed_time_attr
+        ),
+        elapsed_time_attr=elapsed_time_attr,
+        max_resource_attr=MAX_RESOURCE_ATTR,
+    )
+    config_space = height_config_space(max_steps)
+    scheduler = SingleFidelityScheduler(
+        config_space,
+        metrics=[METRIC_ATTR],
+        searcher=_FiniteSearcher(config_space, num_configs=3),
+    )
+    tuner = AsyncTuner(
+        trial_backend=trial_backend,
+        scheduler=scheduler,
+        n_workers=2,
+        stop_criterion=StoppingCriterion(max_wallclock_time=10),
+        sleep_time=0,
+        callbacks=[SimulatorCallback()],
+    )
+    tuner.run()
+
+    # Tuning ends once the trials for all configurations are done
+    assert tuner.tuning_status.num_trials_started == 3
+    assert tuner.tuning_status.num_trials_completed == 3
+    assert tuner.tuning_status.num_trials_running == 0
+
+
+class _RecordingBackend:
+    def __init__(self):
+        self.started = threading.Event()
+        self.threads = []
+
+    def start_trial(self, config, checkpoint_trial_id=None):
+        self.threads.append(threading.current_thread().name)
+        self.started.set()
+        return config
+
+    def new_trial_id(self):
+        self.threads.append(threading.current_thread().name)
+        return 0
+
+
+@pytest.mark.timeout(20)
+def test_threaded_backend_submits_eagerly():
+    trial_backend = _RecordingBackend()
+    backend = ThreadedTrialBackend(trial_backend)
+
+    async def main():
+        future = backend.start_trial(config={"x": 1})
+        # Running in the worker thread without being awaited
+        assert trial_backend.started.wait(timeout=5)
+        assert backend.new_trial_id() == 0
+        assert await future == {"x": 1}
+
+    asyncio.run(main())
+    backend.close()
+    assert all(name.startswith("syne-tune-backend") for name in trial_backend.threads)
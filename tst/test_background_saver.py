@@ -0,0 +1,141 @@
+import threading
+
+import dill
+import pytest
+
+from syne_tune import StoppingCriterion
+from syne_tune import background_saver
+from syne_tune.background_saver import BackgroundSaver, write_atomically
+from syne_tune.backend.simulator_backend.simulator_callback import SimulatorCallback
+from syne_tune.blackbox_repository.simulated_tabular_backend import (
+    UserBlackboxBackend,
+)
+from syne_tune.constants import SYNE_TUNE_ENV_FOLDER
+from syne_tune.optimizer.schedulers.asha import AsynchronousSuccessiveHalving
+from syne_tune.tuner import Tuner
+from syne_tune.tuner_callback import TunerCallback
+from examples.training_scripts.height_example.train_height import (
+    height_config_space,
+    TIME_ATTR,
+    METRIC_ATTR,
+    MAX_RESOURCE_ATTR,
+)
+from examples.training_scripts.height_example.blackbox_height import (
+    HeightExampleBlackbox,
+)
+
+
+def test_background_saver(tmp_path, monkeypatch):
+    saver = BackgroundSaver()
+    path = tmp_path / "state.bin"
+    can_write = threading.Event()
+
+    def blocking_write_atomically(data, path):
+        # Block until the test allows writing
+        can_write.wait()
+        write_atomically(data, path)
+
+    monkeypatch.setattr(background_saver, "write_atomically", blocking_write_atomically)
+    succeeded = []
+    assert saver.save(b"1", path, on_success=lambda: succeeded.append(True))
+    # Saves never overlap
+    assert saver.busy()
+    assert not saver.save(b"2", path)
+    can_write.set()
+    saver.wait()
+    assert not saver.busy()
+    assert path.read_bytes() == b"1"
+    assert succeeded == [True]
+
+    # Directory does not exist, so that writing fails
+    assert saver.save(
+        b"3",
+        tmp_path / "missing" / "state.bin",
+        on_success=lambda: succeeded.append(True),
+    )
+    saver.wait()
+    assert succeeded == [True]
+    saver.shutdown()
+    assert saver._executor is None
+
+
+def test_background_saver_dump(tmp_path):
+    saver = BackgroundSaver()
+    path = tmp_path / "state.dill"
+    obj = {"values": list(range(1000))}
+    succeeded = []
+    assert saver.dump(obj, path, on_success=lambda: succeeded.append(True))
+    # Modifications after the call are not part of the saved object
+    obj["values"].clear()
+    saver.wait()
+    assert succeeded == [True]
+    with open(path, "rb") as f:
+        assert dill.load(f) == {"values": list(range(1000))}
+
+    # Directory does not exist, so that writing fails
+    assert saver.dump(obj, tmp_path / "missing" / "state.dill")
+    saver.wait()
+    assert not (tmp_path / "missing").exists()
+    assert succeeded == [True]
+    saver.shutdown()
+
+
+class SnapshotCallback(TunerCallback):
+    """
+    Takes a snapshot in every iteration, independent of wallclock time.
+    """
+
+    def on_tuning_start(self, tuner):
+        self.tuner = tuner
+
+    def on_loop_end(self):
+        self.tuner._save_snapshot()
+
+
+@pytest.mark.timeout(30)
+def test_tuner_saves_in_background(tmp_path, monkeypatch):
+    monkeypatch.setenv(SYNE_TUNE_ENV_FOLDER, str(tmp_path))
+    num_background_saves = []
+    dump = BackgroundSaver.dump
+
+    def dump_and_count(self, *args, **kwargs):
+        started = dump(self, *args, **kwargs)
+        num_background_saves.append(started)
+        return started
+
+    monkeypatch.setattr(BackgroundSaver, "dump", dump_and_count)
+    max_steps = 9
+    elapsed_time_attr = "elapsed_time"
+    trial_backend = UserBlackboxBackend(
+        blackbox=HeightExampleBlackbox(
+            max_steps=max_steps, sleep_time=0.1, elapsed_time_attr=elapsed_time_attr
+        ),
+        elapsed_time_attr=elapsed_time_attr,
+        max_resource_attr=MAX_RESOURCE_ATTR,
+    )
+    scheduler = AsynchronousSuccessiveHalving(
+        height_config_space(max_steps),
+        metric=METRIC_ATTR,
+        do_minimize=True,
+        time_attr=TIME_ATTR,
+    )
+    tuner = Tuner(
+        trial_backend=trial_backend,
+        scheduler=scheduler,
+        n_workers=4,
+        stop_criterion=StoppingCriterion(max_num_trials_finished=100),
+        sleep_time=0,
+        callbacks=[SimulatorCallback(), SnapshotCallback()],
+        save_journal=True,
+        save_in_background=True,
+    )
+    tuner.run()
+    assert tuner._background_saver._executor is None
+    # Some saves were skipped, since the previous one was still in flight
+    assert any(num_background_saves)
+    tuner_loaded = Tuner.load(tuner.tuner_path)
+    assert tuner_loaded.trial_backend.trial_ids == trial_backend.trial_ids
+    assert (
+        tuner_loaded.tuning_status.overall_metric_statistics.count
+        == tuner.tuning_status.overall_metric_statistics.count
+    )
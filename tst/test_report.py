@@ -1,8 +1,13 @@
 import logging
 
 from syne_tune import Reporter
-from syne_tune.report import retrieve
-from syne_tune.constants import ST_METRIC_TAG
+from syne_tune.report import retrieve, MetricsLogTailer, MetricsFileTailer
+from syne_tune.constants import (
+    ST_METRIC_TAG,
+    ST_METRICS_FILE_ENV_VAR,
+    ST_METRICS_FILENAME,
+    ST_WORKER_ITER,
+)
 
 
 def test_report_logger():
@@ -24,3 +29,61 @@ def test_report_logger():
         {"train_nll": 1.45, "time": 1.0, "step": 2},
         {"train_nll": 1.2, "time": 2.0, "step": 3},
     ]
+
+
+def test_metrics_log_tailer(tmp_path):
+    log_path = tmp_path / "std.out"
+    tailer = MetricsLogTailer(log_path)
+    # File does not exist yet
+    assert tailer.read() == []
+
+    prefix = "[" + ST_METRIC_TAG + "]: "
+    with open(log_path, "w") as f:
+        f.write("some user logging\n")
+        f.write(prefix + '{"step": 1}\n')
+        # Incomplete line is only parsed once finished
+        f.write(prefix + '{"st')
+    assert tailer.read() == [{"step": 1}]
+    assert tailer.read() == []
+
+    with open(log_path, "a") as f:
+        f.write('ep": 2}\n')
+        f.write("more logging " + prefix + '{"step": 3}\n')
+    assert tailer.read() == [{"step": 2}, {"step": 3}]
+
+    # Handle is reopened at the same offset after closing
+    tailer.close()
+    with open(log_path, "a") as f:
+        f.write(prefix + '{"step": 4}\n')
+    assert tailer.read() == [{"step": 4}]
+    assert tailer.metrics == [{"step": i} for i in range(1, 5)]
+    assert tailer.metrics == retrieve(log_path.read_text().splitlines())
+
+    # Final line without newline is parsed once the writer has finished,
+    # unless it is incomplete
+    with open(log_path, "a") as f:
+        f.write(prefix + '{"step": 5}')
+    assert tailer.read() == []
+    assert tailer.read(final=True) == [{"step": 5}]
+    with open(log_path, "a") as f:
+        f.write("\n" + prefix + '{"st')
+    assert tailer.read(final=True) == []
+    tailer.close()
+
+
+def test_report_to_metrics_file(tmp_path, monkeypatch, capsys):
+    metrics_path = tmp_path / ST_METRICS_FILENAME
+    monkeypatch.setenv(ST_METRICS_FILE_ENV_VAR, str(metrics_path))
+    report = Reporter()
+    report(train_nll=1.45, step=2)
+    report(train_nll=1.2, step=3)
+    # Nothing is printed to stdout
+    assert ST_METRIC_TAG not in capsys.readouterr().out
+
+    tailer = MetricsFileTailer(metrics_path)
+    metrics = tailer.read()
+    assert [(m["train_nll"], m["step"]) for m in metrics] == [(1.45, 2), (1.2, 3)]
+    assert [m[ST_WORKER_ITER] for m in metrics] == [0, 1]
+    report(train_nll=1.0, step=4)
+    assert [m["step"] for m in tailer.read()] == [4]
+    tailer.close()
@@ -1,4 +1,7 @@
+import pandas as pd
+
 from syne_tune.backend.trial_status import Trial, Status
+from syne_tune.constants import ST_WORKER_COST, ST_WORKER_TIME
 from syne_tune.tuning_status import TuningStatus, print_best_metric_found
 
 
@@ -98,3 +101,111 @@ def test_stats_are_not_tracked_for_non_numeric_metrics():
         metric_names[0]: "str",
         metric_names[1]: 20,
     }
+
+
+def test_status_counts_and_aggregates():
+    status = TuningStatus(metric_names=["NLL"])
+    trials = [
+        Trial(trial_id=trial_id, config={"x": trial_id}, creation_time=None)
+        for trial_id in range(4)
+    ]
+    status.update(
+        trial_status_dict={
+            trial.trial_id: (trial, Status.in_progress) for trial in trials
+        },
+        new_results=[
+            (0, {"NLL": 1.0, ST_WORKER_TIME: 2.0, ST_WORKER_COST: 0.5}),
+            (1, {"NLL": 1.0, ST_WORKER_TIME: 3.0}),
+        ],
+    )
+    assert status.num_trials_running == 4
+    assert status.num_trials_finished == 0
+    assert status.user_time == 5.0
+    assert status.cost == 0.5
+    status.update(
+        trial_status_dict={
+            0: (trials[0], Status.completed),
+            1: (trials[1], Status.failed),
+            2: (trials[2], Status.paused),
+        },
+        new_results=[
+            (0, {"NLL": 0.5, ST_WORKER_TIME: 4.0, ST_WORKER_COST: 1.0}),
+            # Worker time is the maximum over results of a trial
+            (1, {"NLL": 0.5, ST_WORKER_TIME: 1.0}),
+        ],
+    )
+    assert status.num_trials_started == 4
+    assert status.num_trials_running == 1
+    assert status.num_trials_completed == 1
+    assert status.num_trials_failed == 1
+    assert status.num_trials_finished == 2
+    assert status.user_time == 7.0
+    assert status.cost == 1.0
+    status.update(
+        trial_status_dict={2: (trials[2], Status.in_progress)}, new_results=[]
+    )
+    status.mark_running_job_as_stopped()
+    assert status.num_trials_running == 0
+    assert status.num_trials_finished == 4
+    assert status.last_trial_status_seen[3] == Status.stopped
+
+
+def test_trial_table_matches_rows():
+    status = TuningStatus(metric_names=["NLL"], max_trials_printed=2)
+    trials = [
+        Trial(trial_id=trial_id, config={"x": trial_id, "y": "a"}, creation_time=None)
+        for trial_id in range(3)
+    ]
+    status.update(
+        trial_status_dict={
+            trial.trial_id: (trial, Status.in_progress) for trial in trials
+        },
+        new_results=[
+            (0, {"NLL": 1, ST_WORKER_TIME: 2.0}),
+            (1, {"NLL": 0.5, "debug": "str"}),
+        ],
+    )
+    status.update(
+        trial_status_dict={1: (trials[1], Status.completed)},
+        new_results=[(1, {"NLL": 0.25})],
+    )
+    expected_rows = [
+        {
+            "trial_id": 0,
+            "status": Status.in_progress,
+            "iter": 1,
+            "x": 0,
+            "y": "a",
+            "NLL": 1,
+            ST_WORKER_TIME: 2.0,
+            "worker-time": 2.0,
+        },
+        {
+            "trial_id": 1,
+            "status": Status.completed,
+            "iter": 2,
+            "x": 1,
+            "y": "a",
+            "NLL": 0.25,
+        },
+        {"trial_id": 2, "status": Status.in_progress, "iter": 0, "x": 2, "y": "a"},
+    ]
+    pd.testing.assert_frame_equal(status.get_dataframe(), pd.DataFrame(expected_rows))
+    # Columns not in the latest row of a trial are cleared
+    assert status.trial_rows[1] == expected_rows[1]
+    assert isinstance(status.trial_rows[0]["x"], int)
+    assert list(status.trial_rows.keys()) == [0, 1, 2]
+    assert status.trial_table.recently_updated_trial_ids(2) == [1, 2]
+    values, present = status.trial_table.get_column("NLL")
+    assert present.tolist() == [True, True, False]
+    assert values[present].tolist() == [1, 0.25]
+    _, present = status.trial_table.get_column("unknown")
+    assert not present.any() and len(present) == 3
+    assert "showing 2 of 3 trials" in str(status)
+
+    status.mark_running_job_as_stopped()
+    assert status.get_dataframe()["status"].tolist() == [
+        Status.stopped,
+        Status.completed,
+        Status.stopped,
+    ]
@@ -0,0 +1,84 @@
+import shutil
+
+import pytest
+
+from syne_tune import StoppingCriterion
+from syne_tune.backend.simulator_backend.simulator_callback import SimulatorCallback
+from syne_tune.blackbox_repository.simulated_tabular_backend import (
+    UserBlackboxBackend,
+)
+from syne_tune.constants import SYNE_TUNE_ENV_FOLDER
+from syne_tune.optimizer.schedulers.asha import AsynchronousSuccessiveHalving
+from syne_tune.tuner import Tuner
+from syne_tune.tuner_callback import TunerCallback
+from examples.training_scripts.height_example.train_height import (
+    height_config_space,
+    TIME_ATTR,
+    METRIC_ATTR,
+    MAX_RESOURCE_ATTR,
+)
+from examples.training_scripts.height_example.blackbox_height import (
+    HeightExampleBlackbox,
+)
+
+
+class CopyTunerPathCallback(TunerCallback):
+    """
+    Copies the tuner path before the final snapshot is written, which is what
+    is left if the experiment is interrupted.
+    """
+
+    def __init__(self, target_path):
+        self.target_path = target_path
+        self.tuner_path = None
+
+    def on_tuning_start(self, tuner):
+        self.tuner_path = tuner.tuner_path
+
+    def on_tuning_end(self):
+        shutil.copytree(self.tuner_path, self.target_path)
+
+
+@pytest.mark.timeout(20)
+def test_load_replays_journal(tmp_path, monkeypatch):
+    monkeypatch.setenv(SYNE_TUNE_ENV_FOLDER, str(tmp_path / "experiments"))
+    max_steps = 9
+    elapsed_time_attr = "elapsed_time"
+    trial_backend = UserBlackboxBackend(
+        blackbox=HeightExampleBlackbox(
+            max_steps=max_steps, sleep_time=0.1, elapsed_time_attr=elapsed_time_attr
+        ),
+        elapsed_time_attr=elapsed_time_attr,
+        max_resource_attr=MAX_RESOURCE_ATTR,
+    )
+    scheduler = AsynchronousSuccessiveHalving(
+        height_config_space(max_steps),
+        metric=METRIC_ATTR,
+        do_minimize=True,
+        time_attr=TIME_ATTR,
+        random_seed=382378624,
+    )
+    copy_path = tmp_path / "interrupted"
+    tuner = Tuner(
+        trial_backend=trial_backend,
+        scheduler=scheduler,
+        n_workers=4,
+        stop_criterion=StoppingCriterion(max_wallclock_time=10),
+        sleep_time=0,
+        callbacks=[SimulatorCallback(), CopyTunerPathCallback(copy_path)],
+        save_journal=True,
+        snapshot_interval=1e6,
+    )
+    tuner.run()
+    # Only the snapshot taken at the start is left, all events are replayed
+    tuner_loaded = Tuner.load(copy_path)
+    status, status_loaded = tuner.tuning_status, tuner_loaded.tuning_status
+    assert status.num_trials_started > 4
+    assert status_loaded.num_trials_started == status.num_trials_started
+    assert (
+        status_loaded.overall_metric_statistics.count
+        == status.overall_metric_statistics.count
+    )
+    assert tuner_loaded.trial_backend.trial_ids == trial_backend.trial_ids
+    assert tuner_loaded.trials_scheduler_stopped == tuner.trials_scheduler_stopped
+    assert len(tuner_loaded.callbacks[0].results) == len(tuner.callbacks[0].results)
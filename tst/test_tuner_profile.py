@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from syne_tune import StoppingCriterion
+from syne_tune.backend.simulator_backend.simulator_callback import SimulatorCallback
+from syne_tune.blackbox_repository.simulated_tabular_backend import (
+    UserBlackboxBackend,
+)
+from syne_tune.constants import SYNE_TUNE_ENV_FOLDER, ST_PROFILE_FILENAME
+from syne_tune.optimizer.schedulers.asha import AsynchronousSuccessiveHalving
+from syne_tune.optimizer.schedulers.utils.simple_profiler import SimpleProfiler
+from syne_tune.tuner import Tuner
+from syne_tune.tuner_logger import TunerLogger
+from examples.training_scripts.height_example.train_height import (
+    height_config_space,
+    TIME_ATTR,
+    METRIC_ATTR,
+    MAX_RESOURCE_ATTR,
+)
+from examples.training_scripts.height_example.blackbox_height import (
+    HeightExampleBlackbox,
+)
+
+
+def test_simple_profiler_summary_and_trace():
+    profiler = SimpleProfiler(record_events=True)
+    for iteration in range(3):
+        profiler.begin_block({"iteration": iteration})
+        for _ in range(2):
+            profiler.start("a")
+            profiler.stop("a")
+        profiler.add("b", 2.0)
+    summary = profiler.summary()
+    assert summary["a"]["num"] == 6
+    assert summary["b"] == {"num": 3, "sum": 6.0, "mean": 2.0, "max": 2.0}
+    trace_events = profiler.chrome_trace()["traceEvents"]
+    # Values recorded by ``add`` are not events
+    assert len(trace_events) == 6
+    assert all(event["name"] == "a" and event["ph"] == "X" for event in trace_events)
+    assert all(event["dur"] >= 0 for event in trace_events)
+
+
+@pytest.mark.timeout(30)
+def test_tuner_profile(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv(SYNE_TUNE_ENV_FOLDER, str(tmp_path))
+    max_steps = 9
+    elapsed_time_attr = "elapsed_time"
+    trial_backend = UserBlackboxBackend(
+        blackbox=HeightExampleBlackbox(
+            max_steps=max_steps, sleep_time=0.1, elapsed_time_attr=elapsed_time_attr
+        ),
+        elapsed_time_attr=elapsed_time_attr,
+        max_resource_attr=MAX_RESOURCE_ATTR,
+    )
+    scheduler = AsynchronousSuccessiveHalving(
+        height_config_space(max_steps),
+        metric=METRIC_ATTR,
+        do_minimize=True,
+        time_attr=TIME_ATTR,
+    )
+    tuner = Tuner(
+        trial_backend=trial_backend,
+        scheduler=scheduler,
+        n_workers=4,
+        stop_criterion=StoppingCriterion(max_num_trials_finished=20),
+        sleep_time=0,
+        callbacks=[SimulatorCallback()],
+        output_logger=TunerLogger(use_colors=False, use_emojis=False),
+        profile=True,
+    )
+    tuner.run()
+
+    with open(tuner.tuner_path / ST_PROFILE_FILENAME, "r") as f:
+        profile = json.load(f)
+    summary = profile["otherData"]["summary"]
+    for tag in [
+        "iteration",
+        "fetch_status_results",
+        "scheduler:on_trial_result",
+        "scheduler:suggest",
+        "callback:SimulatorCallback",
+        "save",
+        "sleep",
+    ]:
+        assert summary[tag]["num"] > 0, tag
+    assert summary["iteration"]["num"] == profile["otherData"]["num_iterations"]
+    assert {event["name"] for event in profile["traceEvents"]} == {
+        tag for tag in summary.keys() if tag != "idle_worker_seconds"
+    }
+    assert "Tuning Loop Profile" in capsys.readouterr().out
+
+    # Measurements are not serialized with the tuner
+    tuner_loaded = Tuner.load(tuner.tuner_path)
+    assert tuner_loaded.profile
+    assert tuner_loaded._profiler is None
@@ -0,0 +1,45 @@
+import shutil
+
+import pytest
+
+from syne_tune.backend.checkpoint_clone import clone_directory
+
+
+def _write_checkpoint(path):
+    (path / "sub").mkdir(parents=True)
+    (path / "model.bin").write_bytes(b"0123456789" * 1000)
+    (path / "sub" / "state.json").write_text('{"epoch": 3}')
+    (path / "sub" / "optimizer.bin").write_bytes(b"abc" * 100)
+
+
+def _read_checkpoint(path):
+    return {
+        str(file.relative_to(path)): file.read_bytes()
+        for file in sorted(path.rglob("*"))
+        if file.is_file()
+    }
+
+
+@pytest.mark.parametrize("mode", ["copy", "reflink", "hardlink"])
+def test_clone_directory(tmp_path, mode):
+    src_path = tmp_path / "src"
+    tgt_path = tmp_path / "tgt"
+    _write_checkpoint(src_path)
+    expected = _read_checkpoint(src_path)
+    clone_directory(src_path, tgt_path, mode=mode)
+    assert _read_checkpoint(tgt_path) == expected
+    if mode == "hardlink":
+        assert (tgt_path / "model.bin").stat().st_ino == (
+            src_path / "model.bin"
+        ).stat().st_ino
+    # Source and clone can be deleted independently
+    shutil.rmtree(src_path)
+    assert _read_checkpoint(tgt_path) == expected
+    # Target must not exist
+    with pytest.raises(FileExistsError):
+        clone_directory(tgt_path, tgt_path, mode=mode)
+
+
+def test_clone_directory_missing_source(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        clone_directory(tmp_path / "src", tmp_path / "tgt")
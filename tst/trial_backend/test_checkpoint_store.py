@@ -0,0 +1,134 @@
+from pathlib import Path
+
+import pytest
+
+from syne_tune.backend import local_backend
+from syne_tune.backend.checkpoint_store import CheckpointStore
+from syne_tune.backend.trial_status import Status
+from syne_tune.constants import ST_CHECKPOINT_DIR
+from tst.util_test import temporary_local_backend
+
+
+def _write_files(path, files):
+    for name, content in files.items():
+        (path / name).parent.mkdir(parents=True, exist_ok=True)
+        (path / name).write_bytes(content)
+
+
+def _read_files(path):
+    return {
+        file.relative_to(path).as_posix(): file.read_bytes()
+        for file in path.rglob("*")
+        if file.is_file()
+    }
+
+
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_checkpoint_store(tmp_path, compression):
+    store = CheckpointStore(tmp_path / "store", compression=compression, chunk_size=64)
+    files = {
+        "model.bin": bytes(range(256)) * 4,
+        "sub/state.json": b'{"epoch": 3}',
+    }
+    _write_files(tmp_path / "ckpt0", files)
+    store.put(0, tmp_path / "ckpt0")
+    usage = store.disk_usage()
+    # Identical chunks are stored once
+    if compression is None:
+        assert usage == 256 + len(files["sub/state.json"])
+    # Clones and identical checkpoints do not use more space
+    store.clone(0, 1)
+    _write_files(tmp_path / "ckpt2", files)
+    store.put(2, tmp_path / "ckpt2")
+    assert store.disk_usage() == usage
+    for key in [0, 1, 2]:
+        store.materialize(key, tmp_path / f"out{key}")
+        assert _read_files(tmp_path / f"out{key}") == files
+    # Data is removed once no checkpoint references it anymore
+    store.delete(0)
+    store.delete(2)
+    assert store.disk_usage() == usage
+    store.put(1, tmp_path / "out1" / "sub")
+    assert 0 < store.disk_usage() < usage
+    store.delete(1)
+    assert store.disk_usage() == 0
+    assert 1 not in store
+
+
+_CHECKPOINT_SCRIPT = f"""
+import argparse
+import time
+from pathlib import Path
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--{ST_CHECKPOINT_DIR}", type=str)
+parser.add_argument("--sleep", type=float)
+args, _ = parser.parse_known_args()
+checkpoint_path = Path(getattr(args, "{ST_CHECKPOINT_DIR}"))
+checkpoint_path.mkdir(parents=True, exist_ok=True)
+file = checkpoint_path / "checkpoint.txt"
+content = file.read_text() if file.exists() else ""
+file.write_text(content + "x")
+time.sleep(args.sleep)
+"""
+
+
+@pytest.mark.timeout(20)
+def test_local_backend_checkpoint_store(tmp_path):
+    path_script = tmp_path / "main_checkpoint.py"
+    path_script.write_text(_CHECKPOINT_SCRIPT)
+    backend = temporary_local_backend(
+        entry_point=str(path_script),
+        use_checkpoint_store=True,
+        checkpoint_store_compression="zlib",
+    )
+    backend.set_path(results_root=str(tmp_path / "results"))
+    checkpoint_file = Path("checkpoints") / "checkpoint.txt"
+    trial = backend.start_trial(config={"sleep": 60})
+    trial_id = trial.trial_id
+    while not (backend.trial_path(trial_id) / checkpoint_file).exists():
+        backend.wait_for_events(timeout=0.05)
+    # Pausing moves the checkpoint into the store
+    backend.pause_trial(trial_id)
+    store = backend.checkpoint_store()
+    assert trial_id in store
+    assert not backend.checkpoint_trial_path(trial_id).exists()
+    # Cloning a paused trial only clones the entry in the store
+    trial2 = backend.start_trial(config={"sleep": 0}, checkpoint_trial_id=trial_id)
+    # Resuming writes the checkpoint back
+    backend.resume_trial(trial_id)
+    assert trial_id not in store
+    for tid in [trial_id, trial2.trial_id]:
+        path = backend.trial_path(tid) / checkpoint_file
+        while not (path.exists() and path.read_text() == "xx"):
+            backend.wait_for_events(timeout=0.05)
+    backend.stop_trial(trial_id)
+    backend.delete_checkpoint(trial_id)
+    assert not backend.checkpoint_trial_path(trial_id).exists()
+    trial_status_dict, _ = backend.fetch_status_results([trial2.trial_id])
+    assert trial_status_dict[trial2.trial_id][1] in [
+        Status.in_progress,
+        Status.completed,
+    ]
+
+
+@pytest.mark.timeout(20)
+def test_checkpoint_not_stored_if_job_does_not_exit(tmp_path, monkeypatch):
+    path_script = tmp_path / "main_checkpoint.py"
+    path_script.write_text(_CHECKPOINT_SCRIPT)
+    backend = temporary_local_backend(
+        entry_point=str(path_script), use_checkpoint_store=True
+    )
+    backend.set_path(results_root=str(tmp_path / "results"))
+    checkpoint_file = Path("checkpoints") / "checkpoint.txt"
+    trial_id = backend.start_trial(config={"sleep": 60}).trial_id
+    while not (backend.trial_path(trial_id) / checkpoint_file).exists():
+        backend.wait_for_events(timeout=0.05)
+    # Job is not killed, so it could still write to its checkpoint
+    kill_process = backend._kill_process
+    monkeypatch.setattr(backend, "_kill_process", lambda trial_id: None)
+    monkeypatch.setattr(local_backend, "STORE_CHECKPOINT_TIMEOUT", 0.1)
+    backend.pause_trial(trial_id)
+    assert trial_id not in backend.checkpoint_store()
+    assert (backend.trial_path(trial_id) / checkpoint_file).exists()
+    kill_process(trial_id)
@@ -1,7 +1,12 @@
 import logging
+import time
 from pathlib import Path
 from typing import Any
 
+import pytest
+
+from syne_tune.backend.trial_status import Status
+from syne_tune.constants import ST_METRIC_TAG, ST_WORKER_TIMESTAMP
 from tst.util_test import temporary_local_backend
 
 
@@ -132,3 +137,205 @@ def test_multi_gpu_allocation(caplog):
         assert gpus == [2, 3] or gpus == [6, 7]
         _assert_cuda_visible_devices(env, gpus_to_use, gpus)
         assert all(backend.gpu_times_assigned[gpu] == 2 for gpu in gpus)
+
+
+_WAIT_SCRIPT = """
+import sys
+import time
+
+time.sleep(0.2)
+print('[{tag}]: {{"step": 1, "{timestamp}": 0}}')
+sys.stdout.flush()
+time.sleep(float(sys.argv[sys.argv.index("--sleep") + 1]))
+"""
+
+
+@pytest.mark.timeout(5)
+def test_wait_for_events(tmp_path):
+    path_script = tmp_path / "main_wait.py"
+    path_script.write_text(
+        _WAIT_SCRIPT.format(tag=ST_METRIC_TAG, timestamp=ST_WORKER_TIMESTAMP)
+    )
+    backend = temporary_local_backend(entry_point=str(path_script))
+    backend.set_path(results_root=str(tmp_path))
+    # No trials running: Waits for the full timeout
+    start_time = time.perf_counter()
+    assert not backend.wait_for_events(timeout=0.1)
+    assert time.perf_counter() - start_time >= 0.1
+
+    trial = backend.start_trial(config={"sleep": 0.3})
+    # Wakes up once the result is reported, well before the timeout
+    start_time = time.perf_counter()
+    assert backend.wait_for_events(timeout=3)
+    assert time.perf_counter() - start_time < 2
+    trial_statuses, new_metrics = get_status_metrics(backend, trial.trial_id)
+    assert trial_statuses == {trial.trial_id: Status.in_progress}
+    assert [result["step"] for _, result in new_metrics] == [1]
+    # Wakes up once the job exits
+    assert backend.wait_for_events(timeout=3)
+    trial_statuses, new_metrics = get_status_metrics(backend, trial.trial_id)
+    assert trial_statuses == {trial.trial_id: Status.completed}
+    assert new_metrics == []
+    assert not backend.wait_for_events(timeout=0.05)
+
+
+_NO_NEWLINE_SCRIPT = """
+import sys
+import time
+
+print('[{tag}]: {{"step": 1, "{timestamp}": ' + str(time.time()) + '}}')
+sys.stdout.write('[{tag}]: {{"step": 2, "{timestamp}": ' + str(time.time()) + '}}')
+"""
+
+
+@pytest.mark.timeout(5)
+def test_final_report_without_newline(tmp_path):
+    path_script = tmp_path / "main_no_newline.py"
+    path_script.write_text(
+        _NO_NEWLINE_SCRIPT.format(tag=ST_METRIC_TAG, timestamp=ST_WORKER_TIMESTAMP)
+    )
+    backend = temporary_local_backend(entry_point=str(path_script))
+    backend.set_path(results_root=str(tmp_path))
+    trial = backend.start_trial(config={})
+    backend.trial_subprocess[trial.trial_id].wait()
+    trial_statuses, new_metrics = get_status_metrics(backend, trial.trial_id)
+    assert trial_statuses == {trial.trial_id: Status.completed}
+    assert [result["step"] for _, result in new_metrics] == [1, 2]
+
+
+_COUNTER_SCRIPT = """
+import sys
+import time
+
+for step in range(1, 1000):
+    print('[{tag}]: {{"step": ' + str(step) + ', "{timestamp}": ' + str(time.time()) + '}}')
+    sys.stdout.flush()
+    time.sleep(0.02)
+"""
+
+
+@pytest.mark.timeout(10)
+def test_pause_mode_suspend(tmp_path):
+    import psutil
+
+    path_script = tmp_path / "main_counter.py"
+    path_script.write_text(
+        _COUNTER_SCRIPT.format(tag=ST_METRIC_TAG, timestamp=ST_WORKER_TIMESTAMP)
+    )
+    backend = temporary_local_backend(
+        entry_point=str(path_script), pause_mode="suspend", max_suspended_trials=1
+    )
+    backend.set_path(results_root=str(tmp_path))
+    trial_ids = [backend.start_trial(config={"x": x}).trial_id for x in range(2)]
+    assert backend.wait_for_events(timeout=3)
+    _, new_metrics = get_status_metrics(backend, trial_ids[1])
+    pids = [backend.trial_subprocess[trial_id].pid for trial_id in trial_ids]
+    for trial_id in trial_ids:
+        backend.pause_trial(trial_id)
+    # First job was killed when the second got suspended
+    assert list(backend._suspended_trials.keys()) == [trial_ids[1]]
+    assert backend.suspended_memory() > 0
+    # Signals are delivered asynchronously
+    while psutil.Process(pids[1]).status() != psutil.STATUS_STOPPED:
+        time.sleep(0.01)
+    backend.trial_subprocess[trial_ids[0]].wait()
+    trial_statuses, _ = get_status_metrics(backend, trial_ids[1])
+    assert trial_statuses == {trial_ids[1]: Status.paused}
+    assert backend.busy_trial_ids() == []
+
+    # Resuming continues the same job, which does not start from scratch
+    backend.resume_trial(trial_ids[1])
+    assert backend.trial_subprocess[trial_ids[1]].pid == pids[1]
+    assert backend.busy_trial_ids() == [(trial_ids[1], Status.in_progress)]
+    time.sleep(0.2)
+    trial_statuses, new_metrics = get_status_metrics(backend, trial_ids[1])
+    assert trial_statuses == {trial_ids[1]: Status.in_progress}
+    steps = [result["step"] for _, result in new_metrics]
+    assert len(steps) > 0 and steps == list(range(steps[0], steps[0] + len(steps)))
+    assert steps[0] > 1
+
+    # Resuming with a different configuration starts a new job
+    backend.pause_trial(trial_ids[1])
+    backend.resume_trial(trial_ids[1], new_config={"x": 5})
+    assert backend.trial_subprocess[trial_ids[1]].pid != pids[1]
+    assert not psutil.pid_exists(pids[1]) or (
+        psutil.Process(pids[1]).status() == psutil.STATUS_ZOMBIE
+    )
+    backend.stop_all()
+
+
+@pytest.mark.timeout(10)
+def test_pause_mode_suspend_keeps_gpus(tmp_path):
+    path_script = tmp_path / "main_counter.py"
+    path_script.write_text(
+        _COUNTER_SCRIPT.format(tag=ST_METRIC_TAG, timestamp=ST_WORKER_TIMESTAMP)
+    )
+    backend = temporary_local_backend(
+        entry_point=str(path_script), pause_mode="suspend"
+    )
+    backend.set_path(results_root=str(tmp_path))
+    backend._prepare_for_schedule(num_gpus=2)
+    trial_ids = [backend.start_trial(config={"x": x}).trial_id for x in range(2)]
+    assert [backend.trial_gpu[trial_id] for trial_id in trial_ids] == [[0], [1]]
+    backend.pause_trial(trial_ids[0])
+    backend.stop_trial(trial_ids[1])
+    trial_statuses, _ = get_status_metrics(backend, trial_ids[0])
+    assert trial_statuses == {trial_ids[0]: Status.paused}
+    assert backend.trial_gpu[trial_ids[0]] == [0]
+    # New trial is not scheduled on the GPU of the suspended job
+    trial_id = backend.start_trial(config={"x": 2}).trial_id
+    assert backend.trial_gpu[trial_id] == [1]
+    backend.resume_trial(trial_ids[0])
+    assert backend.trial_gpu[trial_ids[0]] == [0]
+    backend.stop_all()
+
+
+def test_cpu_allocation(caplog):
+    path_script = Path(__file__).parent / "main_checkpoint.py"
+    backend = temporary_local_backend(
+        entry_point=str(path_script), cpus_per_trial=2, memory_per_trial=1
+    )
+    # Two NUMA nodes with 3 and 4 cores
+    backend.cpu_numa_nodes = [[0, 1, 2], [3, 4, 5, 6]]
+    assert backend.max_concurrent_trials() == 3
+    env = dict()
+    backend._allocate_cpus(trial_id=0, env=env)
+    # Node with least free cores which fit is preferred
+    assert backend.trial_cpus[0] == [0, 1]
+    assert env["OMP_NUM_THREADS"] == "2" and env["MKL_NUM_THREADS"] == "2"
+    backend._allocate_cpus(trial_id=1, env=env)
+    assert backend.trial_cpus[1] == [3, 4]
+    backend._allocate_cpus(trial_id=2, env=env)
+    assert backend.trial_cpus[2] == [5, 6]
+    # No node has two free cores
+    backend._deallocate_cpus(trial_id=1)
+    backend._allocate_cpus(trial_id=3, env=env)
+    assert backend.trial_cpus[3] == [3, 4]
+    assert "Not enough free CPU cores" not in caplog.text
+    backend._allocate_cpus(trial_id=4, env=env)
+    assert backend.trial_cpus[4][0] == 2
+    assert len(backend.trial_cpus[4]) == 2
+    assert "Not enough free CPU cores" in caplog.text
+    # Memory is limiting
+    backend.memory_per_trial = backend._total_memory / 2
+    assert backend.max_concurrent_trials() == 2
+
+
+@pytest.mark.timeout(5)
+def test_cpu_pinning(tmp_path):
+    import psutil
+
+    path_script = tmp_path / "main_wait.py"
+    path_script.write_text(
+        _WAIT_SCRIPT.format(tag=ST_METRIC_TAG, timestamp=ST_WORKER_TIMESTAMP)
+    )
+    backend = temporary_local_backend(entry_point=str(path_script), cpus_per_trial=1)
+    backend.set_path(results_root=str(tmp_path))
+    trial = backend.start_trial(config={"sleep": 0.5})
+    cpus = backend.trial_cpus[trial.trial_id]
+    assert len(cpus) == 1
+    if hasattr(psutil.Process, "cpu_affinity"):
+        pid = backend.trial_subprocess[trial.trial_id].pid
+        assert psutil.Process(pid).cpu_affinity() == cpus
+    backend.stop_trial(trial.trial_id)
+    assert trial.trial_id not in backend.trial_cpus
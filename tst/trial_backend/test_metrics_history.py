@@ -0,0 +1,34 @@
+import numpy as np
+
+from syne_tune.backend.metrics_history import MetricsHistory
+from syne_tune.backend.trial_backend import TrialBackend
+
+
+def test_metrics_history(tmp_path):
+    path = tmp_path / "history" / "0.ndjson"
+    history = MetricsHistory(path, max_in_memory=4)
+    metrics = [
+        {"epoch": epoch, "loss": np.float64(1 / epoch)} for epoch in range(1, 11)
+    ]
+    history.append(metrics[0])
+    history.extend(metrics[1:5])
+    for metric in metrics[5:]:
+        history.append(metric)
+    assert len(history) == 10
+    assert len(history._in_memory) <= 4
+    assert path.exists()
+    assert list(history) == metrics
+    assert history[0] == metrics[0]
+    assert history[-1] == metrics[-1]
+    assert history[8:] == metrics[8:]
+    assert history[2:5] == metrics[2:5]
+    assert history[::3] == metrics[::3]
+
+
+def test_trial_backend_metrics_spill(tmp_path):
+    backend = TrialBackend()
+    assert backend._new_metrics_list(trial_id=0) == []
+    backend.set_metrics_spill(path=tmp_path, max_metrics_in_memory=2)
+    metrics = backend._new_metrics_list(trial_id=3)
+    assert isinstance(metrics, MetricsHistory)
+    assert metrics.path == tmp_path / "3.ndjson"
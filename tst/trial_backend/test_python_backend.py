@@ -20,13 +20,16 @@ def f(x):
 
 
 @pytest.mark.timeout(5)
-def test_python_backend():
+@pytest.mark.parametrize("execution_mode", ["subprocess", "forkserver"])
+def test_python_backend(execution_mode):
     with tempfile.TemporaryDirectory() as local_path:
         import logging
 
         root = logging.getLogger()
         root.setLevel(logging.INFO)
-        backend = PythonBackend(f, config_space={"x": randint(0, 10)})
+        backend = PythonBackend(
+            f, config_space={"x": randint(0, 10)}, execution_mode=execution_mode
+        )
         backend.set_path(str(local_path))
         backend.start_trial({"x": 2})
         backend.start_trial({"x": 3})
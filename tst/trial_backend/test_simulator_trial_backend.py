@@ -1,9 +1,15 @@
+import os
 from typing import Any
 import math
+from unittest.mock import Mock
+
+import numpy as np
 import pytest
 
 from syne_tune.backend import LocalBackend
+from syne_tune.backend.trial_status import Status, Trial, TrialResult
 from syne_tune.backend.simulator_backend.simulator_backend import (
+    CallableSimulatorBackend,
     SimulatorBackend,
     SimulatorConfig,
 )
@@ -17,7 +23,13 @@ from syne_tune.backend.simulator_backend.simulator_callback import SimulatorCall
 from syne_tune.results_callback import StoreResultsCallback
 from syne_tune import StoppingCriterion
 from syne_tune import Tuner
-from syne_tune.constants import ST_DECISION, ST_TRIAL_ID
+from syne_tune.config_space import randint
+from syne_tune.constants import (
+    SYNE_TUNE_ENV_FOLDER,
+    ST_DECISION,
+    ST_TRIAL_ID,
+    ST_TUNER_TIME,
+)
 from syne_tune.optimizer.schedulers.single_fidelity_scheduler import (
     SingleFidelityScheduler,
 )
@@ -259,3 +271,188 @@ def test_simulator_state():
             (OnTrialResultEvent, 1, 3, 3.5),
             (CompleteEvent, 1, "completed", 4),
         ]
+
+
+def _height_curve(config: dict[str, Any]) -> list[dict[str, Any]]:
+    width, height = config["width"], config["height"]
+    if height > 90:
+        raise ValueError("height too large")
+    return [
+        {
+            "epoch": epoch,
+            "mean_loss": 100 / (10 + width * (epoch - 1)) + 0.1 * height,
+            "elapsed_time": 0.1 * epoch,
+        }
+        for epoch in range(1, config["steps"] + 1)
+    ]
+
+
+@pytest.mark.timeout(60)
+@pytest.mark.parametrize("use_process_pool", [False, True])
+def test_callable_simulator_backend(tmp_path, monkeypatch, use_process_pool):
+    monkeypatch.setenv(SYNE_TUNE_ENV_FOLDER, str(tmp_path))
+    max_steps = 9
+    config_space = {
+        "steps": max_steps,
+        "width": randint(0, 20),
+        "height": randint(-100, 100),
+    }
+    trial_backend = CallableSimulatorBackend(
+        train_fn=_height_curve,
+        elapsed_time_attr="elapsed_time",
+        use_process_pool=use_process_pool,
+    )
+    scheduler = AsynchronousSuccessiveHalving(
+        config_space,
+        metric="mean_loss",
+        do_minimize=True,
+        time_attr="epoch",
+        max_t=max_steps,
+        random_seed=31415927,
+        searcher_kwargs={"points_to_evaluate": [{"width": 10, "height": 95}]},
+    )
+    tuner = Tuner(
+        trial_backend=trial_backend,
+        scheduler=scheduler,
+        n_workers=4,
+        stop_criterion=StoppingCriterion(max_num_trials_finished=10),
+        sleep_time=0,
+        callbacks=[SimulatorCallback()],
+        max_failures=10,
+    )
+    tuner.run()
+
+    # Trial with exception in ``train_fn`` fails without results
+    assert trial_backend._trial_dict[0].status == Status.failed
+    assert len(trial_backend._trial_dict[0].metrics) == 0
+    max_tuner_time = 0
+    for trial in trial_backend._trial_dict.values():
+        if not isinstance(trial, TrialResult) or trial.status == Status.failed:
+            continue
+        expected = _height_curve(trial.config)
+        for result in trial.metrics:
+            epoch = result["epoch"]
+            assert result["mean_loss"] == pytest.approx(
+                expected[epoch - 1]["mean_loss"]
+            )
+            max_tuner_time = max(max_tuner_time, result[ST_TUNER_TIME])
+    # Simulated time is determined by ``elapsed_time``, not by the time spent
+    # in ``train_fn``
+    assert max_tuner_time >= 0.1 * max_steps
+    assert trial_backend._process_pool is None
+
+
+_SIMULATOR_SCRIPT = """
+from argparse import ArgumentParser
+
+from syne_tune import Reporter
+
+parser = ArgumentParser()
+parser.add_argument("--steps", type=int)
+parser.add_argument("--width", type=int)
+args, _ = parser.parse_known_args()
+report = Reporter()
+for epoch in range(1, args.steps + 1):
+    report(epoch=epoch, mean_loss=args.width / epoch, elapsed_time=0.1 * epoch)
+"""
+
+
+@pytest.mark.timeout(60)
+@pytest.mark.parametrize("max_results_in_memory", [None, 2])
+def test_simulator_backend_script(tmp_path, monkeypatch, max_results_in_memory):
+    monkeypatch.setenv(SYNE_TUNE_ENV_FOLDER, str(tmp_path))
+    path_script = tmp_path / "main_simulated.py"
+    path_script.write_text(_SIMULATOR_SCRIPT)
+    max_steps = 9
+    config_space = {"steps": max_steps, "width": randint(1, 20)}
+    trial_backend = SimulatorBackend(
+        entry_point=str(path_script), elapsed_time_attr="elapsed_time"
+    )
+    scheduler = SingleFidelityScheduler(
+        config_space, metrics=["mean_loss"], do_minimize=True, random_seed=31415927
+    )
+    tuner = Tuner(
+        trial_backend=trial_backend,
+        scheduler=scheduler,
+        n_workers=2,
+        stop_criterion=StoppingCriterion(max_num_trials_finished=4),
+        sleep_time=0,
+        callbacks=[SimulatorCallback()],
+        max_results_in_memory=max_results_in_memory,
+    )
+    tuner.run()
+
+    num_completed = 0
+    for trial in trial_backend._trial_dict.values():
+        if not isinstance(trial, TrialResult):
+            continue
+        assert trial.status != Status.failed
+        if trial.status == Status.completed:
+            num_completed += 1
+            # Spilled results are not mixed up with those of other lists
+            assert [result["epoch"] for result in trial.metrics] == list(
+                range(1, max_steps + 1)
+            )
+            assert all(ST_TUNER_TIME in result for result in trial.metrics)
+    assert num_completed >= 4
+
+
+def test_simulator_state_lazy_removal():
+    random_state = np.random.RandomState(0)
+    state = SimulatorState()
+    # Reference: Events are removed eagerly
+    reference = []
+    time_now = 0
+    for it in range(2000):
+        trial_id = int(random_state.randint(0, 20))
+        action = random_state.rand()
+        if action < 0.6:
+            event_time = time_now + random_state.rand()
+            state.push(StartEvent(trial_id=trial_id), event_time=event_time)
+            reference.append((event_time, it, trial_id))
+        elif action < 0.8:
+            state.remove_events(trial_id)
+            reference = [elem for elem in reference if elem[2] != trial_id]
+        else:
+            time_now += 0.1
+            reference.sort()
+            while reference and reference[0][0] <= time_now:
+                event_time, _, trial_id = reference.pop(0)
+                entry = state.next_until(time_now)
+                assert entry is not None
+                assert entry[0] == event_time
+                assert entry[1].trial_id == trial_id
+            assert state.next_until(time_now) is None
+        # Removed events are compacted
+        assert len(state.event_heap) <= 2 * len(reference) + 1
+
+
+def _exit_if_too_high(config: dict[str, Any]) -> list[dict[str, Any]]:
+    if config["height"] > 90:
+        os._exit(1)  # Kills the worker process
+    return _height_curve(config)
+
+
+def test_callable_simulator_backend_broken_process_pool():
+    trial_backend = CallableSimulatorBackend(
+        train_fn=_exit_if_too_high,
+        elapsed_time_attr="elapsed_time",
+        use_process_pool=True,
+    )
+    for trial_id, height in enumerate([95, 10]):
+        trial_backend._trial_dict[trial_id] = Trial(
+            trial_id=trial_id,
+            config={"steps": 3, "width": 10, "height": height},
+            creation_time=None,
+        )
+    process_pool = trial_backend._executor()
+    process_pool.shutdown = Mock(wraps=process_pool.shutdown)
+    status, results = trial_backend._run_job_and_collect_results(0)
+    assert status == Status.failed and results == []
+    # Broken pool is shut down and replaced
+    process_pool.shutdown.assert_called_once_with(wait=False)
+    assert trial_backend._process_pool is None
+    # New worker process is used for the next trial
+    status, results = trial_backend._run_job_and_collect_results(1)
+    assert status == Status.completed and len(results) == 3
+    trial_backend.stop_all()
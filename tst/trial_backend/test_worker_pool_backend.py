@@ -0,0 +1,79 @@
+import os
+import subprocess
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import dill
+import pytest
+
+from syne_tune.backend.trial_status import Status
+from syne_tune.backend.worker_pool_backend import ForkedProcess, WorkerPoolBackend
+from tst.util_test import wait_until_all_trials_completed
+
+
+@pytest.mark.timeout(20)
+def test_worker_pool_backend_checkpoint(tmp_path):
+    path_script = Path(__file__).parent / "main_checkpoint.py"
+    backend = WorkerPoolBackend(entry_point=str(path_script))
+    backend.set_path(results_root=str(tmp_path))
+
+    trial = backend.start_trial(config={"name": "name1"})
+    wait_until_all_trials_completed(backend)
+    trial_status_dict, results = backend.fetch_status_results([trial.trial_id])
+    assert trial_status_dict[trial.trial_id][1] == Status.completed
+    assert [result["checkpoint_content"] for _, result in results] == ["nothing"]
+    # Job ran in a forked process, writing to the trial's output files
+    assert (tmp_path / str(trial.trial_id) / "std.out").exists()
+
+    # Starting from a checkpoint and resuming work as for ``LocalBackend``
+    trial2 = backend.start_trial(
+        config={"name": "name2"}, checkpoint_trial_id=trial.trial_id
+    )
+    wait_until_all_trials_completed(backend)
+    _, results = backend.fetch_status_results([trial2.trial_id])
+    assert [result["checkpoint_content"] for _, result in results] == ["name1"]
+
+
+@pytest.mark.timeout(20)
+def test_worker_pool_backend_stop(tmp_path):
+    path_script = tmp_path / "main_sleep.py"
+    path_script.write_text("import time\ntime.sleep(60)\n")
+    backend = WorkerPoolBackend(entry_point=str(path_script))
+    backend.set_path(results_root=str(tmp_path))
+
+    trial = backend.start_trial(config={"x": 1})
+    assert backend.busy_trial_ids() == [(trial.trial_id, Status.in_progress)]
+    backend.stop_trial(trial.trial_id)
+    assert backend.busy_trial_ids() == []
+    # Job has been killed
+    process = backend.trial_subprocess[trial.trial_id]
+    while process.poll() is None:
+        time.sleep(0.05)
+    trial_status_dict, _ = backend.fetch_status_results([trial.trial_id])
+    assert trial_status_dict[trial.trial_id][1] == Status.stopped
+
+
+@pytest.mark.timeout(20)
+@pytest.mark.skipif(
+    not hasattr(os, "sched_getaffinity"), reason="CPU pinning only on Linux"
+)
+def test_worker_pool_backend_cpu_pinning(tmp_path):
+    path_script = tmp_path / "main_affinity.py"
+    path_script.write_text("import os\nprint(sorted(os.sched_getaffinity(0)))\n")
+    backend = WorkerPoolBackend(entry_point=str(path_script), cpus_per_trial=1)
+    backend.set_path(results_root=str(tmp_path))
+
+    trial = backend.start_trial(config={"x": 1})
+    cpus = backend.trial_cpus[trial.trial_id]
+    wait_until_all_trials_completed(backend)
+    # Job was restricted to its cores from the start
+    assert backend.stdout(trial.trial_id) == [f"{cpus}\n"]
+
+
+def test_forked_process_wait_after_unpickling():
+    process = SimpleNamespace(pid=12345, name="trial-0", exitcode=None)
+    forked_process = dill.loads(dill.dumps(ForkedProcess(process)))
+    assert forked_process.poll() is None
+    with pytest.raises(subprocess.TimeoutExpired, match="trial-0"):
+        forked_process.wait(timeout=0)